@@ -1 +1 @@
-from .avion_manager import AvionManager
\ No newline at end of file
+from .avion_manager import AvionManager, FicheAvion
\ No newline at end of file
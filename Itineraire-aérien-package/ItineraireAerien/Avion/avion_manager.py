@@ -1,11 +1,40 @@
-import pandas as pd  # Bibliothèque pour la manipulation de données sous forme de tableaux (DataFrames)
+import bisect  # Recherche dichotomique dans les index triés par vent admissible
+import csv  # Lecture du fichier des avions sans dépendre de pandas
+from typing import NamedTuple  # Fiches d'avion immuables et légères
+
+
+class FicheAvion(NamedTuple):
+    """
+    Caractéristiques d'un avion, telles que lues dans le fichier CSV.
+
+    :param nom: Nom du modèle.
+    :param type: Type d'avion (ex: "hélice", "jet", "turbopropulseur").
+    :param vitesse_vent_admissible: Vent maximal admissible, en km/h.
+    :param vitesse_de_avion: Vitesse propre de l'avion, en km/h.
+    """
+    nom: str
+    type: str
+    vitesse_vent_admissible: float
+    vitesse_de_avion: float
+
+
+def _nombre(texte):
+    """
+    Convertit un champ numérique du CSV (entier si la valeur est entière).
+    """
+    valeur = float(texte)
+    return int(valeur) if valeur.is_integer() else valeur
 
 
 class AvionManager:
     """
     Classe permettant de gérer la sélection d'avions à partir d'un fichier CSV.
 
-    Cette classe propose deux modes de sélection :
+    Les avions sont chargés une fois sous forme de fiches immuables (:class:`FicheAvion`), et
+    indexés par type et par vent admissible : :meth:`rechercher` répond aux requêtes par plage
+    de vent par recherche dichotomique. Ces requêtes sont utilisées par l'interface web, le
+    calcul en lot et les deux modes de sélection interactifs :
+
     - Mode 1 : Choix libre parmi tous les avions disponibles.
     - Mode 2 : Filtrage par plage de vent admissible.
 
@@ -14,54 +43,143 @@ class AvionManager:
     """
     def __init__(self, fichier_csv="Data/avions.csv"):
         """
-        Initialise l'instance de la classe et charge les données CSV dans un DataFrame.
+        Initialise l'instance de la classe, charge les avions et construit les index.
 
         :param fichier_csv: Chemin vers le fichier CSV contenant les avions.
         :type fichier_csv: str
         """
         self.fichier_csv = fichier_csv
-        self.df = pd.read_csv(fichier_csv)  # Chargement du fichier CSV dans un DataFrame
+        with open(fichier_csv, newline="", encoding="utf-8") as f:
+            self._avions = tuple(
+                FicheAvion(ligne["nom"], ligne["type"], _nombre(ligne["vitesse_vent_admissible"]),
+                           _nombre(ligne["vitesse_de_avion"]))
+                for ligne in csv.DictReader(f))
+
+        self._par_nom = {}  # Nom -> fiche (le premier avion du fichier en cas de doublon)
+        for avion in self._avions:
+            self._par_nom.setdefault(avion.nom, avion)
+        self._types = tuple(dict.fromkeys(avion.type for avion in self._avions))  # Ordre du fichier
+        self._rangs = {}  # Fiche -> position dans le fichier (ordre des résultats de recherche)
+        for rang, avion in enumerate(self._avions):
+            self._rangs.setdefault(avion, rang)
+
+        # Type (None : tous types) -> (vents admissibles triés, fiches dans le même ordre) ;
+        # le tri est stable : à vent égal, l'ordre du fichier est conservé
+        self._index = {}
+        for type_avion in (None,) + self._types:
+            fiches = sorted((avion for avion in self._avions if type_avion in (None, avion.type)),
+                            key=lambda avion: avion.vitesse_vent_admissible)
+            self._index[type_avion] = ([avion.vitesse_vent_admissible for avion in fiches], tuple(fiches))
+        self._df = None
+
+    @property
+    def df(self):
+        """
+        Avions sous forme de DataFrame pandas (construit au premier accès).
 
-    def choix_avion_mode_1(self):
+        :rtype: pandas.DataFrame
         """
-        Mode 1 : Permet de choisir un avion librement sans contrainte météo.
+        if self._df is None:
+            import pandas as pd  # Importé seulement si le DataFrame est demandé
+            self._df = pd.DataFrame(self._avions, columns=FicheAvion._fields)
+        return self._df
 
-        :return: Vitesse maximale de vent admissible et vitesse propre de l'avion choisi.
-        :rtype: tuple(float, float)
+    def __len__(self):
+        return len(self._avions)
+
+    def avions(self):
+        """
+        Retourne tous les avions, dans l'ordre du fichier.
+
+        :rtype: tuple[FicheAvion, ...]
+        """
+        return self._avions
+
+    def types(self):
+        """
+        Retourne les types d'avions disponibles, dans l'ordre du fichier.
+
+        :rtype: tuple[str, ...]
+        """
+        return self._types
+
+    def avion(self, nom):
+        """
+        Retourne la fiche d'un avion à partir de son nom.
+
+        :param nom: Nom exact du modèle.
+        :type nom: str
+        :return: Fiche de l'avion, ou None s'il est inconnu.
+        :rtype: FicheAvion or None
+        """
+        return self._par_nom.get(nom)
+
+    def rechercher(self, type_avion=None, vent_min=None, vent_max=None):
+        """
+        Retourne les avions d'un type dont le vent admissible est compris entre deux bornes (incluses).
+
+        :param type_avion: Type d'avion (None : tous les types).
+        :type type_avion: str or None
+        :param vent_min: Vent admissible minimal, en km/h (None : pas de borne).
+        :type vent_min: float or None
+        :param vent_max: Vent admissible maximal, en km/h (None : pas de borne).
+        :type vent_max: float or None
+        :return: Avions trouvés, dans l'ordre du fichier (vide si le type est inconnu).
+        :rtype: tuple[FicheAvion, ...]
+        """
+        if type_avion not in self._index:
+            return ()
+        vents, fiches = self._index[type_avion]
+        debut = 0 if vent_min is None else bisect.bisect_left(vents, vent_min)
+        fin = len(vents) if vent_max is None else bisect.bisect_right(vents, vent_max)
+        # L'index est trié par vent ; les listes proposées à l'utilisateur suivent l'ordre du fichier
+        return tuple(sorted(fiches[debut:fin], key=self._rangs.__getitem__))
+
+    def _choisir_type(self):
+        """
+        Affiche les types d'avions disponibles et demande à l'utilisateur d'en choisir un.
         """
-        types_disponibles = self.df['type'].unique()  # Liste des types d’avions uniques dans le fichier
         print("Types d’avions disponibles :")
-        liste_type = []
-        for t in types_disponibles:
-            liste_type.append(t)
+        for t in self._types:
             print(f" - {t}")
 
         # Demande à l’utilisateur de choisir un type d’avion (en forçant à écrire un type valide)
         type_choisi = ""
-        while type_choisi not in liste_type:
+        while type_choisi not in self._types:
             type_choisi = input("Entrez un type d’avion : ").strip().lower()
+        return type_choisi
 
-        # Filtrage des avions de ce type
-        da_type = self.df[self.df['type'] == type_choisi]
+    def _choisir_avion(self, avions):
+        """
+        Affiche une liste d'avions et demande à l'utilisateur d'en choisir un par son nom.
 
+        :return: Vitesse maximale de vent admissible et vitesse propre de l'avion choisi.
+        :rtype: tuple(float, float)
+        """
         print("\nAvions disponibles :")
-        liste_avion = []
-        for _, row in da_type.iterrows():
-            nom = row['nom']
-            vent = row['vitesse_vent_admissible']
-            liste_avion.append(nom)
-            print(f" - {nom} (vent max admissible : {vent} km/h)")
+        par_nom = {}
+        for avion in avions:
+            par_nom.setdefault(avion.nom, avion)
+            print(f" - {avion.nom} (vent max admissible : {avion.vitesse_vent_admissible} km/h)")
 
         # Demande du nom exact de l’avion choisi
         nom_choisi = ""
-        while nom_choisi not in liste_avion:
+        while nom_choisi not in par_nom:
             nom_choisi = input("Entrez le nom de l’avion : ").strip()
 
         # Récupération des caractéristiques de l’avion choisi
-        avion = da_type[da_type['nom'] == nom_choisi].iloc[0]
-        vitesse_admi = avion['vitesse_vent_admissible']
-        vitesse_avion = avion['vitesse_de_avion']
-        return vitesse_admi, vitesse_avion
+        avion = par_nom[nom_choisi]
+        return avion.vitesse_vent_admissible, avion.vitesse_de_avion
+
+    def choix_avion_mode_1(self):
+        """
+        Mode 1 : Permet de choisir un avion librement sans contrainte météo.
+
+        :return: Vitesse maximale de vent admissible et vitesse propre de l'avion choisi.
+        :rtype: tuple(float, float)
+        """
+        type_choisi = self._choisir_type()
+        return self._choisir_avion(self.rechercher(type_choisi))
 
     def choix_avion_mode_2(self, borne_min=0, borne_max=100):
         """
@@ -74,51 +192,29 @@ class AvionManager:
         :return: Vitesse maximale de vent admissible et vitesse propre de l'avion choisi.
         :rtype: tuple(float, float)
         """
-
-
-        types_disponibles = self.df['type'].unique()
         print("Types d’avions disponibles :")
-        for t in types_disponibles:
+        for t in self._types:
             print(f" - {t}")
 
         # Boucle jusqu’à obtenir un type d’avion valide avec des résultats dans la plage spécifiée
         while True:
             type_choisi = input("Entrez un type d’avion : ").strip().lower()
 
-            if type_choisi not in types_disponibles:
+            if type_choisi not in self._types:
                 print("Type invalide. Veuillez réessayer.")
                 continue
 
             # Filtrage selon le type et la plage de vitesse admissible
-            da_type = self.df[
-                (self.df['type'] == type_choisi) &
-                (self.df['vitesse_vent_admissible'] >= borne_min) &
-                (self.df['vitesse_vent_admissible'] <= borne_max)
-            ]
+            avions = self.rechercher(type_choisi, borne_min, borne_max)
 
-            if da_type.empty:
+            if not avions:
                 print(f"Aucun avion trouvé pour le type '{type_choisi}' avec vent admissible entre {borne_min} et {borne_max} km/h.")
                 print("Veuillez choisir un autre type d’avion.\n")
             else:
                 break
 
-        print("\nAvions disponibles :")
-        liste_avion = []
-        for _, row in da_type.iterrows():
-            nom = row['nom']
-            vent = row['vitesse_vent_admissible']
-            liste_avion.append(nom)
-            print(f" - {nom} (vent max admissible : {vent} km/h)")
-
         # Choix final de l’avion
-        nom_choisi = ""
-        while nom_choisi not in liste_avion:
-            nom_choisi = input("Entrez le nom de l’avion : ").strip()
-
-        avion = da_type[da_type['nom'] == nom_choisi].iloc[0]
-        vitesse_admi = avion['vitesse_vent_admissible']
-        vitesse_avion = avion['vitesse_de_avion']
-        return vitesse_admi, vitesse_avion
+        return self._choisir_avion(avions)
 
     def choix_du_mode(self, borne_min, borne_max):
         """
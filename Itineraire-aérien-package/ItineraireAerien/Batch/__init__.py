@@ -0,0 +1,23 @@
+import importlib
+
+# Nom exporté -> module qui le définit (importé au premier accès)
+_EXPORTS = {
+    "executer_lot": "calcul_lot",
+    "calculer_flotte": "calcul_lot",
+    "lire_travaux": "calcul_lot",
+    "Travail": "calcul_lot",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(nom):
+    if nom in _EXPORTS:
+        valeur = getattr(importlib.import_module(f".{_EXPORTS[nom]}", __name__), nom)
+        globals()[nom] = valeur
+        return valeur
+    raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,89 @@
+"""
+Calcul d'itinéraires en lot, sans interface.
+
+Lit un fichier CSV de travaux (colonnes ``depart``, ``arrivee``, ``avion`` et, en option, ``id``),
+calcule les trajets en parallèle et écrit une ligne de résultats par trajet (CSV ou Parquet).
+
+Avec ``--flotte DEPART ARRIVEE``, calcule à la place un même trajet pour chaque avion du fichier
+des avions, en une seule passe (une ligne de résultats par avion).
+
+Usage (depuis le dossier ``Itineraire-aérien-package``) :
+
+    python -m ItineraireAerien.Batch travaux.csv -o resultats.csv [--processus 8]
+        [--meteo synthetique|rejeu|weatherapi] [--mode glouton|astar|astar_meteo]
+    python -m ItineraireAerien.Batch --flotte "New York" "Charlotte" -o flotte.csv
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from .calcul_lot import calculer_flotte, executer_lot, lire_travaux, ouvrir_ecrivain
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(prog="python -m ItineraireAerien.Batch",
+                                     description="Calcul d'itinéraires en lot.")
+    parser.add_argument("travaux", nargs="?", help="Fichier CSV des trajets (depart, arrivee, avion[, id]).")
+    parser.add_argument("--flotte", nargs=2, metavar=("DEPART", "ARRIVEE"),
+                        help="Calcule ce trajet pour chaque avion (routage glouton, un seul processus).")
+    parser.add_argument("-o", "--sortie", required=True, help="Fichier de résultats (.csv ou .parquet).")
+    parser.add_argument("--processus", type=int, default=os.cpu_count(), help="Nombre de processus de calcul.")
+    parser.add_argument("--mode", default="glouton", choices=["glouton", "astar", "astar_meteo"])
+    parser.add_argument("--rayon-max-km", type=float, default=200)
+    parser.add_argument("--meteo", default="synthetique", choices=["synthetique", "rejeu", "weatherapi"],
+                        help="Source météo (synthetique : hors ligne, déterministe).")
+    parser.add_argument("--graine", type=int, default=0, help="Graine du champ de vent synthétique.")
+    parser.add_argument("--fichier-rejeu", help="Enregistrements rejoués (--meteo rejeu).")
+    parser.add_argument("--cle-api", default=os.environ.get("WEATHERAPI_KEY"),
+                        help="Clé WeatherAPI (--meteo weatherapi ; par défaut $WEATHERAPI_KEY).")
+    parser.add_argument("--concurrence", type=int, default=1, help="Requêtes météo simultanées par processus.")
+    parser.add_argument("--requetes-par-seconde", type=float,
+                        help="Débit maximal de requêtes météo, réparti entre les processus.")
+    parser.add_argument("--waypoints", default=str(BASE_DIR / "Data" / "Waypoints.csv"))
+    parser.add_argument("--avions", default=str(BASE_DIR / "Data" / "avions.csv"))
+    parser.add_argument("-q", "--silencieux", action="store_true", help="N'affiche pas la progression.")
+    args = parser.parse_args(arguments)
+
+    if args.meteo == "rejeu" and not args.fichier_rejeu:
+        parser.error("--meteo rejeu nécessite --fichier-rejeu")
+    if args.meteo == "weatherapi" and not args.cle_api:
+        parser.error("--meteo weatherapi nécessite --cle-api (ou $WEATHERAPI_KEY)")
+    if (args.travaux is None) == (args.flotte is None):
+        parser.error("indiquez soit un fichier de travaux, soit --flotte DEPART ARRIVEE")
+    config_meteo = {"type": args.meteo, "graine": args.graine, "fichier": args.fichier_rejeu,
+                    "cle_api": args.cle_api}
+
+    if args.flotte is not None:
+        try:
+            lignes = calculer_flotte(*args.flotte, args.avions, args.waypoints, config_meteo=config_meteo,
+                                     rayon_max_km=args.rayon_max_km, concurrence=args.concurrence,
+                                     requetes_par_seconde=args.requetes_par_seconde)
+        except ValueError as e:
+            parser.error(str(e))
+        ecrivain = ouvrir_ecrivain(args.sortie)
+        try:
+            for ligne in lignes:
+                ecrivain.ecrire(ligne)
+        finally:
+            ecrivain.fermer()
+        nb_atteintes = sum(1 for ligne in lignes if ligne["arrivee_atteinte"])
+        print(f"{len(lignes)} avions, {nb_atteintes} atteignent l'arrivée -> {args.sortie}", file=sys.stderr)
+        return 0
+
+    travaux = lire_travaux(args.travaux, args.avions)
+    processus = max(1, min(args.processus or 1, len(travaux)))
+    debit = args.requetes_par_seconde / processus if args.requetes_par_seconde else None
+
+    nb_ok, nb_erreurs = executer_lot(
+        travaux, args.sortie, args.waypoints, processus=processus, config_meteo=config_meteo,
+        mode=args.mode, rayon_max_km=args.rayon_max_km, concurrence=args.concurrence,
+        requetes_par_seconde=debit, progression=not args.silencieux)
+    print(f"{nb_ok} trajets calculés, {nb_erreurs} en erreur -> {args.sortie}", file=sys.stderr)
+    return 0 if nb_erreurs == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
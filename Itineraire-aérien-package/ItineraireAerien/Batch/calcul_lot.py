@@ -0,0 +1,391 @@
+import csv               # Pour lire les travaux et écrire les résultats au format CSV
+import multiprocessing   # Pool de processus de calcul
+import os                # Pour le nombre de processeurs disponibles
+import sys               # Pour afficher la progression sur la sortie d'erreur
+import time              # Pour mesurer la durée de chaque trajet
+from typing import NamedTuple
+
+from ..Visualisation.waypoint_store import WaypointStore  # Stockage partagé des waypoints
+from .memoire_partagee import exporter_waypoints, importer_waypoints, liberer
+
+COLONNES_RESULTATS = [
+    "id", "depart", "arrivee", "avion", "seuil_vent_kph", "statut", "arrivee_atteinte",
+    "nb_waypoints", "distance_km", "vent_max_kph", "nb_points_meteo", "duree_s", "erreur",
+]
+
+
+class Travail(NamedTuple):
+    """
+    Trajet à calculer, tel que lu dans le fichier de travaux.
+
+    :param id: Identifiant du trajet (colonne ``id`` ou numéro de ligne).
+    :param depart: Nom de la ville de départ.
+    :param arrivee: Nom de la ville d'arrivée.
+    :param avion: Nom de l'avion.
+    :param coord_depart: Coordonnées de la ville de départ (None si inconnue).
+    :param coord_arrivee: Coordonnées de la ville d'arrivée (None si inconnue).
+    :param seuil: Vent maximal admissible de l'avion, en km/h (None si avion inconnu).
+    :param erreur: Raison pour laquelle le trajet ne peut pas être calculé (None sinon).
+    """
+    id: str
+    depart: str
+    arrivee: str
+    avion: str
+    coord_depart: object
+    coord_arrivee: object
+    seuil: object
+    erreur: object
+
+
+def lire_travaux(chemin, avions_csv):
+    """
+    Lit un fichier CSV de travaux (colonnes ``depart``, ``arrivee``, ``avion`` et, en option, ``id``)
+    et résout les villes et les avions.
+
+    :param chemin: Chemin du fichier de travaux.
+    :type chemin: str
+    :param avions_csv: Chemin du fichier des avions.
+    :type avions_csv: str
+    :return: Travaux, dans l'ordre du fichier.
+    :rtype: list[Travail]
+    """
+    from ..Avion import AvionManager
+    from ..coordonees import catalogue_villes
+
+    avions = AvionManager(avions_csv)
+    catalogue = catalogue_villes()
+
+    travaux = []
+    with open(chemin, newline="", encoding="utf-8") as f:
+        for numero, ligne in enumerate(csv.DictReader(f), start=1):
+            depart, arrivee, avion = ligne["depart"].strip(), ligne["arrivee"].strip(), ligne["avion"].strip()
+            coord_depart = catalogue.coordonnees(depart)
+            coord_arrivee = catalogue.coordonnees(arrivee)
+            fiche = avions.avion(avion)
+            seuil = float(fiche.vitesse_vent_admissible) if fiche is not None else None
+            if coord_depart is None or coord_arrivee is None:
+                erreur = f"Ville inconnue : {depart if coord_depart is None else arrivee}"
+            elif seuil is None:
+                erreur = f"Avion inconnu : {avion}"
+            else:
+                erreur = None
+            travaux.append(Travail(ligne.get("id") or str(numero), depart, arrivee, avion,
+                                   coord_depart, coord_arrivee, seuil, erreur))
+    return travaux
+
+
+def creer_fournisseur(config_meteo):
+    """
+    Crée la source météo décrite par une configuration sérialisable (transmise aux processus).
+
+    :param config_meteo: ``{"type": "synthetique", "graine": ...}``, ``{"type": "rejeu", "fichier": ...}``
+                         ou ``{"type": "weatherapi", "cle_api": ...}``.
+    :type config_meteo: dict
+    :return: Source météo.
+    :rtype: FournisseurMeteo
+    :raises ValueError: Si le type de source est inconnu.
+    """
+    from ..Meteo import CacheMeteo, FournisseurRejeu, FournisseurSynthetique, FournisseurWeatherAPI
+
+    if config_meteo["type"] == "synthetique":
+        return FournisseurSynthetique(graine=config_meteo.get("graine", 0))
+    if config_meteo["type"] == "rejeu":
+        return FournisseurRejeu(config_meteo["fichier"])
+    if config_meteo["type"] == "weatherapi":
+        return FournisseurWeatherAPI(config_meteo["cle_api"], cache=CacheMeteo())
+    raise ValueError(f"Source météo inconnue : {config_meteo['type']}")
+
+
+# État propre à chaque processus de calcul (initialisé par _initialiser_processus)
+_contexte = {}
+
+
+def _initialiser_processus(waypoint_csv, descripteur, config_meteo, parametres):
+    """
+    Prépare un processus de calcul : rattache les waypoints partagés (sans relire le fichier)
+    et crée les gestionnaires de navigation et de météo.
+    """
+    from ..Meteo import MeteoManager
+    from ..Visualisation import NavigationManager
+
+    if descripteur is not None:
+        donnees, blocs = importer_waypoints(descripteur)
+        WaypointStore.partage(waypoint_csv).installer(donnees)
+        _contexte["blocs"] = blocs  # Les blocs doivent rester ouverts tant que les données servent
+
+    _contexte["navigation"] = NavigationManager(waypoint_csv, rayon_max_km=parametres["rayon_max_km"])
+    _contexte["meteo"] = MeteoManager(fournisseur=creer_fournisseur(config_meteo),
+                                      concurrence=parametres["concurrence"],
+                                      requetes_par_seconde=parametres["requetes_par_seconde"])
+    _contexte["mode"] = parametres["mode"]
+
+
+def _calculer(travail):
+    """
+    Calcule un trajet dans le processus courant et retourne sa ligne de résultats.
+    """
+    ligne = {
+        "id": travail.id, "depart": travail.depart, "arrivee": travail.arrivee,
+        "avion": travail.avion, "seuil_vent_kph": travail.seuil,
+    }
+    if travail.erreur is not None:
+        return {**ligne, "statut": "erreur", "duree_s": 0.0, "erreur": travail.erreur}
+
+    navigation, meteo = _contexte["navigation"], _contexte["meteo"]
+    debut = time.perf_counter()
+    try:
+        segments, points_meteo, vent_max = navigation.tracer_chemin(
+            travail.coord_depart, travail.coord_arrivee, travail.seuil,
+            verifier_meteo_callback=lambda coords, seuil: meteo.verifier_conditions_meteo(coords, seuil),
+            mode=_contexte["mode"])
+    except Exception as e:
+        return {**ligne, "statut": "erreur", "duree_s": time.perf_counter() - debut, "erreur": repr(e)}
+    duree = time.perf_counter() - debut
+
+    return {
+        **ligne,
+        **_mesurer(navigation, travail.coord_depart, travail.coord_arrivee, segments, points_meteo, vent_max),
+        "duree_s": round(duree, 4),
+    }
+
+
+def _mesurer(navigation, depart, arrivee, segments, points_meteo, vent_max):
+    """
+    Retourne les colonnes de résultats décrivant un itinéraire calculé (statut, arrivée atteinte,
+    nombre de waypoints, distance, vent maximal et nombre de points météo).
+
+    La distance n'est renseignée que si l'arrivée est atteinte : le dernier segment de
+    `segments` rejoint toujours l'arrivée en ligne droite, même lorsque l'itinéraire est bloqué.
+    """
+    dernier_point = segments[-2][-1] if len(segments) > 1 else depart
+    arrivee_atteinte = navigation.distance(dernier_point, arrivee) <= 75
+    distance = None
+    if arrivee_atteinte:
+        points = [depart] + [point for segment in segments for point in segment]
+        distance = round(sum(navigation.distance(p, q) for p, q in zip(points[:-1], points[1:])), 1)
+    return {
+        "statut": "ok",
+        "arrivee_atteinte": arrivee_atteinte,
+        "nb_waypoints": (len(segments) - 1) // 2,
+        "distance_km": distance,
+        "vent_max_kph": vent_max,
+        "nb_points_meteo": len(points_meteo),
+    }
+
+
+def calculer_flotte(depart, arrivee, avions_csv, waypoint_csv, config_meteo=None, rayon_max_km=200,
+                    concurrence=1, requetes_par_seconde=None):
+    """
+    Calcule l'itinéraire d'un même trajet pour chaque avion de la flotte, en une seule passe.
+
+    Les avions ne diffèrent que par leur vent admissible : tous les seuils sont routés ensemble
+    par :meth:`NavigationManager.balayer_seuils` (routage glouton), qui partage le choix des
+    waypoints et la météo entre les avions tant que leurs itinéraires coïncident. Le coût est
+    celui de quelques itinéraires, et non d'un itinéraire par avion.
+
+    :param depart: Nom de la ville de départ.
+    :type depart: str
+    :param arrivee: Nom de la ville d'arrivée.
+    :type arrivee: str
+    :param avions_csv: Chemin du fichier des avions.
+    :type avions_csv: str
+    :param waypoint_csv: Chemin du fichier des waypoints.
+    :type waypoint_csv: str
+    :param config_meteo: Source météo (voir :func:`creer_fournisseur`) ; par défaut, synthétique.
+    :type config_meteo: dict or None
+    :param rayon_max_km: Distance maximale entre deux waypoints.
+    :type rayon_max_km: float
+    :param concurrence: Nombre de requêtes météo simultanées.
+    :type concurrence: int
+    :param requetes_par_seconde: Débit maximal de requêtes météo (None : illimité).
+    :type requetes_par_seconde: float or None
+    :return: Une ligne de résultats par avion, dans l'ordre du fichier des avions (colonnes
+             :data:`COLONNES_RESULTATS` ; ``duree_s`` est la durée du calcul commun).
+    :rtype: list[dict]
+    :raises ValueError: Si une des villes est inconnue.
+    """
+    from ..Avion import AvionManager
+    from ..Meteo import MeteoManager
+    from ..Visualisation import NavigationManager
+    from ..coordonees import catalogue_villes
+
+    catalogue = catalogue_villes()
+    coord_depart, coord_arrivee = catalogue.coordonnees(depart), catalogue.coordonnees(arrivee)
+    if coord_depart is None or coord_arrivee is None:
+        raise ValueError(f"Ville inconnue : {depart if coord_depart is None else arrivee}")
+
+    flotte = AvionManager(avions_csv).avions()
+    navigation = NavigationManager(waypoint_csv, rayon_max_km=rayon_max_km)
+    meteo = MeteoManager(fournisseur=creer_fournisseur(config_meteo or {"type": "synthetique", "graine": 0}),
+                         concurrence=concurrence, requetes_par_seconde=requetes_par_seconde)
+
+    debut = time.perf_counter()
+    itineraires = navigation.balayer_seuils(
+        coord_depart, coord_arrivee, [float(avion.vitesse_vent_admissible) for avion in flotte],
+        verifier_meteo_callback=lambda coords, seuil: meteo.verifier_conditions_meteo(coords, seuil))
+    duree = round(time.perf_counter() - debut, 4)
+
+    lignes = []
+    for numero, avion in enumerate(flotte, start=1):
+        seuil = float(avion.vitesse_vent_admissible)
+        lignes.append({
+            "id": str(numero), "depart": depart, "arrivee": arrivee, "avion": avion.nom,
+            "seuil_vent_kph": seuil,
+            **_mesurer(navigation, coord_depart, coord_arrivee, *itineraires[seuil]),
+            "duree_s": duree,
+        })
+    return lignes
+
+
+class EcrivainCSV:
+    """
+    Écrit les résultats dans un fichier CSV ; chaque ligne est écrite dès qu'elle est disponible.
+
+    :param chemin: Chemin du fichier de sortie.
+    :type chemin: str
+    """
+    def __init__(self, chemin):
+        self._fichier = open(chemin, "w", newline="", encoding="utf-8")
+        self._ecrivain = csv.DictWriter(self._fichier, fieldnames=COLONNES_RESULTATS)
+        self._ecrivain.writeheader()
+
+    def ecrire(self, ligne):
+        self._ecrivain.writerow(ligne)
+        self._fichier.flush()
+
+    def fermer(self):
+        self._fichier.close()
+
+
+class EcrivainParquet:
+    """
+    Écrit les résultats dans un fichier Parquet, par groupes de `taille_groupe` lignes
+    (nécessite pyarrow).
+
+    :param chemin: Chemin du fichier de sortie.
+    :type chemin: str
+    :param taille_groupe: Nombre de lignes par groupe écrit.
+    :type taille_groupe: int
+    :raises ImportError: Si pyarrow n'est pas installé.
+    """
+    def __init__(self, chemin, taille_groupe=500):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("L'écriture au format Parquet nécessite pyarrow (pip install pyarrow).") from e
+        self._pa = pa
+        self._schema = pa.schema([
+            ("id", pa.string()), ("depart", pa.string()), ("arrivee", pa.string()),
+            ("avion", pa.string()), ("seuil_vent_kph", pa.float64()), ("statut", pa.string()),
+            ("arrivee_atteinte", pa.bool_()), ("nb_waypoints", pa.int64()), ("distance_km", pa.float64()),
+            ("vent_max_kph", pa.float64()), ("nb_points_meteo", pa.int64()), ("duree_s", pa.float64()),
+            ("erreur", pa.string()),
+        ])
+        self._ecrivain = pq.ParquetWriter(chemin, self._schema)
+        self.taille_groupe = taille_groupe
+        self._tampon = []
+
+    def ecrire(self, ligne):
+        self._tampon.append(ligne)
+        if len(self._tampon) >= self.taille_groupe:
+            self._vider()
+
+    def _vider(self):
+        if self._tampon:
+            colonnes = {nom: [ligne.get(nom) for ligne in self._tampon] for nom in COLONNES_RESULTATS}
+            self._ecrivain.write_table(self._pa.table(colonnes, schema=self._schema))
+            self._tampon = []
+
+    def fermer(self):
+        self._vider()
+        self._ecrivain.close()
+
+
+def ouvrir_ecrivain(chemin):
+    """
+    Retourne l'écrivain de résultats correspondant à l'extension du fichier (.csv ou .parquet).
+
+    :param chemin: Chemin du fichier de sortie.
+    :type chemin: str
+    :rtype: EcrivainCSV or EcrivainParquet
+    """
+    if str(chemin).lower().endswith(".parquet"):
+        return EcrivainParquet(chemin)
+    return EcrivainCSV(chemin)
+
+
+def executer_lot(travaux, sortie, waypoint_csv, processus=None, config_meteo=None, mode="glouton",
+                 rayon_max_km=200, concurrence=1, requetes_par_seconde=None, progression=True):
+    """
+    Calcule une liste de trajets en parallèle et écrit les résultats au fil de l'eau.
+
+    Les waypoints sont chargés une seule fois par le processus principal puis placés en mémoire
+    partagée : chaque processus de calcul y accède sans relire ni copier le fichier. Les
+    résultats sont écrits au fil de l'eau, dans l'ordre des travaux (un trajet lent retarde
+    l'écriture des suivants, pas leur calcul).
+
+    :param travaux: Trajets à calculer (voir :func:`lire_travaux`).
+    :type travaux: list[Travail]
+    :param sortie: Fichier de résultats (.csv ou .parquet).
+    :type sortie: str
+    :param waypoint_csv: Chemin du fichier des waypoints.
+    :type waypoint_csv: str
+    :param processus: Nombre de processus de calcul (par défaut, le nombre de processeurs).
+    :type processus: int or None
+    :param config_meteo: Source météo (voir :func:`creer_fournisseur`) ; par défaut, synthétique.
+    :type config_meteo: dict or None
+    :param mode: Mode de routage de :meth:`NavigationManager.tracer_chemin`.
+    :type mode: str
+    :param rayon_max_km: Distance maximale entre deux waypoints.
+    :type rayon_max_km: float
+    :param concurrence: Nombre de requêtes météo simultanées par processus.
+    :type concurrence: int
+    :param requetes_par_seconde: Débit maximal de requêtes météo par processus (None : illimité).
+    :type requetes_par_seconde: float or None
+    :param progression: Affiche la progression sur la sortie d'erreur.
+    :type progression: bool
+    :return: Nombre de trajets calculés avec succès et nombre de trajets en erreur.
+    :rtype: tuple[int, int]
+    """
+    config_meteo = config_meteo or {"type": "synthetique", "graine": 0}
+    processus = processus or os.cpu_count() or 1
+    parametres = {"mode": mode, "rayon_max_km": rayon_max_km, "concurrence": concurrence,
+                  "requetes_par_seconde": requetes_par_seconde}
+
+    donnees = WaypointStore.partage(waypoint_csv).donnees()  # Chargées une seule fois, ici
+    ecrivain = ouvrir_ecrivain(sortie)
+    pool, blocs = None, []
+    nb_ok = nb_erreurs = 0
+    debut = time.perf_counter()
+    try:
+        if processus == 1:
+            _initialiser_processus(waypoint_csv, None, config_meteo, parametres)
+            resultats = map(_calculer, travaux)
+        else:
+            descripteur, blocs = exporter_waypoints(donnees)
+            pool = multiprocessing.Pool(processus, initializer=_initialiser_processus,
+                                        initargs=(waypoint_csv, descripteur, config_meteo, parametres))
+            resultats = pool.imap(_calculer, travaux)  # Résultats dans l'ordre des travaux
+
+        for numero, ligne in enumerate(resultats, start=1):
+            ecrivain.ecrire(ligne)
+            if ligne["statut"] == "ok":
+                nb_ok += 1
+            else:
+                nb_erreurs += 1
+            if progression:
+                ecoule = time.perf_counter() - debut
+                print(f"[{numero}/{len(travaux)}] {ligne['depart']} → {ligne['arrivee']} ({ligne['avion']}) : "
+                      f"{ligne['statut']} en {ligne['duree_s']:.2f} s | {numero / ecoule:.1f} trajets/s",
+                      file=sys.stderr)
+
+        if pool is not None:
+            pool.close()
+            pool.join()
+    finally:
+        ecrivain.fermer()
+        if pool is not None:
+            pool.terminate()
+        liberer(blocs)
+    return nb_ok, nb_erreurs
@@ -0,0 +1,70 @@
+from multiprocessing import shared_memory  # Blocs de mémoire partagés entre processus
+
+import numpy as np       # Pour exposer les blocs partagés sous forme de tableaux
+
+from ..Visualisation.waypoint_store import DonneesWaypoints  # Instantané des waypoints
+
+TABLEAUX_PARTAGES = ("latitudes", "longitudes", "pays_codes")  # Attributs copiés en mémoire partagée
+
+
+def exporter_waypoints(donnees):
+    """
+    Copie les tableaux d'un instantané de waypoints dans des blocs de mémoire partagée.
+
+    Les identifiants et codes pays (quelques milliers de chaînes) sont transmis tels quels dans
+    le descripteur ; seuls les tableaux NumPy sont partagés.
+
+    :param donnees: Instantané des waypoints chargé par le processus principal.
+    :type donnees: DonneesWaypoints
+    :return: Descripteur à transmettre aux processus (sérialisable), et blocs créés, à libérer
+             avec :func:`liberer` une fois le travail terminé.
+    :rtype: tuple[dict, list[multiprocessing.shared_memory.SharedMemory]]
+    """
+    tableaux, blocs = {}, []
+    for nom in TABLEAUX_PARTAGES:
+        tableau = getattr(donnees, nom)
+        bloc = shared_memory.SharedMemory(create=True, size=max(tableau.nbytes, 1))
+        np.ndarray(tableau.shape, dtype=tableau.dtype, buffer=bloc.buf)[:] = tableau
+        tableaux[nom] = (bloc.name, tableau.shape, tableau.dtype.str)
+        blocs.append(bloc)
+    descripteur = {
+        "tableaux": tableaux,
+        "idents": donnees.idents,
+        "pays": donnees.pays,
+        "signature": donnees.signature,
+    }
+    return descripteur, blocs
+
+
+def importer_waypoints(descripteur):
+    """
+    Reconstruit un instantané de waypoints à partir des blocs partagés, sans copie.
+
+    :param descripteur: Descripteur produit par :func:`exporter_waypoints`.
+    :type descripteur: dict
+    :return: Instantané dont les tableaux pointent vers la mémoire partagée (en lecture seule),
+             et blocs ouverts, à conserver tant que l'instantané est utilisé.
+    :rtype: tuple[DonneesWaypoints, list[multiprocessing.shared_memory.SharedMemory]]
+    """
+    tableaux, blocs = {}, []
+    for nom, (nom_bloc, forme, type_donnees) in descripteur["tableaux"].items():
+        bloc = shared_memory.SharedMemory(name=nom_bloc)
+        tableau = np.ndarray(forme, dtype=np.dtype(type_donnees), buffer=bloc.buf)
+        tableau.setflags(write=False)
+        tableaux[nom] = tableau
+        blocs.append(bloc)
+    donnees = DonneesWaypoints(tableaux["latitudes"], tableaux["longitudes"], descripteur["idents"],
+                               tableaux["pays_codes"], descripteur["pays"], descripteur["signature"])
+    return donnees, blocs
+
+
+def liberer(blocs):
+    """
+    Ferme et supprime les blocs de mémoire partagée créés par :func:`exporter_waypoints`.
+
+    :param blocs: Blocs à libérer.
+    :type blocs: list[multiprocessing.shared_memory.SharedMemory]
+    """
+    for bloc in blocs:
+        bloc.close()
+        bloc.unlink()
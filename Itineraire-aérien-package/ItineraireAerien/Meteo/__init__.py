@@ -1,2 +1,33 @@
-from .meteo_manager import MeteoManager
-from .donnees_meteo import DonneesMeteo
\ No newline at end of file
+import importlib
+
+# Nom exporté -> module qui le définit (importé au premier accès : requests n'est chargé
+# qu'à la création d'une source WeatherAPI, ou à l'import de DonneesMeteo / ClientHTTP)
+_EXPORTS = {
+    "MeteoManager": "meteo_manager",
+    "juger_segment": "meteo_manager",
+    "DonneesMeteo": "donnees_meteo",
+    "CacheMeteo": "cache_meteo",
+    "ClientHTTP": "client_http",
+    "client_partage": "client_http",
+    "GrilleMeteoCorridor": "corridor_meteo",
+    "FournisseurMeteo": "fournisseurs_meteo",
+    "FournisseurWeatherAPI": "fournisseurs_meteo",
+    "FournisseurSynthetique": "fournisseurs_meteo",
+    "FournisseurRejeu": "fournisseurs_meteo",
+    "FournisseurEnregistreur": "fournisseurs_meteo",
+    "ObservationsSimulation": "observations_simulation",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(nom):
+    if nom in _EXPORTS:
+        valeur = getattr(importlib.import_module(f".{_EXPORTS[nom]}", __name__), nom)
+        globals()[nom] = valeur
+        return valeur
+    raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,184 @@
+import json              # Pour sérialiser les réponses météo dans SQLite
+import sqlite3           # Pour la persistance optionnelle du cache sur disque
+import threading         # Pour protéger le cache partagé entre threads
+import time              # Pour l'horodatage et l'expiration des entrées
+from collections import OrderedDict  # Pour l'éviction LRU
+
+ECRITURES_PAR_TRANSACTION = 100  # Écritures SQLite regroupées dans une même transaction
+
+
+class CacheMeteo:
+    """
+    Cache des réponses météo indexé par cellules de latitude/longitude.
+
+    Deux coordonnées situées dans la même cellule (de taille `resolution_deg`) partagent la même
+    entrée. Les entrées expirent après `duree_vie_s` secondes (par défaut 15 minutes, l'intervalle
+    de mise à jour de WeatherAPI) ; au-delà de `taille_max` entrées, les moins récemment utilisées
+    sont évincées. Une base SQLite peut être fournie pour conserver les données entre deux
+    exécutions : les écritures y sont regroupées par transactions de `ECRITURES_PAR_TRANSACTION`
+    (journal WAL, synchronisation NORMAL), et les dernières sont validées par :meth:`fermer`.
+    En cas d'arrêt brutal, seules les réponses non encore validées sont perdues.
+
+    :param resolution_deg: Taille d'une cellule, en degrés.
+    :type resolution_deg: float
+    :param duree_vie_s: Durée de validité d'une entrée, en secondes.
+    :type duree_vie_s: float
+    :param taille_max: Nombre maximal d'entrées conservées en mémoire.
+    :type taille_max: int
+    :param chemin_sqlite: Chemin d'une base SQLite de persistance (None : cache en mémoire uniquement).
+    :type chemin_sqlite: str or None
+    """
+    def __init__(self, resolution_deg=0.1, duree_vie_s=900, taille_max=10000, chemin_sqlite=None):
+        """
+        Initialise un cache vide et ouvre la base SQLite si elle est demandée.
+        """
+        self.resolution_deg = resolution_deg
+        self.duree_vie_s = duree_vie_s
+        self.taille_max = taille_max
+        self.hits = 0          # Réponses servies depuis le cache (mémoire ou disque)
+        self.hits_disque = 0   # Dont réponses relues depuis SQLite
+        self.misses = 0        # Cellules absentes ou expirées
+        self.evictions = 0     # Entrées évincées par la limite de taille
+        self._entrees = OrderedDict()  # cellule -> (horodatage, données)
+        self._verrou = threading.Lock()
+        self._base = None
+        self._ecritures_en_attente = 0  # Écritures SQLite non encore validées
+        if chemin_sqlite:
+            self._base = sqlite3.connect(str(chemin_sqlite), check_same_thread=False)
+            self._base.execute("PRAGMA journal_mode=WAL")
+            self._base.execute("PRAGMA synchronous=NORMAL")  # Pas de synchronisation disque à chaque validation
+            self._base.execute(
+                "CREATE TABLE IF NOT EXISTS meteo ("
+                " resolution REAL, i INTEGER, j INTEGER, horodatage REAL, donnees TEXT,"
+                " PRIMARY KEY (resolution, i, j))")
+            self._base.commit()
+
+    def cellule(self, lat, lon):
+        """
+        Retourne la cellule (indices entiers) contenant une coordonnée.
+
+        :param lat: Latitude, en degrés.
+        :type lat: float
+        :param lon: Longitude, en degrés.
+        :type lon: float
+        :return: Indices de la cellule.
+        :rtype: tuple[int, int]
+        """
+        return round(lat / self.resolution_deg), round(lon / self.resolution_deg)
+
+    def lire(self, lat, lon):
+        """
+        Retourne la réponse météo en cache pour une coordonnée, si elle est encore valide.
+
+        :param lat: Latitude, en degrés.
+        :type lat: float
+        :param lon: Longitude, en degrés.
+        :type lon: float
+        :return: Réponse de l'API (JSON décodé) ou None si absente ou expirée.
+        :rtype: dict or None
+        """
+        cle = self.cellule(lat, lon)
+        maintenant = time.time()
+        with self._verrou:
+            entree = self._entrees.get(cle)
+            if entree is not None:
+                horodatage, donnees = entree
+                if maintenant - horodatage <= self.duree_vie_s:
+                    self._entrees.move_to_end(cle)
+                    self.hits += 1
+                    return donnees
+                del self._entrees[cle]  # Entrée expirée
+
+            if self._base is not None:
+                ligne = self._base.execute(
+                    "SELECT horodatage, donnees FROM meteo WHERE resolution = ? AND i = ? AND j = ?",
+                    (self.resolution_deg, cle[0], cle[1])).fetchone()
+                if ligne is not None and maintenant - ligne[0] <= self.duree_vie_s:
+                    donnees = json.loads(ligne[1])
+                    self._inserer(cle, ligne[0], donnees)
+                    self.hits += 1
+                    self.hits_disque += 1
+                    return donnees
+
+            self.misses += 1
+            return None
+
+    def ecrire(self, lat, lon, donnees):
+        """
+        Enregistre la réponse météo obtenue pour une coordonnée.
+
+        :param lat: Latitude, en degrés.
+        :type lat: float
+        :param lon: Longitude, en degrés.
+        :type lon: float
+        :param donnees: Réponse de l'API (JSON décodé).
+        :type donnees: dict
+        """
+        cle = self.cellule(lat, lon)
+        horodatage = time.time()
+        texte = json.dumps(donnees) if self._base is not None else None  # Sérialisé hors du verrou
+        with self._verrou:
+            self._inserer(cle, horodatage, donnees)
+            if self._base is not None:
+                self._base.execute(
+                    "INSERT OR REPLACE INTO meteo VALUES (?, ?, ?, ?, ?)",
+                    (self.resolution_deg, cle[0], cle[1], horodatage, texte))
+                self._ecritures_en_attente += 1
+                if self._ecritures_en_attente >= ECRITURES_PAR_TRANSACTION:
+                    self._valider()
+
+    def _valider(self):
+        """
+        Valide les écritures SQLite en attente (appelé avec le verrou).
+        """
+        self._base.commit()
+        self._ecritures_en_attente = 0
+
+    def fermer(self):
+        """
+        Valide les écritures en attente et ferme la base SQLite (le cache mémoire reste utilisable).
+        """
+        with self._verrou:
+            if self._base is not None:
+                self._valider()
+                self._base.close()
+                self._base = None
+
+    def _inserer(self, cle, horodatage, donnees):
+        """
+        Ajoute une entrée en mémoire et évince les plus anciennes au-delà de `taille_max`.
+        """
+        self._entrees[cle] = (horodatage, donnees)
+        self._entrees.move_to_end(cle)
+        while len(self._entrees) > self.taille_max:
+            self._entrees.popitem(last=False)
+            self.evictions += 1
+
+    def vider(self):
+        """
+        Supprime toutes les entrées (mémoire et disque) et remet les compteurs à zéro.
+        """
+        with self._verrou:
+            self._entrees.clear()
+            self.hits = self.hits_disque = self.misses = self.evictions = 0
+            if self._base is not None:
+                self._base.execute("DELETE FROM meteo")
+                self._valider()
+
+    def statistiques(self):
+        """
+        Retourne les compteurs du cache.
+
+        :return: Dictionnaire avec hits, hits_disque, misses, evictions, taille et taux_hit.
+        :rtype: dict
+        """
+        with self._verrou:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "hits_disque": self.hits_disque,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "taille": len(self._entrees),
+                "taux_hit": self.hits / total if total else 0.0,
+            }
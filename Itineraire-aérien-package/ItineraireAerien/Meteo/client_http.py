@@ -0,0 +1,142 @@
+import threading         # Pour partager le client et ses compteurs entre threads
+import time              # Pour mesurer la latence et attendre entre deux tentatives
+from typing import NamedTuple
+
+import requests          # Client HTTP
+from requests.adapters import HTTPAdapter  # Pool de connexions persistantes
+
+STATUTS_A_REESSAYER = (429, 500, 502, 503, 504)  # Erreurs HTTP considérées comme transitoires
+
+
+class MesureRequete(NamedTuple):
+    """
+    Mesure d'une requête HTTP, toutes tentatives confondues.
+
+    :param latence_s: Durée totale de la requête, attentes entre tentatives comprises (secondes).
+    :param tentatives: Nombre de tentatives effectuées.
+    :param statut: Code HTTP de la dernière réponse (None si aucune réponse).
+    :param erreur: Description de la dernière erreur réseau (None si aucune).
+    """
+    latence_s: float
+    tentatives: int
+    statut: object
+    erreur: object
+
+
+class ClientHTTP:
+    """
+    Client HTTP partagé : connexions persistantes (keep-alive) réutilisées via un pool,
+    délais de connexion et de lecture, et nouvelles tentatives avec attente exponentielle bornée.
+
+    :param taille_pool: Nombre maximal de connexions conservées par hôte.
+    :type taille_pool: int
+    :param delai_connexion: Délai maximal d'établissement de la connexion, en secondes.
+    :type delai_connexion: float
+    :param delai_lecture: Délai maximal d'attente de la réponse, en secondes.
+    :type delai_lecture: float
+    :param max_tentatives: Nombre maximal de tentatives par requête.
+    :type max_tentatives: int
+    :param attente_initiale_s: Attente avant la deuxième tentative, doublée à chaque nouvel échec.
+    :type attente_initiale_s: float
+    :param attente_max_s: Attente maximale entre deux tentatives.
+    :type attente_max_s: float
+    """
+    def __init__(self, taille_pool=10, delai_connexion=3.05, delai_lecture=10, max_tentatives=3,
+                 attente_initiale_s=0.5, attente_max_s=8):
+        """
+        Initialise la session HTTP et son pool de connexions.
+        """
+        self.delais = (delai_connexion, delai_lecture)
+        self.max_tentatives = max_tentatives
+        self.attente_initiale_s = attente_initiale_s
+        self.attente_max_s = attente_max_s
+
+        self.session = requests.Session()
+        adaptateur = HTTPAdapter(pool_connections=taille_pool, pool_maxsize=taille_pool)
+        self.session.mount("http://", adaptateur)
+        self.session.mount("https://", adaptateur)
+
+        self.nb_requetes = 0
+        self.nb_erreurs = 0            # Requêtes en échec après toutes les tentatives
+        self.nb_nouvelles_tentatives = 0
+        self.latence_totale_s = 0.0
+        self._verrou = threading.Lock()
+
+    def get(self, url, params=None):
+        """
+        Envoie une requête GET, en réessayant en cas d'erreur réseau ou d'erreur HTTP transitoire.
+
+        :param url: Adresse à interroger.
+        :type url: str
+        :param params: Paramètres de la requête.
+        :type params: dict or None
+        :return: Dernière réponse obtenue et mesure de la requête.
+        :rtype: tuple[requests.Response, MesureRequete]
+        :raises requests.RequestException: Si aucune tentative n'a abouti à une réponse.
+        """
+        debut = time.perf_counter()
+        reponse, erreur = None, None
+        tentative = 0
+        while tentative < self.max_tentatives:
+            if tentative > 0:
+                time.sleep(min(self.attente_max_s, self.attente_initiale_s * 2 ** (tentative - 1)))
+            tentative += 1
+            try:
+                reponse = self.session.get(url, params=params, timeout=self.delais)
+                erreur = None
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                reponse, erreur = None, exc
+                continue
+            if reponse.status_code not in STATUTS_A_REESSAYER:
+                break
+
+        mesure = MesureRequete(
+            latence_s=time.perf_counter() - debut,
+            tentatives=tentative,
+            statut=reponse.status_code if reponse is not None else None,
+            erreur=repr(erreur) if erreur is not None else None,
+        )
+        echec = reponse is None or reponse.status_code != 200
+        with self._verrou:
+            self.nb_requetes += 1
+            self.nb_nouvelles_tentatives += tentative - 1
+            self.latence_totale_s += mesure.latence_s
+            if echec:
+                self.nb_erreurs += 1
+
+        if erreur is not None:
+            raise erreur
+        return reponse, mesure
+
+    def statistiques(self):
+        """
+        Retourne les compteurs cumulés du client.
+
+        :return: Dictionnaire avec requetes, erreurs, nouvelles_tentatives et latence_moyenne_s.
+        :rtype: dict
+        """
+        with self._verrou:
+            return {
+                "requetes": self.nb_requetes,
+                "erreurs": self.nb_erreurs,
+                "nouvelles_tentatives": self.nb_nouvelles_tentatives,
+                "latence_moyenne_s": self.latence_totale_s / self.nb_requetes if self.nb_requetes else 0.0,
+            }
+
+
+_client_partage = None
+_verrou_client = threading.Lock()
+
+
+def client_partage():
+    """
+    Retourne le client HTTP partagé par toutes les instances de `DonneesMeteo` du processus.
+
+    :return: Client HTTP unique, créé au premier appel.
+    :rtype: ClientHTTP
+    """
+    global _client_partage
+    with _verrou_client:
+        if _client_partage is None:
+            _client_partage = ClientHTTP()
+        return _client_partage
@@ -0,0 +1,130 @@
+import math              # Pour la conversion des marges en degrés
+import numpy as np       # Pour la grille de vents et l'interpolation
+
+KM_PAR_DEGRE = 111.195   # Longueur d'un degré de latitude (rayon terrestre de 6371 km)
+
+
+class GrilleMeteoCorridor:
+    """
+    Grille météo grossière couvrant le corridor entre un départ et une arrivée.
+
+    Le vent est mesuré une seule fois aux nœuds d'une grille régulière couvrant le rectangle
+    englobant des deux points (élargi de `marge_km`), puis interpolé en tout point du corridor :
+    interpolation bilinéaire entre les quatre nœuds voisins, ou pondération par l'inverse de la
+    distance si certains de ces nœuds n'ont pas pu être mesurés. Le nombre de requêtes par
+    itinéraire est ainsi fixé à ``nb_lat * nb_lon``.
+
+    Les longitudes de la grille sont continues et peuvent sortir de [-180, 180] lorsque le
+    corridor franchit l'antiméridien ; les coordonnées reçues et retournées restent, elles,
+    dans [-180, 180].
+
+    :param depart: Coordonnée de départ (latitude, longitude).
+    :type depart: tuple[float, float]
+    :param arrivee: Coordonnée d'arrivée (latitude, longitude).
+    :type arrivee: tuple[float, float]
+    :param nb_lat: Nombre de nœuds de la grille en latitude.
+    :type nb_lat: int
+    :param nb_lon: Nombre de nœuds de la grille en longitude.
+    :type nb_lon: int
+    :param marge_km: Élargissement du rectangle englobant, en kilomètres.
+    :type marge_km: float
+    """
+    def __init__(self, depart, arrivee, nb_lat=6, nb_lon=8, marge_km=250):
+        """
+        Construit la grille (sans mesure) autour du corridor.
+        """
+        marge_lat = marge_km / KM_PAR_DEGRE
+        lat_min = max(-90.0, min(depart[0], arrivee[0]) - marge_lat)
+        lat_max = min(90.0, max(depart[0], arrivee[0]) + marge_lat)
+        cos_lat = max(math.cos(math.radians(max(abs(lat_min), abs(lat_max)))), 1e-6)
+        marge_lon = marge_km / (KM_PAR_DEGRE * cos_lat)
+
+        # Longitudes continues dans le sens le plus court : un trajet qui franchit l'antiméridien
+        # (ex. de 170° à -170°) est couvert de 170° à 190°, et non de -170° à 170°
+        lon_depart, lon_arrivee = depart[1], arrivee[1]
+        if lon_arrivee - lon_depart > 180:
+            lon_arrivee -= 360
+        elif lon_arrivee - lon_depart < -180:
+            lon_arrivee += 360
+        lon_min = min(lon_depart, lon_arrivee) - marge_lon
+        lon_max = max(lon_depart, lon_arrivee) + marge_lon
+        if lon_max - lon_min >= 360:  # Corridor faisant le tour du globe (hautes latitudes)
+            lon_min, lon_max = -180.0, 180.0
+
+        self.latitudes = np.linspace(lat_min, lat_max, max(nb_lat, 2))
+        self.longitudes = np.linspace(lon_min, lon_max, max(nb_lon, 2))
+        self.vents = np.full((len(self.latitudes), len(self.longitudes)), np.nan)
+
+    def __len__(self):
+        return self.vents.size
+
+    def noeuds(self):
+        """
+        Retourne les coordonnées des nœuds de la grille, ligne par ligne.
+
+        :return: Liste de coordonnées (latitude, longitude).
+        :rtype: list[tuple[float, float]]
+        """
+        return [(float(lat), float((lon + 180) % 360 - 180)) for lat in self.latitudes for lon in self.longitudes]
+
+    def remplir(self, vents):
+        """
+        Enregistre les vents mesurés aux nœuds (dans l'ordre de :meth:`noeuds`).
+
+        :param vents: Vitesse du vent en km/h pour chaque nœud (None si indisponible).
+        :type vents: list[float or None]
+        """
+        valeurs = [np.nan if v is None else v for v in vents]
+        self.vents = np.array(valeurs, dtype=float).reshape(self.vents.shape)
+
+    def _longitude_grille(self, lon):
+        """
+        Ramène une longitude dans le repère continu de la grille (à partir de sa première longitude).
+        """
+        return self.longitudes[0] + (lon - self.longitudes[0]) % 360
+
+    def contient(self, lat, lon):
+        """
+        Indique si une coordonnée se trouve dans la zone couverte par la grille.
+
+        :rtype: bool
+        """
+        return (self.latitudes[0] <= lat <= self.latitudes[-1]
+                and self._longitude_grille(lon) <= self.longitudes[-1])
+
+    def interpoler(self, lat, lon):
+        """
+        Estime la vitesse du vent en un point de la grille.
+
+        :param lat: Latitude du point.
+        :type lat: float
+        :param lon: Longitude du point.
+        :type lon: float
+        :return: Vitesse du vent en km/h, ou None si aucun nœud voisin n'a été mesuré.
+        :rtype: float or None
+        """
+        lon = self._longitude_grille(lon)
+        i = int(np.clip(np.searchsorted(self.latitudes, lat) - 1, 0, len(self.latitudes) - 2))
+        j = int(np.clip(np.searchsorted(self.longitudes, lon) - 1, 0, len(self.longitudes) - 2))
+        ty = (lat - self.latitudes[i]) / (self.latitudes[i + 1] - self.latitudes[i])
+        tx = (lon - self.longitudes[j]) / (self.longitudes[j + 1] - self.longitudes[j])
+        coins = self.vents[i:i + 2, j:j + 2]
+
+        if not np.isnan(coins).any():
+            # Interpolation bilinéaire
+            haut = coins[0, 0] * (1 - tx) + coins[0, 1] * tx
+            bas = coins[1, 0] * (1 - tx) + coins[1, 1] * tx
+            return float(haut * (1 - ty) + bas * ty)
+
+        # Nœuds manquants : pondération par l'inverse de la distance sur les nœuds mesurés
+        mesures = ~np.isnan(self.vents)
+        if not mesures.any():
+            return None
+        lat_noeuds, lon_noeuds = np.meshgrid(self.latitudes, self.longitudes, indexing='ij')
+        dy = lat_noeuds[mesures] - lat
+        dx = (lon_noeuds[mesures] - lon) * math.cos(math.radians(lat))
+        distances = np.hypot(dx, dy)
+        if distances.min() == 0:
+            return float(self.vents[mesures][np.argmin(distances)])
+        poids = 1 / distances ** 2
+        return float(np.sum(poids * self.vents[mesures]) / np.sum(poids))
@@ -1,4 +1,6 @@
-import requests
+from .client_http import client_partage  # Client HTTP partagé (pool, délais, nouvelles tentatives)
+
+URL_WEATHERAPI = "http://api.weatherapi.com/v1/current.json"
 
 
 class DonneesMeteo:
@@ -10,8 +12,12 @@ class DonneesMeteo:
     :type cle_api: str
     :param coordonnees: Coordonnées GPS au format (latitude, longitude).
     :type coordonnees: tuple[float, float] or None
+    :param cache: Cache météo partagé, consulté avant toute requête réseau.
+    :type cache: CacheMeteo or None
+    :param client: Client HTTP à utiliser (par défaut, le client partagé du processus).
+    :type client: ClientHTTP or None
     """
-    def __init__(self, cle_api, coordonnees=None):
+    def __init__(self, cle_api, coordonnees=None, cache=None, client=None):
         """
         Initialise une instance de la classe DonneesMeteo.
 
@@ -19,29 +25,49 @@ class DonneesMeteo:
         :type cle_api: str
         :param coordonnees: Tuple contenant latitude et longitude (ex. : (45.5, -73.6)).
         :type coordonnees: tuple or None
+        :param cache: Cache météo partagé (optionnel).
+        :type cache: CacheMeteo or None
+        :param client: Client HTTP (optionnel).
+        :type client: ClientHTTP or None
         """
         self.coordonnees = coordonnees  # Coordonnées géographiques de la zone à analyser
         self.cle_api = cle_api  # Clé API fournie par WeatherAPI
+        self.cache = cache  # Cache des réponses, partagé entre instances
         self.donnees = None  # Stockera les données météo récupérées
+        self.depuis_cache = False  # Indique si la dernière réponse provient du cache
+        self.client = client
+        self.mesure = None  # Latence, tentatives et erreur de la dernière requête réseau
 
     def fetch(self):
         """
         Récupère les données météo actuelles pour les coordonnées fournies,
-        en interrogeant l’API WeatherAPI.
+        depuis le cache s'il contient une réponse valide, sinon en interrogeant l’API WeatherAPI.
 
         :raises ValueError: Si aucune coordonnée n’est spécifiée.
         :raises RuntimeError: Si la réponse de l’API est invalide ou échoue.
+        :raises requests.RequestException: Si le service reste injoignable après toutes les tentatives.
         """
         if not self.coordonnees:
             raise ValueError("Coordonnées requises")  # Impossible de faire une requête sans position
 
         lat, lon = self.coordonnees  # On décompose le tuple
-        url = f"http://api.weatherapi.com/v1/current.json?key={self.cle_api}&q={lat},{lon}"
 
-        response = requests.get(url)  # Requête GET vers l’API météo
+        if self.cache is not None:
+            donnees = self.cache.lire(lat, lon)
+            if donnees is not None:
+                self.donnees = donnees
+                self.depuis_cache = True
+                return
+
+        client = self.client or client_partage()
+        # Requête GET vers l’API météo (connexion réutilisée, délais et nouvelles tentatives)
+        response, self.mesure = client.get(URL_WEATHERAPI, params={"key": self.cle_api, "q": f"{lat},{lon}"})
 
         if response.status_code == 200:
             self.donnees = response.json()  # Réponse correcte : on convertit en dictionnaire Python
+            self.depuis_cache = False
+            if self.cache is not None:
+                self.cache.ecrire(lat, lon, self.donnees)
         else:
             raise RuntimeError("Erreur météo")  # Erreur HTTP ou problème d’API
 
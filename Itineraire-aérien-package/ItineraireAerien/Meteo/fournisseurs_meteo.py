@@ -0,0 +1,212 @@
+import json              # Pour lire et écrire les réponses enregistrées
+from abc import ABC, abstractmethod  # Interface des sources météo
+import math              # Pour le champ de vent synthétique
+import threading         # Pour protéger l'écriture du fichier d'enregistrement
+import time              # Pour simuler une latence réseau
+
+import numpy as np       # Pour le tirage reproductible des paramètres du champ synthétique
+
+DIRECTIONS_CARDINALES = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+                         "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
+
+
+class FournisseurMeteo(ABC):
+    """
+    Interface commune des sources de données météo utilisées par `MeteoManager`.
+
+    Une implémentation doit fournir :meth:`recuperer`, qui retourne pour une coordonnée un dictionnaire
+    au format de :meth:`DonneesMeteo.get_donnees` (clés vent_kph, direction_cardinal,
+    direction_deg, condition, precip_mm).
+    """
+    @abstractmethod
+    def recuperer(self, lat, lon):
+        """
+        Retourne les données météo d'un point.
+
+        :param lat: Latitude du point.
+        :type lat: float
+        :param lon: Longitude du point.
+        :type lon: float
+        :return: Données météo, et True si une requête réseau a été envoyée pour les obtenir.
+        :rtype: tuple[dict, bool]
+        """
+
+    def donnees(self, lat, lon):
+        """
+        Retourne uniquement les données météo d'un point (voir :meth:`recuperer`).
+
+        :rtype: dict
+        """
+        return self.recuperer(lat, lon)[0]
+
+
+class FournisseurWeatherAPI(FournisseurMeteo):
+    """
+    Source météo en temps réel : service WeatherAPI interrogé via `DonneesMeteo`.
+
+    :param cle_api: Clé API WeatherAPI.
+    :type cle_api: str
+    :param cache: Cache des réponses (optionnel).
+    :type cache: CacheMeteo or None
+    :param client: Client HTTP (par défaut, le client partagé du processus).
+    :type client: ClientHTTP or None
+    """
+    def __init__(self, cle_api, cache=None, client=None):
+        """
+        Initialise la source avec la clé API, le cache et le client HTTP à utiliser.
+        """
+        # Client WeatherAPI existant, importé ici : requests n'est chargé que si cette source est créée
+        from .donnees_meteo import DonneesMeteo
+        self._donnees_meteo = DonneesMeteo
+        self.cle_api = cle_api
+        self.cache = cache
+        self.client = client
+
+    def recuperer(self, lat, lon):
+        """
+        Interroge WeatherAPI (ou le cache) pour un point.
+
+        :return: Données météo, et True si la réponse ne provient pas du cache.
+        :rtype: tuple[dict, bool]
+        """
+        meteo = self._donnees_meteo(self.cle_api, (lat, lon), cache=self.cache, client=self.client)
+        meteo.fetch()
+        return meteo.get_donnees(), not meteo.depuis_cache
+
+
+class FournisseurSynthetique(FournisseurMeteo):
+    """
+    Source météo locale et déterministe : champ de vent synthétique tiré d'une graine.
+
+    Le vent est une somme de `nb_ondes` ondes planes de directions, longueurs d'onde et phases
+    aléatoires (mais reproductibles pour une graine donnée), ce qui donne un champ continu avec
+    des zones de vent fort et faible. Aucune requête réseau n'est envoyée ; `latence_s` permet
+    de simuler le temps de réponse d'un service distant lors des tests de charge.
+
+    :param graine: Graine du générateur aléatoire.
+    :type graine: int
+    :param vent_moyen: Vitesse moyenne du vent, en km/h.
+    :type vent_moyen: float
+    :param amplitude: Amplitude des variations autour de la moyenne, en km/h.
+    :type amplitude: float
+    :param nb_ondes: Nombre d'ondes composant le champ.
+    :type nb_ondes: int
+    :param latence_s: Latence simulée de chaque appel, en secondes.
+    :type latence_s: float
+    """
+    def __init__(self, graine=0, vent_moyen=25, amplitude=20, nb_ondes=4, latence_s=0):
+        """
+        Tire les paramètres du champ de vent à partir de la graine.
+        """
+        rng = np.random.default_rng(graine)
+        self.vent_moyen = vent_moyen
+        self.amplitude = amplitude
+        self.latence_s = latence_s
+        angles = rng.uniform(0, 2 * math.pi, nb_ondes)
+        longueurs_onde = rng.uniform(3, 15, nb_ondes)  # En degrés
+        self.ondes = [
+            (2 * math.pi * math.cos(a) / l, 2 * math.pi * math.sin(a) / l, phase)
+            for a, l, phase in zip(angles, longueurs_onde, rng.uniform(0, 2 * math.pi, nb_ondes))
+        ]
+        self.direction_base = float(rng.uniform(0, 360))
+
+    def recuperer(self, lat, lon):
+        """
+        Évalue le champ de vent synthétique en un point.
+
+        :return: Données météo synthétiques, et False (aucune requête réseau).
+        :rtype: tuple[dict, bool]
+        """
+        if self.latence_s:
+            time.sleep(self.latence_s)
+        somme = sum(math.sin(kx * lon + ky * lat + phase) for kx, ky, phase in self.ondes)
+        vent = max(0.0, self.vent_moyen + self.amplitude * somme / math.sqrt(len(self.ondes)))
+        direction = int(self.direction_base + 45 * math.sin(lat / 5) + 45 * math.cos(lon / 7)) % 360
+        return {
+            "vent_kph": round(vent, 1),
+            "direction_cardinal": DIRECTIONS_CARDINALES[round(direction / 22.5) % 16],
+            "direction_deg": direction,
+            "condition": "Synthétique",
+            "precip_mm": 0,
+        }, False
+
+
+class FournisseurRejeu(FournisseurMeteo):
+    """
+    Source météo locale rejouant des réponses enregistrées dans un fichier JSON Lines.
+
+    Chaque ligne du fichier contient ``{"lat": ..., "lon": ..., "donnees": {...}}`` (format produit
+    par :class:`FournisseurEnregistreur`). Les coordonnées sont regroupées en cellules de
+    `resolution_deg` ; un point sans enregistrement est transmis à `repli` s'il est fourni.
+
+    :param fichier: Chemin du fichier d'enregistrements.
+    :type fichier: str
+    :param resolution_deg: Taille des cellules de correspondance, en degrés.
+    :type resolution_deg: float
+    :param repli: Source utilisée pour les points absents de l'enregistrement.
+    :type repli: FournisseurMeteo or None
+    """
+    def __init__(self, fichier, resolution_deg=0.01, repli=None):
+        """
+        Charge en mémoire les réponses enregistrées.
+        """
+        self.resolution_deg = resolution_deg
+        self.repli = repli
+        self.reponses = {}
+        with open(fichier, "r", encoding="utf-8") as f:
+            for ligne in f:
+                if ligne.strip():
+                    enregistrement = json.loads(ligne)
+                    cle = self._cellule(enregistrement["lat"], enregistrement["lon"])
+                    self.reponses.setdefault(cle, enregistrement["donnees"])
+
+    def _cellule(self, lat, lon):
+        """
+        Retourne la cellule (indices entiers) contenant une coordonnée.
+        """
+        return round(lat / self.resolution_deg), round(lon / self.resolution_deg)
+
+    def recuperer(self, lat, lon):
+        """
+        Retourne la réponse enregistrée pour la cellule du point.
+
+        :raises KeyError: Si aucune réponse n'est enregistrée pour ce point et qu'il n'y a pas de repli.
+        """
+        donnees = self.reponses.get(self._cellule(lat, lon))
+        if donnees is not None:
+            return donnees, False
+        if self.repli is None:
+            raise KeyError(f"Aucune réponse enregistrée pour ({lat}, {lon})")
+        return self.repli.recuperer(lat, lon)
+
+
+class FournisseurEnregistreur(FournisseurMeteo):
+    """
+    Enveloppe une source météo et enregistre chacune de ses réponses dans un fichier JSON Lines,
+    rejouable ensuite avec :class:`FournisseurRejeu`.
+
+    :param source: Source météo à enregistrer.
+    :type source: FournisseurMeteo
+    :param fichier: Chemin du fichier d'enregistrements (complété s'il existe déjà).
+    :type fichier: str
+    """
+    def __init__(self, source, fichier):
+        """
+        Initialise l'enregistreur autour de la source à enregistrer.
+        """
+        self.source = source
+        self.fichier = fichier
+        self._verrou = threading.Lock()
+
+    def recuperer(self, lat, lon):
+        """
+        Interroge la source puis ajoute sa réponse au fichier d'enregistrement.
+
+        :rtype: tuple[dict, bool]
+        """
+        donnees, requete_envoyee = self.source.recuperer(lat, lon)
+        ligne = json.dumps({"lat": lat, "lon": lon, "donnees": donnees})
+        with self._verrou:
+            with open(self.fichier, "a", encoding="utf-8") as f:
+                f.write(ligne + "\n")
+        return donnees, requete_envoyee
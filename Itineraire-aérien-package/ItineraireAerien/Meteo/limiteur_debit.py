@@ -0,0 +1,51 @@
+import threading  # Pour partager le limiteur entre plusieurs threads de requêtes
+import time       # Pour mesurer et attendre l'intervalle entre deux requêtes
+
+
+class LimiteurDebit:
+    """
+    Limiteur de débit : espace les requêtes pour ne pas dépasser un nombre de requêtes par seconde.
+
+    Chaque appel à :meth:`attendre` réserve le prochain créneau disponible, ce qui permet
+    de partager un même limiteur entre plusieurs threads.
+
+    :param requetes_par_seconde: Débit maximal autorisé (None ou 0 : pas de limite).
+    :type requetes_par_seconde: float or None
+    """
+    def __init__(self, requetes_par_seconde=None):
+        """
+        Initialise le limiteur avec le débit voulu.
+
+        :param requetes_par_seconde: Débit maximal autorisé.
+        :type requetes_par_seconde: float or None
+        """
+        self.intervalle = 1 / requetes_par_seconde if requetes_par_seconde else 0
+        self._prochain = 0.0               # Instant (time.monotonic) du prochain créneau libre
+        self._verrou = threading.Lock()
+
+    def attendre(self, annulation=None):
+        """
+        Bloque jusqu'au prochain créneau disponible.
+
+        :param annulation: Événement permettant d'interrompre l'attente.
+        :type annulation: threading.Event or None
+        :return: True si la requête peut partir, False si l'attente a été annulée.
+        :rtype: bool
+        """
+        if annulation is not None and annulation.is_set():
+            return False
+        if not self.intervalle:
+            return True
+
+        with self._verrou:
+            maintenant = time.monotonic()
+            creneau = max(maintenant, self._prochain)
+            self._prochain = creneau + self.intervalle
+
+        attente = creneau - maintenant
+        if attente <= 0:
+            return True
+        if annulation is None:
+            time.sleep(attente)
+            return True
+        return not annulation.wait(attente)
@@ -1,28 +1,200 @@
-from .donnees_meteo import DonneesMeteo  # Classe pour interagir avec l'API météo
+from .fournisseurs_meteo import FournisseurWeatherAPI  # Source météo par défaut (API WeatherAPI)
+from .limiteur_debit import LimiteurDebit  # Limite le nombre de requêtes par seconde en mode concurrent
+from .corridor_meteo import GrilleMeteoCorridor, KM_PAR_DEGRE  # Grille météo préchargée sur le corridor du vol
+from ..statistiques_route import phase, incrementer  # Instrumentation optionnelle des calculs
+from concurrent.futures import ThreadPoolExecutor  # Pool de threads pour les requêtes concurrentes
+import math  # Pour la distance approchée entre un point et les observations voisines
+import threading  # Pour annuler les requêtes en attente quand un segment est rejeté
 import time  # Permet de temporiser les requêtes (éviter surcharge de l'API)
 
+def juger_segment(coordonnees, vents, seuil_vent_kph, max_depassements=2):
+    """
+    Juge un segment dont le vent de chaque point est déjà connu, avec les mêmes règles (et le
+    même résultat) que :meth:`MeteoManager.verifier_conditions_meteo` en mode séquentiel : en cas
+    de refus, seuls les points examinés jusqu'au refus sont retournés.
+
+    :param coordonnees: Points du segment [(lat, lon), ...].
+    :type coordonnees: list[tuple[float, float]]
+    :param vents: Vent de chaque point, en km/h (None si inconnu).
+    :type vents: list[float or None]
+    :param seuil_vent_kph: Seuil maximal de vent admissible (en km/h).
+    :type seuil_vent_kph: float
+    :param max_depassements: Nombre maximal de points autorisés à dépasser le seuil de vent.
+    :type max_depassements: int, optional
+    :return: Même résultat que :meth:`MeteoManager.verifier_conditions_meteo`.
+    :rtype: tuple[bool, list, list, float]
+    """
+    depassements = 0
+    liste_coords = []
+    donnees_meteo_segment = []
+    vent_max = 0
+    for (lat, lon), vent in zip(coordonnees, vents):
+        liste_coords.append((lat, lon))
+        donnees_meteo_segment.append((lat, lon, vent))
+        if vent and vent > vent_max:
+            vent_max = vent
+        if vent and vent > seuil_vent_kph:
+            depassements += 1
+            if depassements > max_depassements:
+                return False, liste_coords, donnees_meteo_segment, vent_max
+    return True, liste_coords, donnees_meteo_segment, vent_max
+
+
 class MeteoManager:
     """
     Classe de gestion des conditions météorologiques sur des segments de trajectoire.
 
-    Cette classe utilise l'API WeatherAPI via la classe `DonneesMeteo` pour interroger
-    les conditions météo sur une série de coordonnées GPS et déterminer si elles
-    respectent un seuil de vent défini.
+    Cette classe interroge une source météo (par défaut l'API WeatherAPI via la classe
+    `DonneesMeteo`) sur une série de coordonnées GPS et détermine si les conditions
+    respectent un seuil de vent défini. Toute autre source implémentant
+    :class:`FournisseurMeteo` peut être utilisée, par exemple :class:`FournisseurSynthetique`
+    pour des tests de performance reproductibles sans réseau.
+
+    Par défaut les points sont interrogés un par un, avec une pause fixe entre deux requêtes.
+    Avec `concurrence` > 1, les points d'un segment sont interrogés en parallèle, et la pause
+    est remplacée par une limite de débit (`requetes_par_seconde`).
+
+    En mode corridor, le vent est mesuré une seule fois sur une grille grossière couvrant le trajet
+    (voir :meth:`precharger_corridor`), puis interpolé pour chaque point vérifié avec cette grille.
 
     :param cle_api: Clé API pour accéder au service météo (ex: weatherapi.com)
     :type cle_api: str
+    :param concurrence: Nombre maximal de requêtes simultanées.
+    :type concurrence: int
+    :param requetes_par_seconde: Débit maximal de requêtes en mode concurrent (None : pas de limite).
+    :type requetes_par_seconde: float or None
+    :param cache: Cache météo partagé par toutes les requêtes WeatherAPI (voir :class:`CacheMeteo`).
+    :type cache: CacheMeteo or None
+    :param fournisseur: Source météo à utiliser à la place de WeatherAPI.
+    :type fournisseur: FournisseurMeteo or None
     """
 
-    def __init__(self, cle_api):
+    def __init__(self, cle_api=None, concurrence=1, requetes_par_seconde=None, cache=None, fournisseur=None):
         """
         Initialise un objet MeteoManager avec une clé API.
 
         :param cle_api: Clé d'accès à l'API WeatherAPI.
         :type cle_api: str
+        :param concurrence: Nombre maximal de requêtes simultanées (1 : mode séquentiel).
+        :type concurrence: int
+        :param requetes_par_seconde: Débit maximal de requêtes en mode concurrent.
+        :type requetes_par_seconde: float or None
+        :param cache: Cache météo partagé (optionnel, source WeatherAPI uniquement).
+        :type cache: CacheMeteo or None
+        :param fournisseur: Source météo (par défaut : WeatherAPI avec `cle_api` et `cache`).
+        :type fournisseur: FournisseurMeteo or None
         """
         self.cle_api = cle_api
+        self.cache = cache
+        self.fournisseur = fournisseur or FournisseurWeatherAPI(cle_api, cache=cache)
+        self.concurrence = concurrence
+        self.limiteur = LimiteurDebit(requetes_par_seconde)
+        self._executor = None  # Pool de threads, créé au premier usage
+        self._verrou_executor = threading.Lock()
+
+    def _vent_api(self, lat, lon):
+        """
+        Interroge la source météo pour un point et retourne la vitesse du vent.
+
+        :param lat: Latitude du point.
+        :type lat: float
+        :param lon: Longitude du point.
+        :type lon: float
+        :return: Vitesse du vent en km/h (peut être None), et True si une requête réseau a été envoyée.
+        :rtype: tuple[float or None, bool]
+        """
+        donnees, requete_envoyee = self.fournisseur.recuperer(lat, lon)  # Météo de ce point
+        return donnees.get("vent_kph"), requete_envoyee
+
+    def _recuperer_vent(self, lat, lon, corridor=None):
+        """
+        Retourne la vitesse du vent en un point : interpolée sur la grille du corridor si le point
+        y est couvert, sinon obtenue auprès de l'API météo.
+
+        :param lat: Latitude du point.
+        :type lat: float
+        :param lon: Longitude du point.
+        :type lon: float
+        :param corridor: Grille préchargée (voir :meth:`precharger_corridor`), ou None.
+        :type corridor: GrilleMeteoCorridor or None
+        :return: Vitesse du vent en km/h (peut être None), et True si une requête réseau a été envoyée.
+        :rtype: tuple[float or None, bool]
+        """
+        if corridor is not None and corridor.contient(lat, lon):
+            return corridor.interpoler(lat, lon), False
+        return self._vent_api(lat, lon)
+
+    def precharger_corridor(self, depart, arrivee, nb_lat=6, nb_lon=8, marge_km=250, pause=1,
+                            statistiques=None):
+        """
+        Mesure le vent sur une grille couvrant le trajet, une fois pour toutes.
+
+        La grille retournée est ensuite passée à chaque vérification (paramètre `corridor` de
+        :meth:`verifier_conditions_meteo`), qui interpole le vent pour tous les points couverts ;
+        seuls les points situés hors de la grille donnent lieu à une requête. Le nombre de
+        requêtes de préchargement est fixé à ``nb_lat * nb_lon``. La grille n'est pas conservée
+        par le gestionnaire, qui peut ainsi être partagé entre plusieurs simulations.
+
+        Les requêtes sont espacées comme en vérification séquentielle : pause entre deux requêtes,
+        ou limite de débit si `concurrence` > 1.
 
-    def verifier_conditions_meteo(self, coordonnees, seuil_vent_kph, max_depassements=2, pause=1):
+        :param depart: Coordonnée de départ (latitude, longitude).
+        :type depart: tuple[float, float]
+        :param arrivee: Coordonnée d'arrivée (latitude, longitude).
+        :type arrivee: tuple[float, float]
+        :param nb_lat: Nombre de nœuds de la grille en latitude.
+        :type nb_lat: int
+        :param nb_lon: Nombre de nœuds de la grille en longitude.
+        :type nb_lon: int
+        :param marge_km: Élargissement du rectangle englobant le trajet, en kilomètres.
+        :type marge_km: float
+        :param pause: Temps d'attente entre deux requêtes API, en secondes (mode séquentiel uniquement).
+        :type pause: float, optional
+        :param statistiques: Statistiques à alimenter (durées des requêtes et des pauses, nombre de
+                             requêtes envoyées et d'échecs).
+        :type statistiques: StatistiquesRoute or None
+        :return: Grille préchargée.
+        :rtype: GrilleMeteoCorridor
+        """
+        grille = GrilleMeteoCorridor(depart, arrivee, nb_lat=nb_lat, nb_lon=nb_lon, marge_km=marge_km)
+
+        def mesurer(noeud):
+            if self.concurrence > 1 and not self.limiteur.attendre():
+                return None, False
+            try:
+                with phase(statistiques, "meteo.requetes"):
+                    vent, requete_envoyee = self._vent_api(*noeud)
+                self._compter(statistiques, requete_envoyee)
+                return vent, requete_envoyee
+            except Exception:
+                incrementer(statistiques, "meteo.echecs")
+                return None, True  # Nœud sans mesure : il sera compensé par l'interpolation
+
+        if self.concurrence > 1:
+            vents = [vent for vent, _ in self._pool().map(mesurer, grille.noeuds())]
+        else:
+            vents = []
+            for noeud in grille.noeuds():
+                if vents and requete_envoyee:
+                    # Pause entre les requêtes, comme en vérification séquentielle
+                    with phase(statistiques, "meteo.pause"):
+                        time.sleep(pause)
+                vent, requete_envoyee = mesurer(noeud)
+                vents.append(vent)
+        grille.remplir(vents)
+        return grille
+
+    def _pool(self):
+        """
+        Retourne le pool de threads partagé par les vérifications concurrentes.
+        """
+        with self._verrou_executor:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.concurrence, thread_name_prefix="meteo")
+            return self._executor
+
+    def verifier_conditions_meteo(self, coordonnees, seuil_vent_kph, max_depassements=2, pause=1,
+                                  statistiques=None, observations=None, par_risque=False, corridor=None):
         """
         Vérifie les conditions météorologiques sur une série de coordonnées GPS.
 
@@ -35,8 +207,24 @@ class MeteoManager:
         :type seuil_vent_kph: float
         :param max_depassements: Nombre maximal de points autorisés à dépasser le seuil de vent.
         :type max_depassements: int, optional
-        :param pause: Temps d'attente entre deux requêtes API, en secondes.
+        :param pause: Temps d'attente entre deux requêtes API, en secondes (mode séquentiel uniquement).
         :type pause: float, optional
+        :param statistiques: Statistiques à alimenter (durées des requêtes et des pauses, nombre de
+                             requêtes envoyées, de réponses obtenues sans requête et d'échecs).
+        :type statistiques: StatistiquesRoute or None
+        :param observations: Registre des vents déjà relevés pendant la simulation : les points connus
+                             ne sont pas redemandés, et les points obtenus y sont enregistrés.
+                             Un segment dont tous les points sont connus est rejugé sans requête.
+        :type observations: ObservationsSimulation or None
+        :param par_risque: Si True, les points les plus susceptibles de dépasser le seuil sont demandés
+                           en premier et la vérification s'arrête dès que la décision est acquise
+                           (voir :meth:`_verifier_par_risque`). La décision est la même, mais les
+                           données météo ne portent que sur les points examinés (le vent maximal
+                           d'un segment accepté n'est qu'un minorant).
+        :type par_risque: bool, optional
+        :param corridor: Grille préchargée pour la simulation (voir :meth:`precharger_corridor`) :
+                         le vent des points qu'elle couvre est interpolé, sans requête.
+        :type corridor: GrilleMeteoCorridor or None
 
         :return:
             - `bool` : True si le segment est accepté, False sinon.
@@ -46,17 +234,46 @@ class MeteoManager:
 
         :rtype: tuple[bool, list, list, float]
         """
+        if observations is not None:
+            vents = observations.vents_segment(coordonnees)
+            if vents is not None:
+                # Segment déjà entièrement observé : rejugé selon le seuil, sans aucune requête
+                incrementer(statistiques, "meteo.segments_rejuges")
+                incrementer(statistiques, "meteo.observations_reutilisees", len(vents))
+                resultat = juger_segment(coordonnees, vents, seuil_vent_kph, max_depassements)
+                if not resultat[0]:
+                    incrementer(statistiques, "meteo.segments_refuses")
+                return resultat
+
+        if par_risque:
+            return self._verifier_par_risque(coordonnees, seuil_vent_kph, max_depassements, pause,
+                                             statistiques, observations, corridor)
+
+        if self.concurrence > 1:
+            with phase(statistiques, "meteo.requetes"):
+                resultat = self._verifier_concurrent(coordonnees, seuil_vent_kph, max_depassements,
+                                                     statistiques, observations, corridor)
+            if not resultat[0]:
+                incrementer(statistiques, "meteo.segments_refuses")
+            return resultat
+
         depassements = 0                    # Nombre de points dépassant le seuil
         liste_coords = []                  # Coordonnées réellement analysées
         donnees_meteo_segment = []         # Résultats météo pour chaque point
         vent_max = 0                       # Vent max rencontré sur le segment
 
         for lat, lon in coordonnees:
-            meteo = DonneesMeteo(self.cle_api, (lat, lon))  # Crée une instance pour récupérer la météo de ce point
+            requete_envoyee = True
             try:
-                meteo.fetch()                              # Requête vers l'API
-                donnees = meteo.get_donnees()              # Données météo sous forme de dictionnaire
-                vent = donnees.get("vent_kph")       # Vitesse du vent (peut être None)
+                trouve, vent = self._lire_observation(observations, lat, lon, statistiques)
+                if trouve:
+                    requete_envoyee = False
+                else:
+                    with phase(statistiques, "meteo.requetes"):
+                        vent, requete_envoyee = self._recuperer_vent(lat, lon, corridor)  # Vent (peut être None)
+                    self._compter(statistiques, requete_envoyee)
+                    if observations is not None:
+                        observations.enregistrer(lat, lon, vent)
 
                 # Sauvegarde des résultats
                 liste_coords.append((lat, lon))
@@ -71,15 +288,216 @@ class MeteoManager:
                     depassements += 1
                     if depassements > max_depassements:
                         # Trop de dépassements → segment rejeté
+                        incrementer(statistiques, "meteo.segments_refuses")
                         return False, liste_coords, donnees_meteo_segment, vent_max
 
             except Exception as e:
                 # En cas d’erreur (API, réseau, JSON), on note le point mais sans info sur le vent
                 liste_coords.append((lat, lon))
                 donnees_meteo_segment.append((lat, lon, None))
+                incrementer(statistiques, "meteo.echecs")
 
             # Pause entre les requêtes pour éviter blocage par le serveur
-            time.sleep(pause)
+            # (inutile si la réponse vient du cache ou de la grille du corridor)
+            if requete_envoyee:
+                with phase(statistiques, "meteo.pause"):
+                    time.sleep(pause)
 
         # Aucun dépassement critique → segment accepté
         return True, liste_coords, donnees_meteo_segment, vent_max
+
+    def _verifier_par_risque(self, coordonnees, seuil_vent_kph, max_depassements, pause,
+                             statistiques=None, observations=None, corridor=None):
+        """
+        Variante de :meth:`verifier_conditions_meteo` qui demande d'abord les points les plus
+        susceptibles de dépasser le seuil, et s'arrête dès que la décision est acquise.
+
+        Un segment est refusé si et seulement si plus de `max_depassements` points dépassent le
+        seuil, comme en mode séquentiel : la décision est acquise dès que les dépassements constatés
+        excèdent `max_depassements` (refus), ou que les points restants ne peuvent plus les faire
+        excéder (acceptation).
+
+        Les points connus sans requête (registre de la simulation, grille du corridor) sont examinés
+        en premier. Le vent des autres est estimé par pondération inverse de la distance à partir
+        des observations proches (points du segment déjà obtenus, registre de la simulation), et le
+        point de plus fort vent estimé est demandé en premier ; sans observation proche, l'ordre
+        du segment est conservé.
+
+        Les requêtes partent une par une (pause entre deux requêtes, ou limite de débit si
+        `concurrence` > 1). En cas d'acceptation, toutes les coordonnées du segment sont retournées
+        (elles forment la trajectoire) ; en cas de refus, seules celles des points examinés.
+        Dans les deux cas, les données météo et le vent maximal ne portent que sur les points
+        examinés : pour un segment accepté, le vent maximal est un minorant de celui du mode
+        séquentiel.
+        """
+        vents = [None] * len(coordonnees)
+        restants = []       # Indices des points à demander
+        depassements = 0
+
+        # Points connus sans requête
+        for i, (lat, lon) in enumerate(coordonnees):
+            trouve, vent = self._lire_observation(observations, lat, lon, statistiques)
+            if not trouve and corridor is not None and corridor.contient(lat, lon):
+                trouve, vent = True, corridor.interpoler(lat, lon)
+                self._compter(statistiques, False)
+                if observations is not None:
+                    observations.enregistrer(lat, lon, vent)
+            if not trouve:
+                restants.append(i)
+                continue
+            vents[i] = vent
+            if vent and vent > seuil_vent_kph:
+                depassements += 1
+
+        # Observations voisines de chaque point à demander (registre de la simulation)
+        voisins = {i: observations.points_proches(*coordonnees[i]) if observations is not None else []
+                   for i in restants}
+        examines = [(lat, lon, vents[i]) for i, (lat, lon) in enumerate(coordonnees)
+                    if i not in restants and vents[i] is not None]
+
+        # Tant que la décision dépend des points restants
+        while restants and depassements <= max_depassements < depassements + len(restants):
+            i = max(restants, key=lambda j: self._estimer_vent(coordonnees[j], examines + voisins[j]))
+            restants.remove(i)
+            lat, lon = coordonnees[i]
+            requete_envoyee = True
+            if self.concurrence > 1:
+                self.limiteur.attendre()
+            try:
+                with phase(statistiques, "meteo.requetes"):
+                    vent, requete_envoyee = self._recuperer_vent(lat, lon, corridor)
+                self._compter(statistiques, requete_envoyee)
+                if observations is not None:
+                    observations.enregistrer(lat, lon, vent)
+            except Exception:
+                vent = None  # Même traitement qu'en mode séquentiel : point sans info sur le vent
+                incrementer(statistiques, "meteo.echecs")
+
+            vents[i] = vent
+            if vent is not None:
+                examines.append((lat, lon, vent))
+            if vent and vent > seuil_vent_kph:
+                depassements += 1
+
+            # Pause avant la requête suivante, s'il y en a une
+            if (requete_envoyee and self.concurrence <= 1 and restants
+                    and depassements <= max_depassements < depassements + len(restants)):
+                with phase(statistiques, "meteo.pause"):
+                    time.sleep(pause)
+
+        incrementer(statistiques, "meteo.points_non_demandes", len(restants))
+        accepte = depassements <= max_depassements
+        if not accepte:
+            incrementer(statistiques, "meteo.segments_refuses")
+        ignores = set(restants)
+        # Segment accepté : tous ses points forment la trajectoire ; refusé : seuls les points examinés
+        liste_coords = list(coordonnees) if accepte else [c for i, c in enumerate(coordonnees) if i not in ignores]
+        donnees_meteo_segment = [(lat, lon, vents[i]) for i, (lat, lon) in enumerate(coordonnees)
+                                 if i not in ignores]
+        vent_max = max((vent for vent in vents if vent), default=0)
+        return accepte, liste_coords, donnees_meteo_segment, vent_max
+
+    @staticmethod
+    def _estimer_vent(point, observations, puissance=2):
+        """
+        Estime le vent en un point par pondération inverse de la distance (approchée) aux
+        observations fournies.
+
+        :return: Vent estimé en km/h, ou -inf sans observation.
+        :rtype: float
+        """
+        if not observations:
+            return -math.inf
+        cos_lat = max(math.cos(math.radians(point[0])), 1e-6)
+        somme_poids = somme = 0.0
+        for lat, lon, vent in observations:
+            distance_km = KM_PAR_DEGRE * math.hypot(lat - point[0], (lon - point[1]) * cos_lat)
+            poids = 1 / max(distance_km, 1.0) ** puissance
+            somme_poids += poids
+            somme += poids * vent
+        return somme / somme_poids
+
+    @staticmethod
+    def _lire_observation(observations, lat, lon, statistiques):
+        """
+        Cherche un point dans le registre des observations de la simulation (s'il y en a un).
+
+        :return: True et le vent si le point a déjà été observé, sinon (False, None).
+        :rtype: tuple[bool, float or None]
+        """
+        if observations is None:
+            return False, None
+        trouve, vent = observations.lire(lat, lon)
+        if trouve:
+            incrementer(statistiques, "meteo.observations_reutilisees")
+        return trouve, vent
+
+    @staticmethod
+    def _compter(statistiques, requete_envoyee):
+        """
+        Compte un point météo obtenu : par une requête réseau, ou sans requête (cache, corridor
+        ou source locale).
+        """
+        incrementer(statistiques, "meteo.points")
+        incrementer(statistiques, "meteo.requetes_api" if requete_envoyee else "meteo.reponses_sans_requete")
+
+    def _verifier_concurrent(self, coordonnees, seuil_vent_kph, max_depassements, statistiques=None,
+                             observations=None, corridor=None):
+        """
+        Variante concurrente de :meth:`verifier_conditions_meteo`.
+
+        Toutes les requêtes du segment sont lancées dans le pool de threads (au rythme du
+        limiteur de débit), mais les résultats sont examinés dans l'ordre des points : le
+        résultat retourné est identique à celui du mode séquentiel. Dès que le segment est
+        rejeté, les requêtes qui n'ont pas encore démarré sont annulées.
+        """
+        annulation = threading.Event()
+
+        def tache(lat, lon):
+            trouve, vent = self._lire_observation(observations, lat, lon, statistiques)
+            if trouve:
+                return vent  # Déjà observé pendant la simulation
+            if corridor is not None and corridor.contient(lat, lon):
+                self._compter(statistiques, False)
+                vent = corridor.interpoler(lat, lon)  # Aucune requête réseau
+            elif not self.limiteur.attendre(annulation):
+                return None  # Segment déjà décidé : la requête n'est pas envoyée
+            else:
+                vent, requete_envoyee = self._vent_api(lat, lon)
+                self._compter(statistiques, requete_envoyee)
+            if observations is not None:
+                observations.enregistrer(lat, lon, vent)
+            return vent
+
+        pool = self._pool()
+        futures = [pool.submit(tache, lat, lon) for lat, lon in coordonnees]
+
+        depassements = 0
+        liste_coords = []
+        donnees_meteo_segment = []
+        vent_max = 0
+        try:
+            for (lat, lon), future in zip(coordonnees, futures):
+                try:
+                    vent = future.result()
+                except Exception:
+                    vent = None  # Même traitement qu'en mode séquentiel : point sans info sur le vent
+                    incrementer(statistiques, "meteo.echecs")
+
+                liste_coords.append((lat, lon))
+                donnees_meteo_segment.append((lat, lon, vent))
+
+                if vent and vent > vent_max:
+                    vent_max = vent
+
+                if vent and vent > seuil_vent_kph:
+                    depassements += 1
+                    if depassements > max_depassements:
+                        return False, liste_coords, donnees_meteo_segment, vent_max
+        finally:
+            # Annule les requêtes restantes (segment rejeté ou erreur inattendue)
+            annulation.set()
+            for future in futures:
+                future.cancel()
+
+        return True, liste_coords, donnees_meteo_segment, vent_max
@@ -0,0 +1,136 @@
+import math              # Pour la distance approchée entre deux points
+import threading         # Les vérifications météo concurrentes enregistrent depuis plusieurs threads
+
+from .corridor_meteo import KM_PAR_DEGRE  # Longueur d'un degré de latitude
+
+
+class ObservationsSimulation:
+    """
+    Vents relevés pendant une simulation, indexés par point échantillonné exact.
+
+    Le calcul de l'itinéraire de référence remplit le registre ; le calcul de l'itinéraire dévié
+    le consulte avant d'interroger la source météo. Les deux calculs partant du même point et
+    échantillonnant les segments de la même façon, un segment déjà parcouru est rejugé selon le
+    nouveau seuil sans aucune requête.
+
+    Contrairement à :class:`CacheMeteo` (cellules de `resolution_deg`, durée de vie, partagé par
+    tout le processus), le registre ne vit que le temps d'une simulation : les deux itinéraires
+    sont ainsi jugés sur les mêmes observations.
+
+    Les points dont la récupération a échoué ne sont pas enregistrés (ils seront redemandés).
+    """
+    def __init__(self):
+        """
+        Initialise un registre vide.
+        """
+        self._vents = {}               # (lat, lon) -> vent en km/h (peut être None)
+        self._verrou = threading.Lock()
+        self.points_reutilises = 0     # Points lus dans le registre au lieu de la source météo
+        self.segments_reutilises = 0   # Segments rejugés entièrement à partir du registre
+
+    def __len__(self):
+        return len(self._vents)
+
+    def __contains__(self, point):
+        return tuple(point) in self._vents
+
+    def lire(self, lat, lon):
+        """
+        Retourne le vent relevé en un point, s'il a déjà été observé.
+
+        :param lat: Latitude du point.
+        :type lat: float
+        :param lon: Longitude du point.
+        :type lon: float
+        :return: True et le vent (peut être None) si le point est connu, sinon (False, None).
+        :rtype: tuple[bool, float or None]
+        """
+        with self._verrou:
+            if (lat, lon) not in self._vents:
+                return False, None
+            self.points_reutilises += 1
+            return True, self._vents[(lat, lon)]
+
+    def vents_segment(self, coordonnees):
+        """
+        Retourne les vents de tous les points d'un segment, si tous ont déjà été observés.
+
+        :param coordonnees: Points échantillonnés du segment [(lat, lon), ...].
+        :type coordonnees: list[tuple[float, float]]
+        :return: Vent de chaque point, ou None si au moins un point est inconnu.
+        :rtype: list[float or None] or None
+        """
+        with self._verrou:
+            try:
+                vents = [self._vents[(lat, lon)] for lat, lon in coordonnees]
+            except KeyError:
+                return None
+            self.points_reutilises += len(vents)
+            self.segments_reutilises += 1
+            return vents
+
+    def points_proches(self, lat, lon, rayon_km=100):
+        """
+        Retourne les observations (avec vent connu) situées à moins de `rayon_km` d'un point,
+        sans compter de réutilisation.
+
+        :param lat: Latitude du point.
+        :type lat: float
+        :param lon: Longitude du point.
+        :type lon: float
+        :param rayon_km: Rayon de recherche, en kilomètres.
+        :type rayon_km: float
+        :return: Observations proches [(lat, lon, vent_kph), ...].
+        :rtype: list[tuple[float, float, float]]
+        """
+        rayon_deg = rayon_km / KM_PAR_DEGRE
+        cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+        with self._verrou:
+            observations = list(self._vents.items())
+        return [
+            (la, lo, vent) for (la, lo), vent in observations
+            if vent is not None and abs(la - lat) <= rayon_deg
+            and math.hypot(la - lat, (lo - lon) * cos_lat) <= rayon_deg
+        ]
+
+    def enregistrer(self, lat, lon, vent):
+        """
+        Enregistre le vent observé en un point.
+
+        :param lat: Latitude du point.
+        :type lat: float
+        :param lon: Longitude du point.
+        :type lon: float
+        :param vent: Vitesse du vent en km/h (None si la source n'en fournit pas).
+        :type vent: float or None
+        """
+        with self._verrou:
+            self._vents[(lat, lon)] = vent
+
+    def enregistrer_points(self, points_meteo):
+        """
+        Enregistre des points au format retourné par `tracer_chemin` (par exemple ceux d'un
+        itinéraire mémorisé, dont le calcul n'a pas rempli ce registre). Ces points ne
+        distinguent pas un échec de récupération d'une réponse sans vent : les deux sont
+        enregistrés avec un vent None.
+
+        :param points_meteo: Points météo [(lat, lon, vent_kph), ...].
+        :type points_meteo: list[tuple[float, float, float or None]]
+        """
+        with self._verrou:
+            for lat, lon, vent in points_meteo:
+                self._vents[(lat, lon)] = vent
+
+    def statistiques(self):
+        """
+        Retourne les compteurs de réutilisation.
+
+        :return: Dictionnaire avec points (observés), points_reutilises et segments_reutilises.
+        :rtype: dict
+        """
+        with self._verrou:
+            return {
+                "points": len(self._vents),
+                "points_reutilises": self.points_reutilises,
+                "segments_reutilises": self.segments_reutilises,
+            }
@@ -1,3 +1,26 @@
-from .visualisation_manager import VisualisationManager
-from .navigation_manager import NavigationManager
-from .trajectoire_manager import TrajectoireManager
\ No newline at end of file
+import importlib
+
+# Nom exporté -> module qui le définit (importé au premier accès : folium n'est chargé
+# que si VisualisationManager est utilisé)
+_EXPORTS = {
+    "VisualisationManager": "visualisation_manager",
+    "NavigationManager": "navigation_manager",
+    "SegmentChemin": "navigation_manager",
+    "TrajectoireManager": "trajectoire_manager",
+    "WaypointStore": "waypoint_store",
+    "simplifier_polyligne": "simplification",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(nom):
+    if nom in _EXPORTS:
+        valeur = getattr(importlib.import_module(f".{_EXPORTS[nom]}", __name__), nom)
+        globals()[nom] = valeur
+        return valeur
+    raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
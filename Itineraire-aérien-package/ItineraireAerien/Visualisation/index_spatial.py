@@ -0,0 +1,154 @@
+import math              # Pour les bornes angulaires des requêtes
+import numpy as np       # Pour le tri des points par cellule et le calcul des distances
+
+RAYON_TERRE_KM = 6371    # Rayon moyen de la Terre en km (identique à NavigationManager.distance)
+
+
+class GrilleSpatiale:
+    """
+    Index spatial en tuiles latitude/longitude pour les requêtes de rayon sur la sphère.
+
+    Les points sont triés par cellule (tri de type CSR) : une requête ne parcourt que les
+    cellules intersectant le cercle recherché, son coût dépend donc de la densité locale
+    et non de la taille totale du jeu de données. Le passage de l'antiméridien et la
+    proximité des pôles sont pris en compte.
+
+    :param latitudes: Latitudes des points, en degrés.
+    :type latitudes: numpy.ndarray
+    :param longitudes: Longitudes des points, en degrés.
+    :type longitudes: numpy.ndarray
+    :param taille_cellule_deg: Taille d'une cellule de la grille, en degrés.
+    :type taille_cellule_deg: float
+    """
+    def __init__(self, latitudes, longitudes, taille_cellule_deg=2.0):
+        """
+        Construit l'index à partir des coordonnées des points.
+        """
+        self.latitudes = latitudes
+        self.longitudes = longitudes
+        self.taille = taille_cellule_deg
+        self.nb_lignes = math.ceil(180 / taille_cellule_deg)
+        self.nb_colonnes = math.ceil(360 / taille_cellule_deg)
+
+        lignes = np.clip(((latitudes + 90) // taille_cellule_deg).astype(np.int64), 0, self.nb_lignes - 1)
+        colonnes = ((longitudes + 180) // taille_cellule_deg).astype(np.int64) % self.nb_colonnes
+        cellules = lignes * self.nb_colonnes + colonnes
+
+        # Points triés par cellule (tri stable : l'ordre du fichier est conservé dans chaque cellule)
+        self.ordre = np.argsort(cellules, kind='stable')
+        comptes = np.bincount(cellules, minlength=self.nb_lignes * self.nb_colonnes)
+        self.debuts = np.concatenate(([0], np.cumsum(comptes)))
+
+    def candidats(self, lat, lon, rayon_km):
+        """
+        Retourne les indices des points situés dans les cellules couvrant le cercle de recherche.
+
+        Le résultat est un sur-ensemble des points à moins de `rayon_km` : aucun point du
+        cercle n'est omis. Les indices sont triés dans l'ordre du fichier d'origine.
+
+        :param lat: Latitude du centre, en degrés.
+        :type lat: float
+        :param lon: Longitude du centre, en degrés.
+        :type lon: float
+        :param rayon_km: Rayon de recherche, en kilomètres.
+        :type rayon_km: float
+        :return: Indices des points candidats.
+        :rtype: numpy.ndarray
+        """
+        d = rayon_km / RAYON_TERRE_KM  # Rayon angulaire en radians
+        if d >= math.pi:
+            return np.arange(len(self.latitudes))
+
+        marge = 1e-9
+        d_lat = math.degrees(d) + marge
+        lat_min = max(-90.0, lat - d_lat)
+        lat_max = min(90.0, lat + d_lat)
+        ligne_min = min(int((lat_min + 90) // self.taille), self.nb_lignes - 1)
+        ligne_max = min(int((lat_max + 90) // self.taille), self.nb_lignes - 1)
+
+        # Écart de longitude maximal : sin(dlon/2) <= sin(d/2) / cos(latitude maximale de la bande)
+        cos_lat = math.cos(math.radians(max(abs(lat_min), abs(lat_max))))
+        rapport = math.sin(d / 2) / cos_lat if cos_lat > 0 else math.inf
+        if rapport >= 1:
+            blocs_colonnes = [(0, self.nb_colonnes - 1)]  # Calotte polaire : toutes les longitudes
+        else:
+            d_lon = math.degrees(2 * math.asin(rapport)) + marge
+            col_min = int((lon - d_lon + 180) // self.taille)
+            col_max = int((lon + d_lon + 180) // self.taille)
+            if col_max - col_min + 1 >= self.nb_colonnes:
+                blocs_colonnes = [(0, self.nb_colonnes - 1)]
+            else:
+                col_min %= self.nb_colonnes
+                col_max %= self.nb_colonnes
+                if col_min <= col_max:
+                    blocs_colonnes = [(col_min, col_max)]
+                else:  # Passage de l'antiméridien
+                    blocs_colonnes = [(col_min, self.nb_colonnes - 1), (0, col_max)]
+
+        morceaux = []
+        for ligne in range(ligne_min, ligne_max + 1):
+            base = ligne * self.nb_colonnes
+            for col_debut, col_fin in blocs_colonnes:
+                debut = self.debuts[base + col_debut]
+                fin = self.debuts[base + col_fin + 1]
+                if fin > debut:
+                    morceaux.append(self.ordre[debut:fin])
+
+        if not morceaux:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate(morceaux))
+
+    def dans_rayon(self, lat, lon, rayon_km):
+        """
+        Retourne les indices des points situés à au plus `rayon_km` du centre (distance Haversine).
+
+        :param lat: Latitude du centre, en degrés.
+        :type lat: float
+        :param lon: Longitude du centre, en degrés.
+        :type lon: float
+        :param rayon_km: Rayon de recherche, en kilomètres.
+        :type rayon_km: float
+        :return: Indices des points dans le cercle, triés dans l'ordre du fichier.
+        :rtype: numpy.ndarray
+        """
+        return self.voisins(lat, lon, rayon_km)[0]
+
+    def voisins(self, lat, lon, rayon_km):
+        """
+        Retourne les points situés à au plus `rayon_km` du centre, avec leur distance.
+
+        :param lat: Latitude du centre, en degrés.
+        :type lat: float
+        :param lon: Longitude du centre, en degrés.
+        :type lon: float
+        :param rayon_km: Rayon de recherche, en kilomètres.
+        :type rayon_km: float
+        :return: Indices des points dans le cercle (ordre du fichier) et distances en km.
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        """
+        candidats = self.candidats(lat, lon, rayon_km)
+        distances = distances_haversine(lat, lon, self.latitudes[candidats], self.longitudes[candidats])
+        dedans = distances <= rayon_km
+        return candidats[dedans], distances[dedans]
+
+
+def distances_haversine(lat, lon, latitudes, longitudes):
+    """
+    Calcule la distance Haversine entre un point et un ensemble de coordonnées.
+
+    :param lat: Latitude du point de référence, en degrés.
+    :type lat: float
+    :param lon: Longitude du point de référence, en degrés.
+    :type lon: float
+    :param latitudes: Latitudes des points, en degrés.
+    :type latitudes: numpy.ndarray
+    :param longitudes: Longitudes des points, en degrés.
+    :type longitudes: numpy.ndarray
+    :return: Distances en kilomètres.
+    :rtype: numpy.ndarray
+    """
+    lat1, lon1 = math.radians(lat), math.radians(lon)
+    lat2 = np.radians(latitudes)
+    lon2 = np.radians(longitudes)
+    a = np.sin((lat2 - lat1) / 2)**2 + math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2)**2
+    return RAYON_TERRE_KM * (2 * np.arcsin(np.sqrt(a)))
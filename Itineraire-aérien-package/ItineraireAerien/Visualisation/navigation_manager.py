@@ -1,5 +1,52 @@
 import math              # Pour les fonctions trigonométriques et calculs géographiques
-import pandas as pd      # Pour lire et manipuler les fichiers CSV contenant les waypoints
+import sys               # Messages de diagnostic sur la sortie d'erreur
+from typing import NamedTuple  # Pour décrire les segments produits par iterer_chemin
+import numpy as np       # Pour le calcul vectorisé des distances et angles sur tous les waypoints
+from .waypoint_store import WaypointStore  # Stockage en mémoire partagé des waypoints
+from .index_spatial import distances_haversine  # Distance orthodromique vectorisée
+from .routage_astar import RechercheAstar  # Recherche A* sur le graphe des waypoints
+from ..statistiques_route import phase, incrementer  # Mesures optionnelles du calcul d'itinéraire
+
+# Planification du mode astar_meteo (voir NavigationManager.tracer_chemin_astar_meteo)
+RAYON_ESTIMATION_KM = 100   # Portée d'un relevé de vent dans l'estimation du vent aux waypoints voisins
+PENALITE_REFUS_ESTIME = 10  # Facteur de coût d'un waypoint dont le vent estimé dépasse le seuil
+RISQUE_INCONNU = 2          # Vent supposé (en multiple du seuil) d'un waypoint sans relevé proche
+DETOUR_MAX = 2              # Coût maximal d'un plan, relatif au premier plan, avant abandon
+
+
+def _signaler_barriere(statistiques):
+    """
+    Signale qu'aucun waypoint praticable ne permet de continuer : compteur ``navigation.barrieres``
+    et message sur la sortie d'erreur (la sortie standard reste réservée aux résultats des traitements par lot).
+    """
+    incrementer(statistiques, "navigation.barrieres")
+    print("Aucun point trouvé, barrière météo ou géographique.", file=sys.stderr)
+
+
+class SegmentChemin(NamedTuple):
+    """
+    Segment jugé pendant le calcul d'un itinéraire (voir :meth:`NavigationManager.iterer_chemin`).
+
+    :param accepte: True si la météo du segment est acceptable.
+    :param origine: Point de départ du segment (latitude, longitude).
+    :param destination: Waypoint visé (latitude, longitude).
+    :param coordonnees: Points du segment dont la météo a été examinée.
+    :param donnees_meteo: Données météo par point [(lat, lon, vent_kph), ...].
+    :param vent_max: Vent maximal relevé sur le segment, en km/h.
+    :param vent_max_total: Vent maximal relevé depuis le début du calcul, en km/h.
+    :param segments_acceptes: Nombre de segments acceptés jusqu'ici (celui-ci compris).
+    :param segments_refuses: Nombre de segments refusés jusqu'ici (celui-ci compris).
+    """
+    accepte: bool
+    origine: tuple
+    destination: tuple
+    coordonnees: list
+    donnees_meteo: list
+    vent_max: float
+    vent_max_total: float
+    segments_acceptes: int
+    segments_refuses: int
+
 
 class NavigationManager:
     """
@@ -12,13 +59,28 @@ class NavigationManager:
     :type waypoint_csv: str
     :param rayon_max_km: Distance maximale autorisée entre deux waypoints.
     :type rayon_max_km: float
+    :param espacement_km: Espacement visé entre deux points de vérification météo d'un segment.
+    :type espacement_km: float
+    :param min_points: Nombre minimal de points intercalés par segment (avec la tolérance par défaut
+                       de deux dépassements, il en faut au moins 3 pour qu'un segment puisse être refusé).
+    :type min_points: int
+    :param max_points: Nombre maximal de points intercalés par segment.
+    :type max_points: int
     """
-    def __init__(self, waypoint_csv='Data/Waypoints.csv', rayon_max_km=200):
+    def __init__(self, waypoint_csv='Data/Waypoints.csv', rayon_max_km=200, espacement_km=30,
+                 min_points=3, max_points=6):
         """
         Initialise un gestionnaire de navigation avec les paramètres fournis.
+
+        Les waypoints ne sont pas relus à chaque étape : ils proviennent d'un stockage
+        en mémoire partagé par toutes les instances utilisant le même fichier.
         """
         self.waypoint_csv = waypoint_csv
         self.rayon_max_km = rayon_max_km
+        self.espacement_km = espacement_km
+        self.min_points = min_points
+        self.max_points = max_points
+        self.waypoints = WaypointStore.partage(waypoint_csv)
 
     def distance(self, p1, p2):
         """
@@ -63,35 +125,121 @@ class NavigationManager:
         cos_theta = dot / (norm1 * norm2)
         return math.acos(max(min(cos_theta, 1), -1))  # angle en radians (entre 0 et pi)
 
-    def intercaler_points(self, lat1, lon1, lat2, lon2, n):
+    def distances_vectorisees(self, depart, latitudes, longitudes):
+        """
+        Calcule en une seule opération la distance (Haversine) entre un point et un ensemble de coordonnées.
+
+        Version vectorisée de :meth:`distance`, appliquée à des tableaux NumPy.
+
+        :param depart: Coordonnée de référence (latitude, longitude).
+        :type depart: tuple[float, float]
+        :param latitudes: Latitudes des points, en degrés.
+        :type latitudes: numpy.ndarray
+        :param longitudes: Longitudes des points, en degrés.
+        :type longitudes: numpy.ndarray
+        :return: Distances en kilomètres.
+        :rtype: numpy.ndarray
         """
-        Génère `n` points intermédiaires équidistants entre deux points.
+        return distances_haversine(depart[0], depart[1], latitudes, longitudes)
+
+    def angles_vectorises(self, depart, latitudes, longitudes, arrivee):
+        """
+        Calcule en une seule opération l'angle (départ → waypoint, départ → arrivée) pour un ensemble de waypoints.
+
+        Version vectorisée de :meth:`calcul_angle` : les waypoints confondus avec le départ
+        (ou un départ confondu avec l'arrivée) reçoivent un angle infini.
+
+        :param depart: Coordonnée de départ.
+        :type depart: tuple[float, float]
+        :param latitudes: Latitudes des waypoints.
+        :type latitudes: numpy.ndarray
+        :param longitudes: Longitudes des waypoints.
+        :type longitudes: numpy.ndarray
+        :param arrivee: Coordonnée finale (destination).
+        :type arrivee: tuple[float, float]
+        :return: Angles en radians (entre 0 et pi, ou inf).
+        :rtype: numpy.ndarray
+        """
+        v1_lat = latitudes - depart[0]
+        v1_lon = longitudes - depart[1]
+        v2 = (arrivee[0] - depart[0], arrivee[1] - depart[1])
+        norm2 = math.hypot(*v2)
+        if norm2 == 0:
+            return np.full(len(latitudes), np.inf)
+        dot = v1_lat * v2[0] + v1_lon * v2[1]  # produits scalaires
+        norm1 = np.hypot(v1_lat, v1_lon)       # normes des vecteurs départ → waypoint
+        angles = np.full(len(latitudes), np.inf)
+        valides = norm1 != 0                   # évite division par zéro
+        cos_theta = dot[valides] / (norm1[valides] * norm2)
+        angles[valides] = np.arccos(np.clip(cos_theta, -1, 1))
+        return angles
+
+    def nombre_points_intercales(self, distance_km):
+        """
+        Retourne le nombre de points à intercaler sur un segment pour respecter `espacement_km`.
+
+        :param distance_km: Longueur du segment, en kilomètres.
+        :type distance_km: float
+        :return: Nombre de points, borné par `min_points` et `max_points`.
+        :rtype: int
+        """
+        n = math.ceil(distance_km / self.espacement_km) - 1
+        return max(self.min_points, min(self.max_points, n))
+
+    def intercaler_points(self, lat1, lon1, lat2, lon2, n=None):
+        """
+        Génère `n` points intermédiaires équidistants sur l'orthodromie entre deux points.
+
+        Les points sont obtenus par interpolation sphérique (slerp) : ils restent sur le grand
+        cercle reliant les deux points, même sur les longs segments.
 
         :param lat1: Latitude du point de départ.
         :param lon1: Longitude du point de départ.
         :param lat2: Latitude du point d’arrivée.
         :param lon2: Longitude du point d’arrivée.
-        :param n: Nombre de points à générer.
-        :type n: int
+        :param n: Nombre de points à générer (par défaut, selon la longueur du segment,
+                  voir :meth:`nombre_points_intercales`).
+        :type n: int or None
         :return: Liste de coordonnées (lat, lon).
         :rtype: list[tuple[float, float]]
         """
-        points_intercale = []
-        for i in range(1, n + 1):
-            x = lat1 + i * (lat2 - lat1) / (n + 1)
-            y = lon1 + i * (lon2 - lon1) / (n + 1)
-            points_intercale.append((x, y))
-        return points_intercale
+        phi = np.radians([lat1, lat2])
+        lam = np.radians([lon1, lon2])
+        # Vecteurs unitaires des deux extrémités
+        a, b = np.column_stack((np.cos(phi) * np.cos(lam), np.cos(phi) * np.sin(lam), np.sin(phi)))
+        omega = math.atan2(np.linalg.norm(np.cross(a, b)), float(np.dot(a, b)))  # Angle au centre
+
+        if n is None:
+            n = self.nombre_points_intercales(6371 * omega)
+        f = np.arange(1, n + 1) / (n + 1)
+
+        if math.sin(omega) < 1e-12:
+            # Points confondus (ou antipodaux) : interpolation linéaire
+            latitudes = lat1 + f * (lat2 - lat1)
+            longitudes = lon1 + f * (lon2 - lon1)
+        else:
+            poids_a = np.sin((1 - f) * omega) / math.sin(omega)
+            poids_b = np.sin(f * omega) / math.sin(omega)
+            points = poids_a[:, None] * a + poids_b[:, None] * b
+            latitudes = np.degrees(np.arctan2(points[:, 2], np.hypot(points[:, 0], points[:, 1])))
+            longitudes = np.degrees(np.arctan2(points[:, 1], points[:, 0]))
+        return list(zip(latitudes.tolist(), longitudes.tolist()))
 
     def charger_waypoints(self):
         """
-        Charge les waypoints depuis le fichier CSV.
+        Retourne les waypoints du stockage partagé sous forme de DataFrame.
 
         :return: DataFrame contenant les colonnes : ident, latitude_deg, longitude_deg.
         :rtype: pandas.DataFrame
         """
-        df = pd.read_csv(self.waypoint_csv)
-        return df[['ident', 'latitude_deg', 'longitude_deg']].dropna()
+        import pandas as pd  # Importé à la demande : le calcul d'itinéraire n'en a pas besoin
+        donnees = self.waypoints.donnees()
+        df = pd.DataFrame({
+            'ident': donnees.idents,
+            'latitude_deg': donnees.latitudes,
+            'longitude_deg': donnees.longitudes,
+        })
+        return df.dropna()
 
     def trouver_point_suivant(self, depart, arrivee, points_utilises):
         """
@@ -109,41 +257,97 @@ class NavigationManager:
         :return: Coordonnée du prochain waypoint ou None si aucun trouvé.
         :rtype: tuple[float, float] or None
         """
-        df = pd.read_csv(self.waypoint_csv)[['latitude_deg', 'longitude_deg']].dropna()
+        # Seuls les waypoints des tuiles couvrant le rayon maximal sont évalués
+        donnees = self.waypoints.donnees()
+        candidats = donnees.grille().candidats(depart[0], depart[1], self.rayon_max_km)
+        latitudes = donnees.latitudes[candidats]
+        longitudes = donnees.longitudes[candidats]
 
         # Exclut les points déjà utilisés
-        df = df[~df.apply(lambda row: (row['latitude_deg'], row['longitude_deg']) in points_utilises, axis=1)]
+        disponibles = np.ones(len(latitudes), dtype=bool)
+        for lat_u, lon_u in points_utilises:
+            disponibles &= ~((latitudes == lat_u) & (longitudes == lon_u))
 
         # Évite de sélectionner le point d’arrivée comme waypoint
-        df = df[~df.apply(lambda row: (
-            round(row['latitude_deg'], 5), round(row['longitude_deg'], 5)) == (
-            round(arrivee[0], 5), round(arrivee[1], 5)), axis=1)]
+        # (pré-filtre vectorisé, puis arrondi exact sur les quelques points proches)
+        arrivee_arrondie = (round(arrivee[0], 5), round(arrivee[1], 5))
+        proches = np.flatnonzero((np.abs(latitudes - arrivee[0]) < 1e-4) & (np.abs(longitudes - arrivee[1]) < 1e-4))
+        for i in proches:
+            if (round(latitudes[i], 5), round(longitudes[i], 5)) == arrivee_arrondie:
+                disponibles[i] = False
 
-        if df.empty:
+        if not disponibles.any():
             return None  # Aucun point utilisable
 
-        # Calcule l’angle et la distance par rapport à l’objectif
-        df['angle'] = df.apply(lambda row: self.calcul_angle(
-            depart, (row['latitude_deg'], row['longitude_deg']), arrivee), axis=1)
-        df['distance'] = df.apply(lambda row: self.distance(
-            depart, (row['latitude_deg'], row['longitude_deg'])), axis=1)
+        # Calcule l’angle et la distance par rapport à l’objectif pour tous les waypoints à la fois
+        angles = self.angles_vectorises(depart, latitudes, longitudes, arrivee)
+        distances = self.distances_vectorisees(depart, latitudes, longitudes)
 
         # Filtre les points proches et orientés dans la bonne direction
-        df_filtre = df[(df['angle'] <= math.radians(179)) & (df['distance'] <= self.rayon_max_km)]
+        filtre = disponibles & (angles <= math.radians(179)) & (distances <= self.rayon_max_km)
 
-        if df_filtre.empty:
+        if not filtre.any():
             return None
 
-        # Choisit le point avec le plus petit angle (donc le plus droit vers la cible)
-        point_choisi = df_filtre.loc[df_filtre['angle'].idxmin()]
-        return point_choisi['latitude_deg'], point_choisi['longitude_deg']
+        # Choisit le point avec le plus petit angle (donc le plus droit vers la cible) ;
+        # en cas d'égalité, le premier point du fichier est retenu
+        retenus = np.flatnonzero(filtre)
+        i_choisi = retenus[np.argmin(angles[retenus])]
+        return float(latitudes[i_choisi]), float(longitudes[i_choisi])
+
+    def classer_points_suivants(self, depart, arrivee):
+        """
+        Classe les waypoints candidats depuis un point, du plus pertinent au moins pertinent,
+        selon les critères de :meth:`trouver_point_suivant`, sans tenir compte des points déjà utilisés.
+
+        Le classement ne dépend que du point et de l'arrivée : il peut être calculé une fois, puis
+        servir à plusieurs itinéraires passant par ce point. Le premier point du classement qui
+        n'a pas encore été utilisé est celui que retournerait :meth:`trouver_point_suivant`.
+
+        :param depart: Coordonnée actuelle (latitude, longitude).
+        :type depart: tuple[float, float]
+        :param arrivee: Coordonnée cible (latitude, longitude).
+        :type arrivee: tuple[float, float]
+        :return: Coordonnées des waypoints candidats, par angle croissant (à angle égal, dans
+                 l'ordre du fichier).
+        :rtype: list[tuple[float, float]]
+        """
+        donnees = self.waypoints.donnees()
+        candidats = donnees.grille().candidats(depart[0], depart[1], self.rayon_max_km)
+        latitudes = donnees.latitudes[candidats]
+        longitudes = donnees.longitudes[candidats]
+
+        angles = self.angles_vectorises(depart, latitudes, longitudes, arrivee)
+        distances = self.distances_vectorisees(depart, latitudes, longitudes)
+        filtre = (angles <= math.radians(179)) & (distances <= self.rayon_max_km)
 
-    def tracer_chemin(self, depart, arrivee, seuil, verifier_meteo_callback):
+        # Évite de proposer le point d’arrivée comme waypoint
+        arrivee_arrondie = (round(arrivee[0], 5), round(arrivee[1], 5))
+        proches = np.flatnonzero((np.abs(latitudes - arrivee[0]) < 1e-4) & (np.abs(longitudes - arrivee[1]) < 1e-4))
+        for i in proches:
+            if (round(latitudes[i], 5), round(longitudes[i], 5)) == arrivee_arrondie:
+                filtre[i] = False
+
+        retenus = np.flatnonzero(filtre)
+        ordre = retenus[np.argsort(angles[retenus], kind="stable")]
+        return list(zip(latitudes[ordre].tolist(), longitudes[ordre].tolist()))
+
+    def tracer_chemin(self, depart, arrivee, seuil, verifier_meteo_callback, mode="glouton",
+                      statistiques=None):
         """
         Construit une trajectoire entre deux points, en choisissant des waypoints,
         en vérifiant les conditions météo sur les segments et en s’arrêtant
         en cas d’obstacle météo.
 
+        Deux modes de routage sont disponibles :
+
+        - ``"glouton"`` : à chaque étape, le waypoint le plus aligné avec l'arrivée est choisi.
+        - ``"astar"`` : plus court chemin A* sur le graphe des waypoints (voir :meth:`tracer_chemin_astar`).
+        - ``"astar_meteo"`` : A* dont le coût intègre une pénalité de vent, évaluée paresseusement
+          (voir :meth:`tracer_chemin_astar_meteo`).
+
+        Pour suivre le calcul au fur et à mesure (ou l'interrompre), voir :meth:`iterer_chemin`.
+
         :param depart: Coordonnée de départ (latitude, longitude).
         :type depart: tuple[float, float]
         :param arrivee: Coordonnée de destination (latitude, longitude).
@@ -153,38 +357,491 @@ class NavigationManager:
         :param verifier_meteo_callback: Fonction callback qui prend une liste de points et un seuil,
                                         et retourne (bool, coordonnées, données météo, vent max).
         :type verifier_meteo_callback: Callable
+        :param mode: Mode de routage, ``"glouton"`` (par défaut), ``"astar"`` ou ``"astar_meteo"``.
+        :type mode: str
+        :param statistiques: Si fourni, reçoit la durée de chaque phase (``navigation.*``) et les
+                             compteurs d'itérations, de waypoints refusés et de barrières rencontrées
+                             (``navigation.barrieres`` : aucun waypoint praticable pour continuer).
+        :type statistiques: StatistiquesRoute or None
         :return:
             - `list[list[tuple[float, float]]]` : Liste de segments valides.
             - `list[tuple[float, float, float]]` : Données météo par point.
             - `float` : Vent max détecté.
         :rtype: tuple[list, list, float]
+        :raises ValueError: Si le mode de routage est inconnu.
+        """
+        with phase(statistiques, "navigation.total"):
+            segments = self.iterer_chemin(depart, arrivee, seuil, verifier_meteo_callback, mode=mode,
+                                          statistiques=statistiques)
+            return self.assembler_chemin(segments, arrivee)
+
+    def iterer_chemin(self, depart, arrivee, seuil, verifier_meteo_callback, mode="glouton",
+                      statistiques=None):
+        """
+        Version progressive de :meth:`tracer_chemin` : retourne un itérateur qui produit chaque
+        segment (accepté ou refusé) dès que la météo l'a jugé.
+
+        Le calcul n'avance qu'à la demande : si l'appelant cesse d'itérer (``break``, ou
+        ``close()`` sur l'itérateur), aucune autre vérification météo n'est lancée. En mode
+        ``"astar_meteo"``, les segments refusés sont produits au fil de leur évaluation ; ceux de
+        la trajectoire ne sont connus qu'à la fin de la recherche et sont alors produits d'un coup.
+
+        :meth:`assembler_chemin` reconstruit à partir des segments produits le résultat de
+        :meth:`tracer_chemin`.
+
+        :param depart: Coordonnée de départ (latitude, longitude).
+        :type depart: tuple[float, float]
+        :param arrivee: Coordonnée de destination (latitude, longitude).
+        :type arrivee: tuple[float, float]
+        :param seuil: Seuil météorologique à ne pas dépasser (ex: vent maximal en km/h).
+        :type seuil: float
+        :param verifier_meteo_callback: Fonction callback (voir :meth:`tracer_chemin`).
+        :type verifier_meteo_callback: Callable
+        :param mode: Mode de routage, ``"glouton"`` (par défaut), ``"astar"`` ou ``"astar_meteo"``.
+        :type mode: str
+        :param statistiques: Statistiques à alimenter (voir :meth:`tracer_chemin`), ou None.
+        :type statistiques: StatistiquesRoute or None
+        :return: Itérateur des segments, dans l'ordre où ils sont jugés.
+        :rtype: Iterator[SegmentChemin]
+        :raises ValueError: Si le mode de routage est inconnu.
+        """
+        if mode == "astar":
+            iterer = self._iterer_chemin_astar
+        elif mode == "astar_meteo":
+            iterer = self._iterer_chemin_astar_meteo
+        elif mode == "glouton":
+            iterer = self._iterer_chemin_glouton
+        else:
+            raise ValueError(f"Mode de routage inconnu : {mode}")
+
+        with phase(statistiques, "navigation.chargement_waypoints"):
+            self.waypoints.donnees()  # Premier appel : lecture du CSV ; ensuite, simple vérification
+        return iterer(depart, arrivee, seuil, verifier_meteo_callback, statistiques=statistiques)
+
+    @staticmethod
+    def assembler_chemin(segments, arrivee):
+        """
+        Assemble les segments produits par :meth:`iterer_chemin` en une trajectoire.
+
+        :param segments: Segments jugés (accepté ou refusé), dans l'ordre de production.
+        :type segments: Iterable[SegmentChemin]
+        :param arrivee: Coordonnée de destination (latitude, longitude), ajoutée en fin de trajectoire.
+        :type arrivee: tuple[float, float]
+        :return: Même résultat que :meth:`tracer_chemin` (segments valides, données météo, vent max).
+        :rtype: tuple[list, list, float]
         """
-        point = depart
-        liste_point_utilisees = []  # Waypoints déjà utilisés
         liste_finale = []  # Segments finaux de la trajectoire
         liste_points_meteo = []  # Infos météo associées à chaque segment
         vent_max_tot = 0  # Vent max global détecté
+        for segment in segments:
+            vent_max_tot = segment.vent_max_total
+            if segment.accepte:
+                liste_finale.append(segment.coordonnees)
+                liste_finale.append([segment.destination])
+                liste_points_meteo.extend(segment.donnees_meteo)
+
+        liste_finale.append([arrivee])  # Ajoute l’arrivée à la fin
+        return liste_finale, liste_points_meteo, vent_max_tot
+
+    def _iterer_chemin_glouton(self, depart, arrivee, seuil, verifier_meteo_callback, statistiques=None):
+        """
+        Routage glouton de :meth:`iterer_chemin` : à chaque étape, le waypoint le plus aligné
+        avec l'arrivée est proposé, puis accepté ou refusé selon la météo du segment.
+        """
+        point = depart
+        liste_point_utilisees = []  # Waypoints déjà utilisés
+        vent_max_tot = 0  # Vent max global détecté
+        acceptes = refuses = 0
 
         while self.distance(point, arrivee) > 75:  # Tant que l’arrivée n’est pas proche
-            prochain_point = self.trouver_point_suivant(point, arrivee, liste_point_utilisees)
+            incrementer(statistiques, "navigation.iterations")
+            with phase(statistiques, "navigation.selection_waypoint"):
+                prochain_point = self.trouver_point_suivant(point, arrivee, liste_point_utilisees)
             if prochain_point is None:
-                print("Aucun point trouvé, barrière météo ou géographique.")
+                _signaler_barriere(statistiques)
                 break
 
             # Interpolation de points sur le segment (pour vérification météo)
-            coord_seg = self.intercaler_points(point[0], point[1], prochain_point[0], prochain_point[1], 6)
-            Etat, liste_coordonnees, donnees_meteo, vent_max = verifier_meteo_callback(coord_seg, seuil)
+            with phase(statistiques, "navigation.interpolation"):
+                coord_seg = self.intercaler_points(point[0], point[1], prochain_point[0], prochain_point[1])
+            with phase(statistiques, "navigation.meteo"):
+                Etat, liste_coordonnees, donnees_meteo, vent_max = verifier_meteo_callback(coord_seg, seuil)
 
             vent_max_tot = max(vent_max_tot, vent_max)
+            liste_point_utilisees.append(prochain_point)  # Accepté ou non, ce point ne sera plus proposé
 
             if Etat:  # Le segment est praticable
-                liste_finale.append(liste_coordonnees)
-                liste_finale.append([prochain_point])
-                liste_points_meteo.extend(donnees_meteo)
-                liste_point_utilisees.append(prochain_point)
-                point = prochain_point
+                acceptes += 1
+                incrementer(statistiques, "navigation.segments_acceptes")
             else:  # Le segment est interdit, on ne prend pas ce point
-                liste_point_utilisees.append(prochain_point)
+                refuses += 1
+                incrementer(statistiques, "navigation.waypoints_refuses")
+            yield SegmentChemin(bool(Etat), point, prochain_point, liste_coordonnees, donnees_meteo,
+                                vent_max, vent_max_tot, acceptes, refuses)
+            if Etat:
+                point = prochain_point
 
-        liste_finale.append([arrivee])  # Ajoute l’arrivée à la fin
-        return liste_finale, liste_points_meteo, vent_max_tot
+    def balayer_seuils(self, depart, arrivee, seuils, verifier_meteo_callback, max_depassements=2,
+                       statistiques=None):
+        """
+        Calcule en une seule passe l'itinéraire glouton de chacun des seuils fournis (par exemple
+        le vent admissible de chaque avion de la flotte).
+
+        Tant que deux seuils prennent les mêmes décisions, leurs itinéraires sont identiques :
+        les seuils sont donc regroupés en branches, qui partagent le choix des waypoints et la
+        météo de chaque segment. Les waypoints candidats depuis un point sont classés une seule
+        fois (voir :meth:`classer_points_suivants`), pour toutes les branches qui y passent.
+
+        Un segment refusé pour un seuil l'est aussi pour tous les seuils inférieurs, et au plus
+        tard au même point. La météo d'un segment est donc demandée une seule fois, pour le seuil
+        le plus haut de la branche : les points obtenus suffisent à juger le segment pour chacun
+        des autres seuils avec :func:`juger_segment`. Une branche se sépare au plus en deux, les
+        seuils bas (segment refusé) et les seuils hauts (segment accepté) ; il y a donc au plus
+        autant de branches que de seuils distincts. Un segment déjà évalué par une autre branche
+        n'est redemandé que si elle l'avait refusé pour un seuil plus bas.
+
+        Le résultat de chaque seuil est identique à celui de :meth:`tracer_chemin` en mode
+        glouton, pour une source météo déterministe.
+
+        :param depart: Coordonnée de départ (latitude, longitude).
+        :type depart: tuple[float, float]
+        :param arrivee: Coordonnée de destination (latitude, longitude).
+        :type arrivee: tuple[float, float]
+        :param seuils: Seuils météorologiques (vent maximal en km/h), dans un ordre quelconque.
+        :type seuils: Iterable[float]
+        :param verifier_meteo_callback: Fonction callback (voir :meth:`tracer_chemin`) ; elle doit
+                                        retourner le vent de chaque point examiné (pas de
+                                        vérification par risque).
+        :type verifier_meteo_callback: Callable
+        :param max_depassements: Nombre maximal de points autorisés à dépasser le seuil sur un
+                                 segment (doit être celui utilisé par le callback).
+        :type max_depassements: int
+        :param statistiques: Statistiques à alimenter (voir :meth:`tracer_chemin`), avec en plus les
+                             compteurs ``balayage.*`` (branches, segments évalués et réutilisés).
+        :type statistiques: StatistiquesRoute or None
+        :return: Pour chaque seuil, par ordre croissant, le résultat de :meth:`tracer_chemin`.
+        :rtype: dict[float, tuple[list, list, float]]
+        """
+        from ..Meteo.meteo_manager import juger_segment  # Importé à la demande, avec la source météo
+
+        seuils_tries = sorted(set(seuils))
+        resultats = {}
+        with phase(statistiques, "navigation.total"):
+            with phase(statistiques, "navigation.chargement_waypoints"):
+                self.waypoints.donnees()
+            # (origine, destination) -> seuil demandé, décision, points examinés et leur vent
+            segments_evalues = {}
+            classements = {}  # Point -> waypoints candidats, du plus pertinent au moins pertinent
+            vents_max_tot = dict.fromkeys(seuils_tries, 0)  # Vent max global détecté, par seuil
+
+            # Branche : seuils ayant pris les mêmes décisions (croissants), point courant,
+            # waypoints déjà utilisés, segments de la trajectoire et données météo associées
+            branches = [(seuils_tries, depart, set(), [], [])] if seuils_tries else []
+            while branches:
+                groupe, point, utilises, liste_finale, liste_points_meteo = branches.pop()
+                incrementer(statistiques, "balayage.branches")
+
+                while self.distance(point, arrivee) > 75:  # Tant que l’arrivée n’est pas proche
+                    incrementer(statistiques, "navigation.iterations")
+                    with phase(statistiques, "navigation.selection_waypoint"):
+                        if point not in classements:
+                            classements[point] = self.classer_points_suivants(point, arrivee)
+                        prochain_point = next((p for p in classements[point] if p not in utilises), None)
+                    if prochain_point is None:
+                        _signaler_barriere(statistiques)
+                        break
+
+                    # Les points examinés pour un seuil suffisent pour tout seuil inférieur ;
+                    # si le segment a été accepté, ils suffisent pour tous les seuils
+                    cle = (point, prochain_point)
+                    evalue = segments_evalues.get(cle)
+                    if evalue is not None and (evalue[1] or groupe[-1] <= evalue[0]):
+                        incrementer(statistiques, "balayage.segments_reutilises")
+                    else:
+                        with phase(statistiques, "navigation.interpolation"):
+                            coord_seg = self.intercaler_points(point[0], point[1], prochain_point[0],
+                                                               prochain_point[1])
+                        with phase(statistiques, "navigation.meteo"):
+                            Etat, liste_coordonnees, donnees_meteo, _ = verifier_meteo_callback(coord_seg,
+                                                                                              groupe[-1])
+                        evalue = (groupe[-1], bool(Etat), liste_coordonnees,
+                                  [vent for _, _, vent in donnees_meteo])
+                        segments_evalues[cle] = evalue
+                        incrementer(statistiques, "balayage.segments_evalues")
+                    _, _, coordonnees, vents = evalue
+                    utilises.add(prochain_point)  # Accepté ou non, ce point ne sera plus proposé
+
+                    # Jugement pour chaque seuil : les refus précèdent les acceptations
+                    refuses, acceptes = [], []
+                    for seuil in groupe:
+                        Etat, liste_coordonnees, donnees_seuil, vent_max = juger_segment(
+                            coordonnees, vents, seuil, max_depassements)
+                        vents_max_tot[seuil] = max(vents_max_tot[seuil], vent_max)
+                        if Etat:
+                            acceptes.append(seuil)
+                            segment_accepte = liste_coordonnees, donnees_seuil
+                        else:
+                            refuses.append(seuil)
+
+                    if acceptes:
+                        incrementer(statistiques, "navigation.segments_acceptes")
+                    if refuses:
+                        incrementer(statistiques, "navigation.waypoints_refuses")
+                    if acceptes and refuses:
+                        # Décisions divergentes : les seuils hauts poursuivent dans une nouvelle branche
+                        branches.append((acceptes, prochain_point, set(utilises),
+                                         liste_finale + [segment_accepte[0], [prochain_point]],
+                                         liste_points_meteo + segment_accepte[1]))
+                        groupe = refuses
+                    elif acceptes:
+                        liste_finale.append(segment_accepte[0])
+                        liste_finale.append([prochain_point])
+                        liste_points_meteo.extend(segment_accepte[1])
+                        point = prochain_point
+
+                liste_finale.append([arrivee])  # Ajoute l’arrivée à la fin
+                for seuil in groupe:
+                    resultats[seuil] = list(liste_finale), list(liste_points_meteo), vents_max_tot[seuil]
+
+        return {seuil: resultats[seuil] for seuil in seuils_tries}
+
+    def tracer_chemin_astar(self, depart, arrivee, seuil, verifier_meteo_callback, statistiques=None):
+        """
+        Construit une trajectoire par recherche A* sur le graphe des waypoints.
+
+        Le graphe (arêtes entre waypoints distants d'au plus `rayon_max_km`) est construit une
+        seule fois par jeu de waypoints. Le plus court chemin vers l'arrivée est ensuite vérifié
+        segment par segment avec `verifier_meteo_callback` ; un segment refusé est retiré du
+        graphe et la recherche reprend depuis le dernier waypoint accepté. Les recherches
+        successives partagent leur état (voir :class:`RechercheAstar`) : une reprise ne développe
+        que les waypoints touchés par le segment refusé.
+
+        Le nombre de recherches et de nœuds développés est reporté dans `statistiques`
+        (``navigation.recherches_astar`` et ``navigation.expansions_astar``).
+
+        Le résultat a la même structure que :meth:`tracer_chemin` en mode glouton.
+
+        :param depart: Coordonnée de départ (latitude, longitude).
+        :type depart: tuple[float, float]
+        :param arrivee: Coordonnée de destination (latitude, longitude).
+        :type arrivee: tuple[float, float]
+        :param seuil: Seuil météorologique à ne pas dépasser (ex: vent maximal en km/h).
+        :type seuil: float
+        :param verifier_meteo_callback: Fonction callback qui prend une liste de points et un seuil,
+                                        et retourne (bool, coordonnées, données météo, vent max).
+        :type verifier_meteo_callback: Callable
+        :param statistiques: Statistiques à alimenter (voir :meth:`tracer_chemin`), ou None.
+        :type statistiques: StatistiquesRoute or None
+        :return:
+            - `list[list[tuple[float, float]]]` : Liste de segments valides.
+            - `list[tuple[float, float, float]]` : Données météo par point.
+            - `float` : Vent max détecté.
+        :rtype: tuple[list, list, float]
+        """
+        return self.assembler_chemin(
+            self._iterer_chemin_astar(depart, arrivee, seuil, verifier_meteo_callback, statistiques), arrivee)
+
+    def _iterer_chemin_astar(self, depart, arrivee, seuil, verifier_meteo_callback, statistiques=None):
+        """
+        Routage A* de :meth:`iterer_chemin` (voir :meth:`tracer_chemin_astar`).
+        """
+        donnees = self.waypoints.donnees()
+        recherche = RechercheAstar(donnees.graphe(self.rayon_max_km), arrivee)
+
+        point = depart
+        noeud = None                 # Waypoint courant (None tant que l’on est au départ)
+        noeuds_utilises = []         # Waypoints déjà intégrés à la trajectoire
+        aretes_interdites = set()    # Segments refusés par la météo
+        vent_max_tot = 0
+        acceptes = refuses = 0
+
+        while True:
+            incrementer(statistiques, "navigation.iterations")
+            with phase(statistiques, "navigation.recherche_astar"):
+                chemin, _, nb_expansions = recherche.rechercher(
+                    point, noeud_depart=noeud, exclus=noeuds_utilises, aretes_interdites=aretes_interdites)
+            incrementer(statistiques, "navigation.recherches_astar")
+            incrementer(statistiques, "navigation.expansions_astar", nb_expansions)
+            if chemin is None:
+                _signaler_barriere(statistiques)
+                break
+
+            for suivant in chemin:
+                prochain_point = (float(donnees.latitudes[suivant]), float(donnees.longitudes[suivant]))
+                with phase(statistiques, "navigation.interpolation"):
+                    coord_seg = self.intercaler_points(point[0], point[1], prochain_point[0], prochain_point[1])
+                with phase(statistiques, "navigation.meteo"):
+                    Etat, liste_coordonnees, donnees_meteo, vent_max = verifier_meteo_callback(coord_seg, seuil)
+
+                vent_max_tot = max(vent_max_tot, vent_max)
+
+                if not Etat:  # Segment interdit : on relance la recherche sans lui
+                    aretes_interdites.add((noeud, suivant))
+                    refuses += 1
+                    incrementer(statistiques, "navigation.waypoints_refuses")
+                    yield SegmentChemin(False, point, prochain_point, liste_coordonnees, donnees_meteo,
+                                        vent_max, vent_max_tot, acceptes, refuses)
+                    break
+
+                acceptes += 1
+                incrementer(statistiques, "navigation.segments_acceptes")
+                yield SegmentChemin(True, point, prochain_point, liste_coordonnees, donnees_meteo,
+                                    vent_max, vent_max_tot, acceptes, refuses)
+                noeuds_utilises.append(suivant)
+                noeud, point = suivant, prochain_point
+            else:
+                break  # Tous les segments du chemin sont praticables
+
+    def tracer_chemin_astar_meteo(self, depart, arrivee, seuil, verifier_meteo_callback,
+                                  poids_vent=0.5, facteur_heuristique=2.0, statistiques=None):
+        """
+        Construit une trajectoire par recherche A* dont le coût combine distance et vent.
+
+        Le coût d'un segment accepté par `verifier_meteo_callback` vaut
+        ``distance * (1 + poids_vent * vent_max / seuil)`` ; un segment refusé est interdit.
+        Avec une vérification qui s'arrête dès la décision acquise (``par_risque``), `vent_max`
+        n'est qu'un minorant : les coûts, et donc le chemin retenu, peuvent différer de ceux
+        obtenus avec une vérification complète.
+
+        La météo n'est demandée que pour les segments du chemin planifié. Le plan est calculé
+        avec les coûts connus pour les segments déjà évalués et, pour les autres, avec un coût
+        estimé à partir des relevés de vent déjà obtenus (moyenne pondérée par l'inverse du carré
+        de la distance, dans un rayon de `RAYON_ESTIMATION_KM`) : un waypoint dont le vent estimé
+        dépasse le seuil coûte `PENALITE_REFUS_ESTIME` fois sa distance. Sans relevé proche, le
+        coût estimé est la distance seule.
+
+        Les segments du plan non encore évalués sont vérifiés du plus risqué au moins risqué
+        (les segments sans relevé proche d'abord) : dès qu'un segment est refusé, le chemin est
+        replanifié avec les coûts mis à jour (voir :class:`RechercheAstar`). Chaque segment n'est
+        évalué qu'une seule fois. Le calcul s'arrête lorsque tous les segments du plan sont
+        acceptés, ou lorsque le plan coûte plus de `DETOUR_MAX` fois le premier plan (barrière
+        météo) : seuls les segments refusés sont alors produits.
+
+        Le résultat a la même structure que :meth:`tracer_chemin` en mode glouton.
+
+        :param depart: Coordonnée de départ (latitude, longitude).
+        :type depart: tuple[float, float]
+        :param arrivee: Coordonnée de destination (latitude, longitude).
+        :type arrivee: tuple[float, float]
+        :param seuil: Seuil météorologique à ne pas dépasser (ex: vent maximal en km/h).
+        :type seuil: float
+        :param verifier_meteo_callback: Fonction callback qui prend une liste de points et un seuil,
+                                        et retourne (bool, coordonnées, données météo, vent max).
+        :type verifier_meteo_callback: Callable
+        :param poids_vent: Poids de la pénalité de vent dans le coût d'un segment.
+        :type poids_vent: float
+        :param facteur_heuristique: Pondération de l'heuristique de chaque planification (voir
+                                    :meth:`RechercheAstar.rechercher`) ; 1 donne les plans de coût estimé
+                                    minimal, une valeur plus grande des plans plus directs, évalués et
+                                    calculés plus vite.
+        :type facteur_heuristique: float
+        :param statistiques: Statistiques à alimenter (voir :meth:`tracer_chemin`), ou None.
+        :type statistiques: StatistiquesRoute or None
+        :return:
+            - `list[list[tuple[float, float]]]` : Liste de segments valides.
+            - `list[tuple[float, float, float]]` : Données météo par point.
+            - `float` : Vent max détecté.
+        :rtype: tuple[list, list, float]
+        """
+        segments = self._iterer_chemin_astar_meteo(depart, arrivee, seuil, verifier_meteo_callback,
+                                                   poids_vent, facteur_heuristique, statistiques)
+        return self.assembler_chemin(segments, arrivee)
+
+    def _iterer_chemin_astar_meteo(self, depart, arrivee, seuil, verifier_meteo_callback,
+                                   poids_vent=0.5, facteur_heuristique=2.0, statistiques=None):
+        """
+        Routage A* pondéré par le vent de :meth:`iterer_chemin` (voir :meth:`tracer_chemin_astar_meteo`).
+
+        Les segments refusés sont produits au fil de leur évaluation ; ceux de la trajectoire ne
+        sont connus, et produits, qu'à la fin du calcul.
+        """
+        donnees = self.waypoints.donnees()
+        grille = donnees.grille()
+        recherche = RechercheAstar(donnees.graphe(self.rayon_max_km), arrivee)
+        resultats_meteo = {}       # (u, v) -> résultat du callback, pour reconstruire la trajectoire
+        penalites = {}             # (u, v) -> coût réel / longueur, pour les segments acceptés
+        aretes_interdites = set()  # Segments refusés par la météo
+        # Estimation du vent aux waypoints : somme pondérée des relevés et somme des poids
+        vent_pondere = np.zeros(len(donnees))
+        poids_releves = np.zeros(len(donnees))
+        penalites_estimees = np.ones(len(donnees))  # Facteur de coût estimé par waypoint (ne fait que croître)
+        # Le vent est rapporté au seuil ; un seuil nul n'accepte qu'un vent nul (pénalité 1)
+        echelle_vent = max(seuil, 1e-9)
+        cout_premier_plan = None
+        vent_max_tot = 0
+        refuses = 0
+
+        def coordonnees(noeud):
+            if noeud is None:
+                return depart
+            return float(donnees.latitudes[noeud]), float(donnees.longitudes[noeud])
+
+        def enregistrer_releves(donnees_meteo):
+            # Met à jour le vent estimé des waypoints proches de chaque relevé
+            for lat, lon, vent in donnees_meteo:
+                if vent is None:
+                    continue
+                indices, distances = grille.voisins(lat, lon, RAYON_ESTIMATION_KM)
+                poids = 1 / np.maximum(distances, 1.0) ** 2
+                vent_pondere[indices] += poids * vent
+                poids_releves[indices] += poids
+                estimation = vent_pondere[indices] / poids_releves[indices]
+                facteurs = np.where(estimation > seuil, PENALITE_REFUS_ESTIME, 1 + poids_vent * estimation / echelle_vent)
+                penalites_estimees[indices] = np.maximum(penalites_estimees[indices], facteurs)
+
+        def risque(noeud):
+            # Vent estimé au waypoint ; sans relevé proche, le waypoint est supposé le plus risqué
+            if noeud is None:
+                return -1.0
+            if poids_releves[noeud] == 0:
+                return RISQUE_INCONNU * seuil
+            return vent_pondere[noeud] / poids_releves[noeud]
+
+        while True:
+            incrementer(statistiques, "navigation.iterations")
+            with phase(statistiques, "navigation.recherche_astar"):
+                chemin, cout_plan, nb_expansions = recherche.rechercher(
+                    depart, aretes_interdites=aretes_interdites, penalites=penalites,
+                    facteur_heuristique=facteur_heuristique, penalites_noeuds=penalites_estimees)
+            incrementer(statistiques, "navigation.recherches_astar")
+            incrementer(statistiques, "navigation.expansions_astar", nb_expansions)
+            if cout_premier_plan is None:
+                cout_premier_plan = cout_plan
+            elif cout_plan > DETOUR_MAX * cout_premier_plan:
+                chemin = None  # Détour trop long : barrière météo
+            if chemin is None:
+                _signaler_barriere(statistiques)
+                chemin = []
+                break
+
+            a_evaluer = [a for a in zip([None] + chemin[:-1], chemin) if a not in resultats_meteo]
+            a_evaluer.sort(key=lambda a: max(risque(a[0]), risque(a[1])), reverse=True)
+            for u, v in a_evaluer:
+                p, q = coordonnees(u), coordonnees(v)
+                with phase(statistiques, "navigation.interpolation"):
+                    coord_seg = self.intercaler_points(p[0], p[1], q[0], q[1])
+                with phase(statistiques, "navigation.meteo"):
+                    resultat = verifier_meteo_callback(coord_seg, seuil)
+                resultats_meteo[(u, v)] = resultat
+                Etat, liste_coordonnees, donnees_meteo, vent_max = resultat
+                enregistrer_releves(donnees_meteo)
+                vent_max_tot = max(vent_max_tot, vent_max)
+
+                if not Etat:  # Segment interdit : replanification sans lui
+                    aretes_interdites.add((u, v))
+                    refuses += 1
+                    incrementer(statistiques, "navigation.waypoints_refuses")
+                    yield SegmentChemin(False, p, q, liste_coordonnees, donnees_meteo,
+                                        vent_max, vent_max_tot, 0, refuses)
+                    break
+                penalites[(u, v)] = 1 + poids_vent * (vent_max or 0) / echelle_vent
+            else:
+                break  # Tous les segments du plan sont praticables
+        incrementer(statistiques, "navigation.segments_acceptes", len(chemin))
+
+        u = None
+        for acceptes, v in enumerate(chemin, start=1):
+            _, liste_coordonnees, donnees_meteo, vent_max = resultats_meteo[(u, v)]
+            yield SegmentChemin(True, coordonnees(u), coordonnees(v), liste_coordonnees, donnees_meteo,
+                                vent_max, vent_max_tot, acceptes, refuses)
+            u = v
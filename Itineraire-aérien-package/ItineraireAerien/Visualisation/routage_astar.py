@@ -0,0 +1,205 @@
+import heapq             # File de priorité de la recherche A*
+import itertools         # Compteur départageant les entrées de même priorité
+import numpy as np       # Pour le stockage compact du graphe (format CSR)
+from .index_spatial import distances_haversine  # Distance orthodromique vectorisée
+
+
+class GrapheWaypoints:
+    """
+    Graphe d'adjacence des waypoints : une arête relie deux waypoints distants d'au plus `rayon_km`.
+
+    Le graphe est stocké au format CSR (tableaux `debuts`, `voisins`, `distances`) et
+    construit une seule fois à l'aide de l'index spatial des waypoints.
+
+    :param donnees: Instantané des waypoints.
+    :type donnees: DonneesWaypoints
+    :param rayon_km: Distance maximale d'une arête, en kilomètres.
+    :type rayon_km: float
+    """
+    def __init__(self, donnees, rayon_km):
+        """
+        Construit la liste d'adjacence de chaque waypoint.
+        """
+        self.donnees = donnees
+        self.rayon_km = rayon_km
+        grille = donnees.grille()
+
+        liste_voisins, liste_distances = [], []
+        for i in range(len(donnees)):
+            voisins, distances = grille.voisins(donnees.latitudes[i], donnees.longitudes[i], rayon_km)
+            garder = voisins != i  # Pas de boucle sur soi-même
+            liste_voisins.append(voisins[garder])
+            liste_distances.append(distances[garder])
+
+        tailles = np.fromiter((len(v) for v in liste_voisins), dtype=np.int64, count=len(liste_voisins))
+        self.debuts = np.concatenate(([0], np.cumsum(tailles)))
+        self.voisins = np.concatenate(liste_voisins) if liste_voisins else np.empty(0, dtype=np.int64)
+        self.distances = np.concatenate(liste_distances) if liste_distances else np.empty(0)
+
+    def __len__(self):
+        return len(self.donnees)
+
+    def aretes(self, i):
+        """
+        Retourne les voisins du waypoint `i` et la longueur des arêtes correspondantes.
+
+        :param i: Indice du waypoint.
+        :type i: int
+        :return: Indices des voisins et distances en km.
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        """
+        debut, fin = self.debuts[i], self.debuts[i + 1]
+        return self.voisins[debut:fin], self.distances[debut:fin]
+
+
+class RechercheAstar:
+    """
+    Recherches A* successives vers une même arrivée, sur un graphe dont les coûts ne peuvent
+    qu'augmenter d'une recherche à l'autre (waypoints exclus, segments interdits, pénalités).
+
+    L'état utile est conservé entre les recherches (A* adaptatif) : après chaque recherche
+    réussie, l'heuristique de chaque waypoint développé est relevée à ``g(arrivée) - g(waypoint)``.
+    Elle reste une borne inférieure cohérente tant que les coûts ne diminuent pas, et se
+    rapproche de la distance réelle restante : après un segment refusé, la recherche suivante
+    ne développe plus que les waypoints touchés par le changement, au lieu de repartir de zéro.
+
+    :param graphe: Graphe des waypoints.
+    :type graphe: GrapheWaypoints
+    :param arrivee: Coordonnée de destination (latitude, longitude).
+    :type arrivee: tuple[float, float]
+    :param rayon_arrivee_km: Distance à partir de laquelle l'arrivée est considérée atteinte.
+    :type rayon_arrivee_km: float
+    """
+    def __init__(self, graphe, arrivee, rayon_arrivee_km=75):
+        """
+        Prépare les recherches : heuristique initiale (distance orthodromique jusqu'à l'arrivée)
+        et waypoints depuis lesquels l'arrivée est atteinte directement.
+        """
+        donnees = graphe.donnees
+        self.graphe = graphe
+        self.arrivee = arrivee
+        self.rayon_arrivee_km = rayon_arrivee_km
+        self.h = distances_haversine(arrivee[0], arrivee[1], donnees.latitudes, donnees.longitudes)
+        proches, d_proches = donnees.grille().voisins(arrivee[0], arrivee[1], rayon_arrivee_km)
+        self.vers_arrivee = dict(zip(proches.tolist(), d_proches.tolist()))
+
+    def _aretes_depuis(self, depart, noeud_depart):
+        """
+        Retourne les voisins du point de départ et la longueur des arêtes correspondantes.
+        """
+        if noeud_depart is None:
+            return self.graphe.donnees.grille().voisins(depart[0], depart[1], self.graphe.rayon_km)
+        return self.graphe.aretes(noeud_depart)
+
+    def rechercher(self, depart, noeud_depart=None, exclus=(), aretes_interdites=(), penalites=None,
+                   facteur_heuristique=1.0, penalites_noeuds=None):
+        """
+        Recherche le plus court chemin de `depart` vers l'arrivée à travers le graphe des waypoints.
+
+        Le départ et l'arrivée sont des nœuds virtuels : le départ est relié aux waypoints situés
+        dans le rayon du graphe (ou aux voisins de `noeud_depart` s'il s'agit d'un waypoint),
+        l'arrivée est atteinte depuis tout waypoint situé à moins de `rayon_arrivee_km`.
+
+        D'une recherche à l'autre, les waypoints exclus, les arêtes interdites et les pénalités
+        ne peuvent que s'ajouter (ou augmenter) : c'est ce qui garantit que l'heuristique apprise
+        reste valable.
+
+        :param depart: Coordonnée de départ (latitude, longitude).
+        :type depart: tuple[float, float]
+        :param noeud_depart: Indice du waypoint de départ, ou None si le départ n'est pas un waypoint.
+        :type noeud_depart: int or None
+        :param exclus: Indices de waypoints à ne pas traverser.
+        :type exclus: Iterable[int]
+        :param aretes_interdites: Couples (u, v) d'arêtes à ignorer (u vaut None pour un départ hors waypoint).
+        :type aretes_interdites: set[tuple]
+        :param penalites: Facteur (au moins 1) appliqué à la longueur de certaines arêtes (u, v).
+        :type penalites: dict or None
+        :param facteur_heuristique: Pondération de l'heuristique (A* pondéré) ; au-delà de 1, la recherche
+                                    développe moins de nœuds et le coût du chemin trouvé reste au plus
+                                    `facteur_heuristique` fois le coût optimal. L'heuristique n'est
+                                    apprise que pour une recherche non pondérée (facteur 1).
+        :type facteur_heuristique: float
+        :param penalites_noeuds: Facteur (au moins 1) par waypoint, appliqué aux arêtes absentes de `penalites` :
+                                 une arête vaut alors sa longueur multipliée par le plus grand facteur de
+                                 ses deux extrémités. Si une arête de `penalites` coûte moins que ce facteur,
+                                 l'heuristique apprise peut surestimer : le chemin trouvé n'est plus
+                                 garanti minimal.
+        :type penalites_noeuds: numpy.ndarray or None
+        :return:
+            - `list[int] or None` : Indices des waypoints du chemin (hors départ et arrivée), None si aucun chemin.
+            - `float` : Coût du chemin trouvé (inf si aucun chemin).
+            - `int` : Nombre de nœuds développés.
+        :rtype: tuple[list[int] or None, float, int]
+        """
+        graphe, h, vers_arrivee = self.graphe, self.h, self.vers_arrivee
+        n = len(graphe.donnees)
+        DEPART, ARRIVEE = n, n + 1  # Nœuds virtuels
+        penalites = penalites or {}
+        pn = penalites_noeuds.tolist() if penalites_noeuds is not None else None
+
+        h_depart = float(distances_haversine(self.arrivee[0], self.arrivee[1],
+                                             np.array([depart[0]]), np.array([depart[1]]))[0])
+        if h_depart <= self.rayon_arrivee_km:
+            return [], 0.0, 0  # Déjà à proximité de l'arrivée
+
+        ferme = np.zeros(n + 2, dtype=bool)
+        for i in exclus:
+            ferme[i] = True
+        g = {DEPART: 0.0}
+        parent = {DEPART: None}
+        developpes = []  # Waypoints développés (leur g est alors optimal)
+        ordre = itertools.count()
+        file = [(facteur_heuristique * h_depart, 0.0, next(ordre), DEPART)]  # (f, g, n°, nœud)
+
+        while file:
+            _, g_v, _, v = heapq.heappop(file)
+            if ferme[v] or g_v > g[v]:
+                continue  # Nœud déjà développé, ou entrée obsolète
+            ferme[v] = True
+            if v == ARRIVEE:
+                break
+
+            if v == DEPART:
+                source = noeud_depart
+                voisins, distances = self._aretes_depuis(depart, noeud_depart)
+            else:
+                source = v
+                developpes.append(v)
+                voisins, distances = graphe.aretes(v)
+
+            for w, d in zip(voisins.tolist(), distances.tolist()):
+                if ferme[w] or (source, w) in aretes_interdites:
+                    continue
+                facteur = penalites.get((source, w))
+                if facteur is None:
+                    if pn is None:
+                        facteur = 1.0
+                    else:
+                        facteur = max(pn[w], pn[source]) if source is not None else pn[w]
+                g_w = g_v + d * facteur
+                if g_w < g.get(w, np.inf):
+                    g[w], parent[w] = g_w, v
+                    heapq.heappush(file, (g_w + facteur_heuristique * h[w], g_w, next(ordre), w))
+
+            d_arrivee = vers_arrivee.get(source)
+            if d_arrivee is not None and g_v + d_arrivee < g.get(ARRIVEE, np.inf):
+                g[ARRIVEE], parent[ARRIVEE] = g_v + d_arrivee, v
+                heapq.heappush(file, (g_v + d_arrivee, g_v + d_arrivee, next(ordre), ARRIVEE))
+
+        nb_expansions = len(developpes) + 1  # Départ compris
+        if not ferme[ARRIVEE]:
+            return None, np.inf, nb_expansions
+
+        if facteur_heuristique == 1.0 and developpes:
+            # A* adaptatif : distance restante apprise pour chaque waypoint développé
+            indices = np.array(developpes)
+            g_developpes = np.fromiter((g[v] for v in developpes), dtype=float, count=len(developpes))
+            h[indices] = np.maximum(h[indices], g[ARRIVEE] - g_developpes)
+
+        chemin = []
+        u = parent[ARRIVEE]
+        while u != DEPART:
+            chemin.append(u)
+            u = parent[u]
+        chemin.reverse()
+        return chemin, g[ARRIVEE], nb_expansions
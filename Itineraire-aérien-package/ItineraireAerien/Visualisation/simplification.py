@@ -0,0 +1,70 @@
+import math              # Pour la projection locale en mètres
+import numpy as np       # Pour le calcul vectorisé des écarts à chaque segment
+
+RAYON_TERRE_M = 6371000  # Rayon moyen de la Terre en mètres
+
+
+def projeter_en_metres(points):
+    """
+    Projette des coordonnées (latitude, longitude) sur un plan local, en mètres.
+
+    Projection équirectangulaire centrée sur la latitude moyenne ; les longitudes sont
+    « déroulées » pour qu'un tracé traversant l'antiméridien reste continu.
+
+    :param points: Tableau (N, 2) de coordonnées (latitude, longitude) en degrés.
+    :type points: numpy.ndarray
+    :return: Tableau (N, 2) de coordonnées planes (x, y) en mètres.
+    :rtype: numpy.ndarray
+    """
+    latitudes = np.radians(points[:, 0])
+    longitudes = np.unwrap(np.radians(points[:, 1]))
+    cos_lat = math.cos(float(np.mean(latitudes)))
+    return np.column_stack((RAYON_TERRE_M * longitudes * cos_lat, RAYON_TERRE_M * latitudes))
+
+
+def simplifier_polyligne(points, tolerance_m):
+    """
+    Simplifie une polyligne par l'algorithme de Douglas–Peucker.
+
+    Un point est supprimé lorsque le tracé simplifié passe à moins de `tolerance_m` mètres de
+    lui. Le premier et le dernier point sont toujours conservés.
+
+    :param points: Coordonnées (latitude, longitude) du tracé.
+    :type points: list[tuple[float, float]] or numpy.ndarray
+    :param tolerance_m: Écart maximal admis entre le tracé d'origine et le tracé simplifié, en mètres.
+    :type tolerance_m: float
+    :return: Indices des points conservés (croissants).
+    :rtype: numpy.ndarray
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    n = len(points)
+    if n <= 2 or tolerance_m <= 0:
+        return np.arange(n)
+
+    xy = projeter_en_metres(points)
+    conserves = np.zeros(n, dtype=bool)
+    conserves[[0, n - 1]] = True
+
+    pile = [(0, n - 1)]  # Sous-tracés restant à examiner (indices des extrémités)
+    while pile:
+        debut, fin = pile.pop()
+        if fin - debut < 2:
+            continue
+        a, b = xy[debut], xy[fin]
+        ab = b - a
+        longueur2 = float(ab @ ab)
+        interieurs = xy[debut + 1:fin]
+        if longueur2 == 0:
+            ecarts = np.hypot(*(interieurs - a).T)
+        else:
+            # Distance de chaque point intérieur au segment [a, b]
+            t = np.clip((interieurs - a) @ ab / longueur2, 0, 1)
+            ecarts = np.hypot(*(interieurs - (a + t[:, None] * ab)).T)
+        i = int(np.argmax(ecarts))
+        if ecarts[i] > tolerance_m:
+            milieu = debut + 1 + i
+            conserves[milieu] = True
+            pile.append((debut, milieu))
+            pile.append((milieu, fin))
+
+    return np.flatnonzero(conserves)
@@ -1,4 +1,5 @@
 import numpy as np  # Pour les calculs numériques et manipulation de vecteurs
+from ..statistiques_route import phase, incrementer  # Mesures optionnelles du calcul d'itinéraire
 
 class TrajectoireManager:
     """
@@ -20,6 +21,38 @@ class TrajectoireManager:
         """
         self.n = n_points_bezier        # Plus ce nombre est grand, plus la courbe sera lisse
         self.ratio = auto_ctrl_ratio    # Définit la position du point de contrôle (ex : 0.1 = proche de p1)
+        self._base = None               # Base de Bernstein pour 'n' points (calculée au premier usage)
+
+    def base_bernstein(self):
+        """
+        Retourne la base de Bernstein quadratique évaluée en `n` valeurs de t entre 0 et 1.
+
+        La base ne dépend que de `n` : elle est calculée une seule fois puis réutilisée pour
+        toutes les courbes (et recalculée si `n` est modifié).
+
+        :return: Tableau (n, 3) des poids de p0, p1 et p2 pour chaque valeur de t.
+        :rtype: numpy.ndarray
+        """
+        if self._base is None or len(self._base) != self.n:
+            t = np.linspace(0, 1, self.n)  # Génère 'n' valeurs de t entre 0 et 1
+            self._base = np.column_stack(((1 - t) ** 2, 2 * (1 - t) * t, t ** 2))
+        return self._base
+
+    def courbes_bezier(self, p0, p1, p2):
+        """
+        Évalue en une seule opération plusieurs courbes de Bézier quadratiques.
+
+        :param p0: Points de départ des courbes, tableau (J, 2).
+        :type p0: numpy.ndarray
+        :param p1: Points de contrôle, tableau (J, 2).
+        :type p1: numpy.ndarray
+        :param p2: Points d’arrivée, tableau (J, 2).
+        :type p2: numpy.ndarray
+        :return: Points des courbes, tableau (J, n, 2).
+        :rtype: numpy.ndarray
+        """
+        controles = np.stack((p0, p1, p2), axis=1)                 # (J, 3, 2)
+        return np.einsum('tk,jkc->jtc', self.base_bernstein(), controles)
 
     def bezier_curve(self, p0, p1, p2):
         """
@@ -34,14 +67,9 @@ class TrajectoireManager:
         :return: Liste de points interpolés (latitude, longitude).
         :rtype: list[tuple[float, float]]
         """
-        t = np.linspace(0, 1, self.n)  # Génère 'n' valeurs de t entre 0 et 1
-        return [
-            (
-                (1 - tt) ** 2 * p0[0] + 2 * (1 - tt) * tt * p1[0] + tt ** 2 * p2[0],  # Latitude
-                (1 - tt) ** 2 * p0[1] + 2 * (1 - tt) * tt * p1[1] + tt ** 2 * p2[1]   # Longitude
-            )
-            for tt in t
-        ]
+        courbe = self.courbes_bezier(np.array([p0], dtype=float), np.array([p1], dtype=float),
+                                     np.array([p2], dtype=float))[0]
+        return [tuple(point) for point in courbe.tolist()]
 
     def auto_ctrl(self, p1, p2):
         """
@@ -58,28 +86,49 @@ class TrajectoireManager:
         p2 = np.array(p2, dtype=float)
         return tuple(p1 + self.ratio * (p2 - p1))  # Point à 10% (par défaut) de la distance entre p1 et p2
 
-    def trajectoire_lisse_avec_controles(self, data):
+    def lisser(self, data, statistiques=None):
         """
         Lisse une trajectoire en remplaçant les jonctions entre segments par des courbes de Bézier.
 
+        Toutes les courbes de jonction sont évaluées en une seule opération, puis la trajectoire
+        est assemblée par une unique concaténation.
+
         :param data: Liste de segments, chaque segment étant une liste de points [(lat, lon), ...].
         :type data: list[list[tuple[float, float]]]
-        :return: Trajectoire complète lissée sous forme de liste de points (latitude, longitude).
-        :rtype: list[tuple[float, float]]
+        :param statistiques: Si fourni, reçoit la durée de la phase ``lissage`` et le nombre de points produits.
+        :type statistiques: StatistiquesRoute or None
+        :return: Trajectoire complète lissée, tableau (N, 2) de points (latitude, longitude).
+        :rtype: numpy.ndarray
         :raises ValueError: Si moins de deux segments sont fournis.
         """
         if len(data) < 2:
             raise ValueError("Il faut au moins deux segments pour lisser une trajectoire.")
 
-        trajectoire = list(data[0])  # Démarre avec le premier segment
+        with phase(statistiques, "lissage"):
+            segments = [np.asarray(segment, dtype=float).reshape(-1, 2) for segment in data]
+            p0 = np.array([segment[-1] for segment in segments[:-1]])  # Dernier point de chaque segment
+            p2 = np.array([segment[0] for segment in segments[1:]])    # Premier point du segment suivant
+            ctrl = p0 + self.ratio * (p2 - p0)                         # Points de contrôle (voir auto_ctrl)
+            courbes = self.courbes_bezier(p0, ctrl, p2)
 
-        for i in range(len(data) - 1):
-            p0 = data[i][-1]          # Dernier point du segment actuel
-            p2 = data[i + 1][0]       # Premier point du segment suivant
-            ctrl = self.auto_ctrl(p0, p2)              # Calcul du point de contrôle entre p0 et p2
-            courbe = self.bezier_curve(p0, ctrl, p2)   # Génère la courbe entre ces deux points
+            morceaux = [segments[0]]  # Démarre avec le premier segment
+            for courbe, segment in zip(courbes, segments[1:]):
+                morceaux.append(courbe[1:])    # Courbe sans son 1er point, déjà présent
+                morceaux.append(segment[1:])   # Points restants du segment suivant
+            trajectoire = np.concatenate(morceaux)
+        incrementer(statistiques, "lissage.points", len(trajectoire))
+        return trajectoire
 
-            trajectoire.extend(courbe[1:])             # Ajoute la courbe (sauf le 1er point déjà présent)
-            trajectoire.extend(data[i + 1][1:])        # Ajoute les points restants du segment suivant
+    def trajectoire_lisse_avec_controles(self, data, statistiques=None):
+        """
+        Lisse une trajectoire (voir :meth:`lisser`) et la retourne sous forme de liste de tuples.
 
-        return trajectoire  # Liste finale de points (lissée et continue)
+        :param data: Liste de segments, chaque segment étant une liste de points [(lat, lon), ...].
+        :type data: list[list[tuple[float, float]]]
+        :param statistiques: Statistiques à alimenter (voir :meth:`lisser`), ou None.
+        :type statistiques: StatistiquesRoute or None
+        :return: Trajectoire complète lissée sous forme de liste de points (latitude, longitude).
+        :rtype: list[tuple[float, float]]
+        :raises ValueError: Si moins de deux segments sont fournis.
+        """
+        return [tuple(point) for point in self.lisser(data, statistiques).tolist()]
@@ -1,12 +1,105 @@
 import folium  # Folium permet de créer des cartes interactives basées sur Leaflet.js
+import numpy as np  # Pour manipuler les tracés sous forme de tableaux
+from .simplification import simplifier_polyligne  # Simplification des tracés (Douglas–Peucker)
+from ..statistiques_route import phase, incrementer  # Mesures optionnelles du calcul d'itinéraire
 
 
 class VisualisationManager:
     """
     Classe responsable de l'affichage de cartes interactives contenant des itinéraires
     et des données météo (notamment le vent) à l'aide de la bibliothèque Folium.
+
+    Les tracés peuvent être simplifiés avant d'être insérés dans la carte : les points dont la
+    suppression déplace le tracé de moins de `tolerance_simplification_m` mètres sont retirés,
+    ce qui réduit la taille du HTML généré et le temps de rendu dans le navigateur.
+
+    :param tolerance_simplification_m: Tolérance de simplification des tracés, en mètres
+                                       (None ou 0 : tracés affichés sans simplification).
+    :type tolerance_simplification_m: float or None
     """
-    def afficher_meteo_sur_carte(self, points_meteo, seuil, itineraire):
+    def __init__(self, tolerance_simplification_m=None):
+        """
+        Initialise le gestionnaire avec la tolérance de simplification des tracés.
+        """
+        self.tolerance_simplification_m = tolerance_simplification_m
+
+    def simplifier(self, itineraire, statistiques=None):
+        """
+        Simplifie un tracé selon `tolerance_simplification_m`.
+
+        L'instance pouvant être partagée entre sessions, elle ne conserve aucun compteur : le
+        nombre de points tracés et supprimés est ajouté à `statistiques`.
+
+        :param itineraire: Liste de coordonnées GPS représentant l’itinéraire.
+        :type itineraire: list[tuple[float, float]] or numpy.ndarray
+        :param statistiques: Si fourni, reçoit les compteurs ``visualisation.points_traces`` et
+                             ``visualisation.points_supprimes``.
+        :type statistiques: StatistiquesRoute or None
+        :return: Tracé simplifié.
+        :rtype: list[tuple[float, float]]
+        """
+        points = np.asarray(itineraire, dtype=float).reshape(-1, 2)
+        if self.tolerance_simplification_m:
+            points = points[simplifier_polyligne(points, self.tolerance_simplification_m)]
+        incrementer(statistiques, "visualisation.points_traces", len(points))
+        incrementer(statistiques, "visualisation.points_supprimes", len(itineraire) - len(points))
+        return [tuple(point) for point in points.tolist()]
+
+    def couche_meteo(self, points_meteo, seuil):
+        """
+        Construit une couche GeoJSON unique contenant tous les points météo.
+
+        Chaque point est un cercle coloré selon le vent : vert s'il est inférieur ou égal au
+        seuil, rouge au-delà, gris s'il est inconnu. Une seule couche (et un seul bloc de script)
+        est générée, quel que soit le nombre de points.
+
+        :param points_meteo: Liste des points météo. Format : [(lat, lon, vent_kph), ...]
+        :type points_meteo: list[tuple[float, float, float or None]]
+        :param seuil: Seuil de vent maximal admissible (km/h).
+        :type seuil: float
+        :return: Couche des points météo.
+        :rtype: folium.GeoJson
+        """
+        entites = []
+        for lat, lon, vent in points_meteo:
+            entites.append({
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                "properties": {
+                    "couleur": "gray" if vent is None else ("green" if vent <= seuil else "red"),
+                    "popup": "Vent : inconnu" if vent is None else f"Vent : {vent:.1f} km/h",
+                },
+            })
+
+        return folium.GeoJson(
+            {"type": "FeatureCollection", "features": entites},
+            name="Météo",
+            marker=folium.CircleMarker(radius=5, fill=True),
+            style_function=lambda entite: {
+                "color": entite["properties"]["couleur"],
+                "fillColor": entite["properties"]["couleur"],
+            },
+            popup=folium.GeoJsonPopup(fields=["popup"], labels=False),
+        )
+
+    def generer_html(self, carte, statistiques=None):
+        """
+        Génère en mémoire la page HTML complète d'une carte, sans passer par un fichier.
+
+        :param carte: Carte à convertir.
+        :type carte: folium.Map
+        :param statistiques: Si fourni, reçoit la durée de la phase ``visualisation.html`` et la
+                             taille du document (compteur ``visualisation.taille_html``, en caractères).
+        :type statistiques: StatistiquesRoute or None
+        :return: Document HTML de la carte.
+        :rtype: str
+        """
+        with phase(statistiques, "visualisation.html"):
+            document = carte.get_root().render()
+        incrementer(statistiques, "visualisation.taille_html", len(document))
+        return document
+
+    def afficher_meteo_sur_carte(self, points_meteo, seuil, itineraire, statistiques=None):
         """
         Affiche une carte interactive avec un itinéraire et les points météo associés.
 
@@ -16,86 +109,72 @@ class VisualisationManager:
         :param seuil: Seuil de vent maximal admissible (km/h) pour le tracé.
         :type seuil: float
         :param itineraire: Liste de coordonnées GPS représentant l’itinéraire.
-        :type itineraire: list[tuple[float, float]]
+        :type itineraire: list[tuple[float, float]] or numpy.ndarray
+        :param statistiques: Si fourni, reçoit la durée de la phase ``visualisation.carte`` et le
+                             nombre de points tracés et supprimés par la simplification.
+        :type statistiques: StatistiquesRoute or None
         :return: Carte Folium avec tracé et points météo.
         :rtype: folium.Map
         """
-        # Calcule le centre de la carte à partir des points météo
-        lat_centre = sum(lat for lat, lon, vent in points_meteo) / len(points_meteo)
-        lon_centre = sum(lon for lat, lon, vent in points_meteo) / len(points_meteo)
-        carte = folium.Map(location=(lat_centre, lon_centre), zoom_start=6)
+        with phase(statistiques, "visualisation.carte"):
+            # Calcule le centre de la carte à partir des points météo
+            lat_centre = sum(lat for lat, lon, vent in points_meteo) / len(points_meteo)
+            lon_centre = sum(lon for lat, lon, vent in points_meteo) / len(points_meteo)
+            carte = folium.Map(location=(lat_centre, lon_centre), zoom_start=6)
 
-        # Trace l’itinéraire principal (en bleu)
-        if itineraire:
-            folium.PolyLine(itineraire, color="blue", weight=2).add_to(carte)
+            # Trace l’itinéraire principal (en bleu)
+            if len(itineraire):
+                folium.PolyLine(self.simplifier(itineraire, statistiques), color="blue", weight=2).add_to(carte)
 
-        # Ajoute les points météo sur la carte avec un code couleur
-        for lat, lon, vent in points_meteo:
-            couleur = "gray" if vent is None else ("green" if vent <= seuil else "red")
-            popup = "Vent : inconnu" if vent is None else f"Vent : {vent:.1f} km/h"
-
-            folium.CircleMarker(
-                location=(lat, lon),
-                radius=5,
-                color=couleur,
-                fill=True,
-                fill_color=couleur,
-                popup=popup
-            ).add_to(carte)
+            # Ajoute les points météo sur la carte avec un code couleur
+            self.couche_meteo(points_meteo, seuil).add_to(carte)
 
         return carte
 
-    def afficher_double_itineraire(self, itin1, itin2, points_meteo, seuil):
+    def afficher_double_itineraire(self, itin1, itin2, points_meteo, seuil, statistiques=None):
         """
         Affiche une carte avec deux itinéraires superposés (référence et dévié), ainsi que les points météo.
 
         :param itin1: Liste de points représentant l’itinéraire de référence.
-        :type itin1: list[tuple[float, float]]
+        :type itin1: list[tuple[float, float]] or numpy.ndarray
         :param itin2: Liste de points représentant l’itinéraire dévié.
-        :type itin2: list[tuple[float, float]]
+        :type itin2: list[tuple[float, float]] or numpy.ndarray
         :param points_meteo: Liste des points météo à afficher, avec vitesse du vent.
                                 Format : [(lat, lon, vent_kph), ...]
         :type points_meteo: list[tuple[float, float, float or None]]
         :param seuil: Seuil de vent maximal admissible (km/h) à représenter.
         :type seuil: float
+        :param statistiques: Si fourni, reçoit la durée de la phase ``visualisation.carte`` et le
+                             nombre de points tracés et supprimés par la simplification.
+        :type statistiques: StatistiquesRoute or None
         :return: Carte Folium représentant les deux trajets et les conditions météo.
         :rtype: folium.Map
         """
-        # Centre la carte sur le premier point disponible
-        lat_centre, lon_centre = itin1[0] if itin1 else itin2[0]
-        carte = folium.Map(location=(lat_centre, lon_centre), zoom_start=6)
-
-        # Trace l’itinéraire de référence (en bleu)
-        if itin1:
-            folium.PolyLine(
-                itin1,
-                color="blue",
-                weight=3,
-                tooltip="Itinéraire référence"
-            ).add_to(carte)
-
-        # Trace l’itinéraire dévié (en violet)
-        if itin2:
-            folium.PolyLine(
-                itin2,
-                color="purple",
-                weight=3,
-                tooltip="Itinéraire dévié"
-            ).add_to(carte)
-
-
-        # Ajoute les points météo, avec un code couleur selon la vitesse du vent
-        for lat, lon, vent in points_meteo:
-            couleur = "gray" if vent is None else ("green" if vent <= seuil else "red")
-            popup = "Vent : inconnu" if vent is None else f"Vent : {vent:.1f} km/h"
-
-            folium.CircleMarker(
-                location=(lat, lon),
-                radius=5,
-                color=couleur,
-                fill=True,
-                fill_color=couleur,
-                popup=popup
-            ).add_to(carte)
+        with phase(statistiques, "visualisation.carte"):
+            # Centre la carte sur le premier point disponible
+            lat_centre, lon_centre = itin1[0] if len(itin1) else itin2[0]
+            carte = folium.Map(location=(lat_centre, lon_centre), zoom_start=6)
+
+            # Trace l’itinéraire de référence (en bleu)
+            if len(itin1):
+                folium.PolyLine(
+                    self.simplifier(itin1, statistiques),
+                    color="blue",
+                    weight=3,
+                    tooltip="Itinéraire référence"
+                ).add_to(carte)
+
+            # Trace l’itinéraire dévié (en violet)
+            if len(itin2):
+                folium.PolyLine(
+                    self.simplifier(itin2, statistiques),
+                    color="purple",
+                    weight=3,
+                    tooltip="Itinéraire dévié"
+                ).add_to(carte)
+
+
+            # Ajoute les points météo, avec un code couleur selon la vitesse du vent
+            self.couche_meteo(points_meteo, seuil).add_to(carte)
 
         return carte
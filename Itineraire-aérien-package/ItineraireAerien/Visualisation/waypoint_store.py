@@ -0,0 +1,178 @@
+import os                # Pour lire la date de modification et la taille du fichier CSV
+import sys               # Pour interner les identifiants (sys.intern)
+import threading         # Pour protéger le chargement partagé entre sessions concurrentes
+import numpy as np       # Pour stocker les coordonnées dans des tableaux contigus
+from .index_spatial import GrilleSpatiale  # Index spatial pour les requêtes de rayon
+from .routage_astar import GrapheWaypoints  # Graphe d'adjacence pour le routage A*
+
+
+class DonneesWaypoints:
+    """
+    Instantané immuable des waypoints chargés en mémoire.
+
+    Les coordonnées sont stockées dans des tableaux NumPy float64 contigus et en lecture seule ;
+    les identifiants sont internés et les codes pays sont encodés sous forme d'entiers.
+
+    :param latitudes: Latitudes des waypoints, en degrés.
+    :type latitudes: numpy.ndarray
+    :param longitudes: Longitudes des waypoints, en degrés.
+    :type longitudes: numpy.ndarray
+    :param idents: Identifiants des waypoints (None si absent du fichier).
+    :type idents: tuple[str or None]
+    :param pays_codes: Indice du pays de chaque waypoint dans `pays`.
+    :type pays_codes: numpy.ndarray
+    :param pays: Codes iso_country distincts.
+    :type pays: tuple[str]
+    :param signature: Couple (mtime en ns, taille en octets) du fichier au moment du chargement.
+    :type signature: tuple[int, int]
+    """
+    __slots__ = ("latitudes", "longitudes", "idents", "pays_codes", "pays", "signature", "_grille", "_graphes")
+
+    def __init__(self, latitudes, longitudes, idents, pays_codes, pays, signature):
+        self.latitudes = latitudes
+        self.longitudes = longitudes
+        self.idents = idents
+        self.pays_codes = pays_codes
+        self.pays = pays
+        self.signature = signature
+        self._grille = None
+        self._graphes = {}
+
+    def __len__(self):
+        return len(self.latitudes)
+
+    def pays_de(self, i):
+        """
+        Retourne le code iso_country du waypoint d'indice `i`.
+
+        :param i: Indice du waypoint.
+        :type i: int
+        :return: Code pays (ex: "CA") ou None si inconnu.
+        :rtype: str or None
+        """
+        code = self.pays_codes[i]
+        return None if code < 0 else self.pays[code]
+
+    def grille(self):
+        """
+        Retourne l'index spatial des waypoints, construit au premier appel puis réutilisé.
+
+        :return: Index en tuiles latitude/longitude de cet instantané.
+        :rtype: GrilleSpatiale
+        """
+        if self._grille is None:
+            self._grille = GrilleSpatiale(self.latitudes, self.longitudes)
+        return self._grille
+
+    def graphe(self, rayon_km):
+        """
+        Retourne le graphe d'adjacence des waypoints pour un rayon donné, construit une seule fois.
+
+        :param rayon_km: Distance maximale d'une arête, en kilomètres.
+        :type rayon_km: float
+        :return: Graphe des waypoints de cet instantané.
+        :rtype: GrapheWaypoints
+        """
+        graphe = self._graphes.get(rayon_km)
+        if graphe is None:
+            graphe = self._graphes[rayon_km] = GrapheWaypoints(self, rayon_km)
+        return graphe
+
+
+class WaypointStore:
+    """
+    Stockage en mémoire des waypoints, partagé par tout le processus.
+
+    Le fichier CSV n'est lu qu'une seule fois ; il est rechargé uniquement lorsque sa date
+    de modification ou sa taille change. Toutes les instances de `NavigationManager` pointant
+    vers le même fichier partagent le même stockage (voir :meth:`partage`).
+
+    :param chemin_csv: Chemin vers le fichier CSV contenant les waypoints.
+    :type chemin_csv: str
+    """
+    _instances = {}                          # Stockages partagés, indexés par chemin absolu
+    _verrou_instances = threading.Lock()
+
+    def __init__(self, chemin_csv):
+        """
+        Initialise un stockage vide ; le chargement a lieu au premier accès aux données.
+        """
+        self.chemin_csv = os.path.abspath(chemin_csv)
+        self.nb_chargements = 0              # Nombre de lectures effectives du fichier
+        self._donnees = None
+        self._verrou = threading.Lock()
+
+    @classmethod
+    def partage(cls, chemin_csv):
+        """
+        Retourne le stockage partagé associé à un fichier, en le créant si besoin.
+
+        :param chemin_csv: Chemin vers le fichier CSV des waypoints.
+        :type chemin_csv: str
+        :return: Stockage unique pour ce fichier dans le processus.
+        :rtype: WaypointStore
+        """
+        cle = os.path.abspath(chemin_csv)
+        with cls._verrou_instances:
+            store = cls._instances.get(cle)
+            if store is None:
+                store = cls._instances[cle] = cls(cle)
+            return store
+
+    def donnees(self):
+        """
+        Retourne l'instantané courant des waypoints, en rechargeant le fichier s'il a changé.
+
+        :return: Données des waypoints.
+        :rtype: DonneesWaypoints
+        """
+        stat = os.stat(self.chemin_csv)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        donnees = self._donnees
+        if donnees is not None and donnees.signature == signature:
+            return donnees  # Cas courant : aucune lecture, aucun verrou
+
+        with self._verrou:
+            # Une autre session a pu recharger le fichier pendant l'attente du verrou
+            if self._donnees is None or self._donnees.signature != signature:
+                self._donnees = self._charger(signature)
+                self.nb_chargements += 1
+            return self._donnees
+
+    def installer(self, donnees):
+        """
+        Remplace l'instantané courant par des données déjà chargées (par exemple des tableaux
+        placés en mémoire partagée par un autre processus), sans relire le fichier.
+
+        L'instantané reste utilisé tant que la signature du fichier ne change pas.
+
+        :param donnees: Données des waypoints correspondant à ce fichier.
+        :type donnees: DonneesWaypoints
+        """
+        with self._verrou:
+            self._donnees = donnees
+
+    def _charger(self, signature):
+        """
+        Lit le fichier CSV et construit un nouvel instantané.
+        """
+        import pandas as pd  # Importé au premier chargement seulement (coût d'import élevé)
+        df = pd.read_csv(self.chemin_csv)
+        df = df.dropna(subset=['latitude_deg', 'longitude_deg'])
+
+        latitudes = np.ascontiguousarray(df['latitude_deg'].to_numpy(dtype=np.float64))
+        longitudes = np.ascontiguousarray(df['longitude_deg'].to_numpy(dtype=np.float64))
+        latitudes.setflags(write=False)
+        longitudes.setflags(write=False)
+
+        idents = tuple(sys.intern(i) if isinstance(i, str) else None for i in df['ident'])
+
+        if 'iso_country' in df.columns:
+            codes, uniques = pd.factorize(df['iso_country'])
+            pays = tuple(sys.intern(str(p)) for p in uniques)
+        else:
+            codes, pays = np.full(len(df), -1), ()
+        pays_codes = np.ascontiguousarray(codes, dtype=np.int16)
+        pays_codes.setflags(write=False)
+
+        return DonneesWaypoints(latitudes, longitudes, idents, pays_codes, pays, signature)
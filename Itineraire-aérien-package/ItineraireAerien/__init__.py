@@ -1,4 +1,58 @@
-from .Avion import *
-from .Meteo import *
-from .coordonees import *
-from .Visualisation import *
+"""
+Paquet ItineraireAerien : avions, météo, géolocalisation des villes et visualisation.
+
+Les sous-paquets, et les classes qu'ils exposent, sont importés au premier accès seulement :
+``import ItineraireAerien`` ne charge ni pandas, ni folium, ni requests, et un processus qui
+n'utilise que la navigation n'importe que ce dont elle a besoin.
+"""
+import importlib
+
+# Nom exporté -> sous-paquet (ou module) qui le définit
+_EXPORTS = {
+    "AvionManager": "Avion",
+    "FicheAvion": "Avion",
+    "MeteoManager": "Meteo",
+    "juger_segment": "Meteo",
+    "DonneesMeteo": "Meteo",
+    "CacheMeteo": "Meteo",
+    "ClientHTTP": "Meteo",
+    "client_partage": "Meteo",
+    "GrilleMeteoCorridor": "Meteo",
+    "FournisseurMeteo": "Meteo",
+    "FournisseurWeatherAPI": "Meteo",
+    "FournisseurSynthetique": "Meteo",
+    "FournisseurRejeu": "Meteo",
+    "FournisseurEnregistreur": "Meteo",
+    "ObservationsSimulation": "Meteo",
+    "transformer_nom_en_coordonnees": "coordonees",
+    "CatalogueVilles": "coordonees",
+    "Ville": "coordonees",
+    "catalogue_villes": "coordonees",
+    "VisualisationManager": "Visualisation",
+    "NavigationManager": "Visualisation",
+    "SegmentChemin": "Visualisation",
+    "TrajectoireManager": "Visualisation",
+    "WaypointStore": "Visualisation",
+    "executer_lot": "Batch",
+    "calculer_flotte": "Batch",
+    "StatistiquesRoute": "statistiques_route",
+    "enregistrer_exportateur": "statistiques_route",
+}
+_SOUS_PAQUETS = ("Avion", "Meteo", "coordonees", "Visualisation", "Batch")
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(nom):
+    # Import différé : le sous-paquet n'est chargé qu'au premier accès à l'un de ses noms
+    if nom in _SOUS_PAQUETS:
+        return importlib.import_module(f".{nom}", __name__)
+    if nom in _EXPORTS:
+        valeur = getattr(importlib.import_module(f".{_EXPORTS[nom]}", __name__), nom)
+        globals()[nom] = valeur  # Les accès suivants ne repassent plus par __getattr__
+        return valeur
+    raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | set(_SOUS_PAQUETS))
@@ -1 +1,2 @@
 from .coordonees_villes import transformer_nom_en_coordonnees
+from .coordonees_villes import CatalogueVilles, Ville, catalogue_villes
@@ -1,24 +1,246 @@
 """
 Module pour convertir un nom de ville en coordonnées géographiques à partir d'un fichier CSV.
 
-Ce module charge une base de données de villes (`Data/Villes.csv`) et expose une fonction
-pour rechercher les coordonnées GPS d’une ville donnée.
+Ce module donne accès à une base de données de villes (`Data/Villes.csv`) via un catalogue
+chargé une seule fois par processus, au premier usage, et partagé par toutes les sessions.
+Il expose une fonction pour rechercher les coordonnées GPS d’une ville donnée et une
+recherche par préfixe (insensible à la casse et aux accents) pour l'autocomplétion.
 
 Attributes
 ----------
 VILLES_CSV : str
     Chemin vers le fichier CSV contenant les villes et leurs coordonnées.
 df_villes : pandas.DataFrame
-    Données chargées à partir du fichier CSV.
+    Données chargées à partir du fichier CSV (construit à la demande).
 """
-import pandas as pd  # Pour lire et manipuler des fichiers CSV
-
-# Chargement du fichier contenant les villes et leurs coordonnées géographiques
+import bisect  # Pour la recherche par préfixe dans la liste triée des noms
+import csv  # Pour lire le fichier CSV sans dépendre de pandas
 import os
+import threading  # Pour partager le catalogue entre sessions concurrentes
+import unicodedata  # Pour supprimer les accents des noms
+from typing import NamedTuple
+
 # Le chemin vers le fichier CSV
 VILLES_CSV = os.path.join(os.path.dirname(__file__), "../../Data/Villes.csv")
 VILLES_CSV = os.path.abspath(VILLES_CSV)
-df_villes = pd.read_csv(VILLES_CSV)  # Chargement des données dans un DataFrame
+
+
+class Ville(NamedTuple):
+    """
+    Ville du catalogue.
+
+    Attributes
+    ----------
+    nom : str
+        Nom de la ville tel qu'il figure dans le fichier.
+    lat : float
+        Latitude, en degrés.
+    lng : float
+        Longitude, en degrés.
+    """
+    nom: str
+    lat: float
+    lng: float
+
+
+def normaliser_nom(nom):
+    """
+    Normalise un nom de ville pour la recherche : sans accents, sans casse, espaces superflus retirés.
+
+    Parameters
+    ----------
+    nom : str
+        Nom à normaliser.
+
+    Returns
+    -------
+    str
+        Nom normalisé (ex. : "Montréal " devient "montreal").
+    """
+    decompose = unicodedata.normalize("NFKD", nom)
+    sans_accents = "".join(c for c in decompose if not unicodedata.combining(c))
+    return " ".join(sans_accents.casefold().split())
+
+
+class CatalogueVilles:
+    """
+    Catalogue des villes, indexé pour des recherches en temps constant.
+
+    Le fichier est lu au premier accès seulement. Plusieurs villes peuvent porter le même nom
+    (ex. : une dizaine de "Springfield") : :meth:`rechercher` les retourne toutes, dans l'ordre
+    du fichier, et :meth:`coordonnees` retient la première, comme l'ancienne recherche.
+
+    Parameters
+    ----------
+    chemin_csv : str
+        Chemin vers le fichier CSV (colonnes city, lat, lng).
+    """
+
+    def __init__(self, chemin_csv=VILLES_CSV):
+        self.chemin_csv = chemin_csv
+        self._villes = None
+        self._df = None
+        self._verrou = threading.Lock()
+
+    def _charger(self):
+        """
+        Lit le fichier et construit les index (une seule fois).
+        """
+        if self._villes is not None:
+            return
+        with self._verrou:
+            if self._villes is not None:
+                return
+            villes = []
+            with open(self.chemin_csv, newline="", encoding="utf-8") as f:
+                for ligne in csv.DictReader(f):
+                    villes.append(Ville(ligne["city"], float(ligne["lat"]), float(ligne["lng"])))
+
+            par_nom = {}          # nom en minuscules -> villes (recherche exacte, casse ignorée)
+            par_nom_normalise = {}  # nom sans accents ni casse -> villes
+            for ville in villes:
+                par_nom.setdefault(ville.nom.lower(), []).append(ville)
+                par_nom_normalise.setdefault(normaliser_nom(ville.nom), []).append(ville)
+
+            self._par_nom = par_nom
+            self._par_nom_normalise = par_nom_normalise
+            self._cles_triees = sorted(par_nom_normalise)
+            self._noms_tries = sorted({ville.nom for ville in villes})
+            self._villes = villes
+
+    def __len__(self):
+        self._charger()
+        return len(self._villes)
+
+    def rechercher(self, nom):
+        """
+        Retourne toutes les villes portant un nom donné.
+
+        La casse est ignorée ; si aucune ville ne correspond exactement, la recherche est
+        refaite sans tenir compte des accents.
+
+        Parameters
+        ----------
+        nom : str
+            Nom de la ville.
+
+        Returns
+        -------
+        list of Ville
+            Villes correspondantes, dans l'ordre du fichier (liste vide si aucune).
+        """
+        self._charger()
+        villes = self._par_nom.get(nom.lower())
+        if villes is None:
+            villes = self._par_nom_normalise.get(normaliser_nom(nom), [])
+        return list(villes)
+
+    def coordonnees(self, nom):
+        """
+        Retourne les coordonnées de la première ville portant ce nom.
+
+        Parameters
+        ----------
+        nom : str
+            Nom de la ville.
+
+        Returns
+        -------
+        tuple or None
+            Tuple (latitude, longitude), ou None si la ville est inconnue.
+        """
+        villes = self.rechercher(nom)
+        if not villes:
+            return None
+        return villes[0].lat, villes[0].lng
+
+    def completer(self, prefixe, limite=10):
+        """
+        Propose des noms de villes commençant par un préfixe (casse et accents ignorés).
+
+        Parameters
+        ----------
+        prefixe : str
+            Début du nom saisi.
+        limite : int
+            Nombre maximal de propositions.
+
+        Returns
+        -------
+        list of str
+            Noms de villes distincts, par ordre alphabétique des noms normalisés.
+        """
+        self._charger()
+        cle = normaliser_nom(prefixe)
+        debut = bisect.bisect_left(self._cles_triees, cle)
+        propositions = []
+        for cle_ville in self._cles_triees[debut:]:
+            if not cle_ville.startswith(cle) or len(propositions) >= limite:
+                break
+            for ville in self._par_nom_normalise[cle_ville]:
+                if ville.nom not in propositions:
+                    propositions.append(ville.nom)
+        return propositions[:limite]
+
+    def noms_tries(self):
+        """
+        Retourne la liste triée des noms de villes distincts (pour les listes de sélection).
+
+        Returns
+        -------
+        list of str
+            Noms distincts, triés.
+        """
+        self._charger()
+        return self._noms_tries
+
+    def dataframe(self):
+        """
+        Retourne le catalogue sous forme de DataFrame (colonnes city, lat, lng).
+
+        Le DataFrame est construit au premier appel puis conservé : comme l'ancien `df_villes`,
+        il est partagé et ne doit pas être modifié par l'appelant.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Une ligne par ville, dans l'ordre du fichier.
+        """
+        if self._df is None:
+            import pandas as pd  # Importé seulement si le DataFrame est demandé
+            self._charger()
+            with self._verrou:
+                if self._df is None:
+                    self._df = pd.DataFrame(self._villes, columns=["city", "lat", "lng"])
+        return self._df
+
+
+_catalogue = None
+_verrou_catalogue = threading.Lock()
+
+
+def catalogue_villes():
+    """
+    Retourne le catalogue des villes partagé par tout le processus.
+
+    Returns
+    -------
+    CatalogueVilles
+        Catalogue unique, chargé au premier usage.
+    """
+    global _catalogue
+    with _verrou_catalogue:
+        if _catalogue is None:
+            _catalogue = CatalogueVilles()
+        return _catalogue
+
+
+def __getattr__(nom):
+    # Compatibilité : `df_villes` n'est plus chargé à l'import mais construit au premier accès
+    if nom == "df_villes":
+        return catalogue_villes().dataframe()
+    raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+
 
 def transformer_nom_en_coordonnees(ville):
     """
@@ -27,20 +249,12 @@ def transformer_nom_en_coordonnees(ville):
     Parameters
     ----------
     ville : str
-        Nom de la ville à rechercher (insensible à la casse).
+        Nom de la ville à rechercher (insensible à la casse, puis aux accents).
 
     Returns
     -------
     tuple or None
         Tuple (latitude, longitude) si la ville est trouvée,
-        None sinon.
+        None sinon. Si plusieurs villes portent ce nom, la première du fichier est retenue.
     """
-    # On cherche une ligne dont le nom de ville correspond (casse ignorée)
-    match = df_villes[df_villes['city'].str.lower() == ville.lower()]
-
-    # Si aucune correspondance n’est trouvée, on retourne None
-    if match.empty:
-        return None
-
-    # Si trouvé, on retourne la première correspondance (lat, lon)
-    return match.iloc[0]['lat'], match.iloc[0]['lng']
+    return catalogue_villes().coordonnees(ville)
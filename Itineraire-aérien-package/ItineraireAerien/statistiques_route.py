@@ -0,0 +1,142 @@
+import contextlib        # Pour mesurer une phase avec un bloc « with »
+import threading         # Les vérifications météo concurrentes alimentent les mêmes compteurs
+import time              # Pour mesurer la durée des phases
+
+_exportateurs = []       # Fonctions appelées par StatistiquesRoute.exporter
+
+
+class StatistiquesRoute:
+    """
+    Durées par phase et compteurs collectés pendant le calcul d'un itinéraire.
+
+    Les noms de phases et de compteurs sont préfixés par le composant qui les produit
+    (``navigation.``, ``meteo.``, ``lissage.``, ``visualisation.``). Les phases peuvent
+    s'imbriquer : ``navigation.meteo`` (temps passé à vérifier les segments, vu depuis la
+    navigation) contient ``meteo.requetes`` et ``meteo.pause``.
+
+    L'objet est partagé sans risque entre threads et peut être sérialisé (pickle).
+
+    :param etiquette: Nom du calcul (ex: "reference" ou "devie"), transmis aux exportateurs.
+    :type etiquette: str or None
+    """
+    def __init__(self, etiquette=None):
+        """
+        Initialise des statistiques vides.
+        """
+        self.etiquette = etiquette
+        self.phases = {}       # Phase -> durée cumulée, en secondes
+        self.compteurs = {}    # Compteur -> valeur
+        self._verrou = threading.Lock()
+
+    @contextlib.contextmanager
+    def phase(self, nom):
+        """
+        Mesure la durée d'un bloc et l'ajoute à la phase `nom`.
+
+        :param nom: Nom de la phase.
+        :type nom: str
+        """
+        debut = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.ajouter_duree(nom, time.perf_counter() - debut)
+
+    def ajouter_duree(self, nom, duree_s):
+        """
+        Ajoute une durée à une phase.
+
+        :param nom: Nom de la phase.
+        :type nom: str
+        :param duree_s: Durée, en secondes.
+        :type duree_s: float
+        """
+        with self._verrou:
+            self.phases[nom] = self.phases.get(nom, 0.0) + duree_s
+
+    def incrementer(self, nom, n=1):
+        """
+        Incrémente un compteur.
+
+        :param nom: Nom du compteur.
+        :type nom: str
+        :param n: Valeur à ajouter.
+        :type n: int
+        """
+        with self._verrou:
+            self.compteurs[nom] = self.compteurs.get(nom, 0) + n
+
+    def en_dict(self):
+        """
+        Retourne les statistiques sous forme de dictionnaire (prêt pour JSON).
+
+        :return: Dictionnaire avec etiquette, phases_s et compteurs.
+        :rtype: dict
+        """
+        with self._verrou:
+            return {"etiquette": self.etiquette, "phases_s": dict(self.phases), "compteurs": dict(self.compteurs)}
+
+    def exporter(self):
+        """
+        Transmet les statistiques à chaque exportateur enregistré (voir :func:`enregistrer_exportateur`).
+        """
+        donnees = self.en_dict()
+        for exportateur in list(_exportateurs):
+            exportateur(donnees)
+
+    def __getstate__(self):
+        return self.en_dict()
+
+    def __setstate__(self, etat):
+        self.__init__(etat["etiquette"])
+        self.phases.update(etat["phases_s"])
+        self.compteurs.update(etat["compteurs"])
+
+    def __repr__(self):
+        return f"StatistiquesRoute({self.en_dict()!r})"
+
+
+def enregistrer_exportateur(fonction):
+    """
+    Enregistre une fonction appelée avec ``StatistiquesRoute.en_dict()`` à chaque export
+    (par exemple pour envoyer les mesures à un système de métriques).
+
+    :param fonction: Fonction à appeler.
+    :type fonction: Callable[[dict], None]
+    :return: La fonction elle-même (utilisable comme décorateur).
+    :rtype: Callable[[dict], None]
+    """
+    _exportateurs.append(fonction)
+    return fonction
+
+
+def retirer_exportateur(fonction):
+    """
+    Retire un exportateur enregistré avec :func:`enregistrer_exportateur`.
+    """
+    _exportateurs.remove(fonction)
+
+
+def phase(statistiques, nom):
+    """
+    Mesure un bloc si des statistiques sont collectées (aucun coût sinon).
+
+    :param statistiques: Statistiques à alimenter, ou None.
+    :type statistiques: StatistiquesRoute or None
+    :param nom: Nom de la phase.
+    :type nom: str
+    """
+    if statistiques is None:
+        return contextlib.nullcontext()
+    return statistiques.phase(nom)
+
+
+def incrementer(statistiques, nom, n=1):
+    """
+    Incrémente un compteur si des statistiques sont collectées.
+
+    :param statistiques: Statistiques à alimenter, ou None.
+    :type statistiques: StatistiquesRoute or None
+    """
+    if statistiques is not None:
+        statistiques.incrementer(nom, n)
@@ -0,0 +1,87 @@
+"""
+Benchmark du temps d'import (démarrage à froid) du paquet ``ItineraireAerien``.
+
+Chaque scénario est exécuté dans un interpréteur neuf (``python -c``), plusieurs fois, et le
+script affiche la durée médiane de l'import ainsi que les bibliothèques lourdes qu'il a
+chargées (numpy, pandas, folium, requests). Le scénario « navigation » correspond à un worker
+qui ne fait que du calcul d'itinéraire ; le scénario « météo synthétique » à un calcul sans
+réseau, qui ne doit pas charger requests.
+
+Usage (depuis le dossier ``Itineraire-aérien-package``) :
+
+    python benchmarks/bench_import.py [--repetitions 7]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+BIBLIOTHEQUES_LOURDES = ["numpy", "pandas", "folium", "requests"]
+
+SCENARIOS = {
+    "paquet seul": "import ItineraireAerien",
+    "navigation": "from ItineraireAerien.Visualisation import NavigationManager",
+    "navigation + données": (
+        "from ItineraireAerien.Visualisation import NavigationManager\n"
+        "NavigationManager('Data/Waypoints.csv').waypoints.donnees()"
+    ),
+    "météo": "from ItineraireAerien.Meteo import MeteoManager",
+    "météo synthétique (sans réseau)": (
+        "from ItineraireAerien.Meteo import MeteoManager, FournisseurSynthetique\n"
+        "MeteoManager(fournisseur=FournisseurSynthetique(graine=0))"
+        ".verifier_conditions_meteo([(40.69, -73.92), (40.8, -74.5)], 40, pause=0)"
+    ),
+    "villes": "from ItineraireAerien.coordonees import transformer_nom_en_coordonnees",
+    "tout (ancien comportement)": (
+        "from ItineraireAerien import *\n"
+        "from ItineraireAerien.Visualisation import VisualisationManager"
+    ),
+}
+
+# Code exécuté dans l'interpréteur neuf : mesure l'instruction puis liste les modules chargés
+MESURE = """
+import sys, time, json
+debut = time.perf_counter()
+exec({code!r})
+duree = time.perf_counter() - debut
+print(json.dumps({{"duree_s": duree,
+                  "chargees": [m for m in {lourdes!r} if m in sys.modules]}}))
+"""
+
+
+def mesurer(code, repetitions):
+    """
+    Exécute un scénario dans des interpréteurs neufs et retourne la durée médiane et les
+    bibliothèques lourdes chargées.
+    """
+    durees, chargees = [], []
+    for _ in range(repetitions):
+        sortie = subprocess.run(
+            [sys.executable, "-c", MESURE.format(code=code, lourdes=BIBLIOTHEQUES_LOURDES)],
+            cwd=BASE_DIR, env={**os.environ, "PYTHONPATH": str(BASE_DIR)},
+            capture_output=True, text=True, check=True,
+        ).stdout
+        resultat = json.loads(sortie.strip().splitlines()[-1])
+        durees.append(resultat["duree_s"])
+        chargees = resultat["chargees"]
+    return statistics.median(durees), chargees
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repetitions", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'scénario':<32}{'médiane (ms)':>14}  bibliothèques chargées")
+    for nom, code in SCENARIOS.items():
+        duree, chargees = mesurer(code, args.repetitions)
+        print(f"{nom:<32}{duree * 1000:>14.1f}  {', '.join(chargees) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark de :meth:`NavigationManager.trouver_point_suivant`.
+
+Compare l'implémentation vectorisée (NumPy) à l'ancienne implémentation basée sur
+``DataFrame.apply`` ligne par ligne, vérifie que les deux choisissent exactement le même
+waypoint, puis affiche le temps moyen par appel et le facteur d'accélération.
+
+Usage (depuis le dossier ``Itineraire-aérien-package``) :
+
+    python benchmarks/bench_trouver_point_suivant.py [--repetitions 5]
+"""
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from ItineraireAerien.Visualisation import NavigationManager  # noqa: E402
+
+WAYPOINT_CSV = BASE_DIR / "Data" / "Waypoints.csv"
+
+# Couples de villes fixes (départ, arrivée) utilisés pour la mesure
+TRAJETS = [
+    ((40.6943, -73.9249), (34.1141, -118.4068)),   # New York → Los Angeles
+    ((40.6943, -73.9249), (35.2083, -80.8303)),    # New York → Charlotte
+    ((45.5089, -73.5617), (49.2827, -123.1207)),   # Montréal → Vancouver
+    ((41.8375, -87.6866), (29.7860, -95.3885)),    # Chicago → Houston
+]
+
+
+def trouver_point_suivant_reference(nav, depart, arrivee, points_utilises):
+    """
+    Ancienne implémentation ligne par ligne, conservée comme référence de comparaison.
+    """
+    df = pd.read_csv(nav.waypoint_csv)[['latitude_deg', 'longitude_deg']].dropna()
+    df = df[~df.apply(lambda row: (row['latitude_deg'], row['longitude_deg']) in points_utilises, axis=1)]
+    df = df[~df.apply(lambda row: (
+        round(row['latitude_deg'], 5), round(row['longitude_deg'], 5)) == (
+        round(arrivee[0], 5), round(arrivee[1], 5)), axis=1)]
+    if df.empty:
+        return None
+    df['angle'] = df.apply(lambda row: nav.calcul_angle(
+        depart, (row['latitude_deg'], row['longitude_deg']), arrivee), axis=1)
+    df['distance'] = df.apply(lambda row: nav.distance(
+        depart, (row['latitude_deg'], row['longitude_deg'])), axis=1)
+    df_filtre = df[(df['angle'] <= math.radians(179)) & (df['distance'] <= nav.rayon_max_km)]
+    if df_filtre.empty:
+        return None
+    point_choisi = df_filtre.loc[df_filtre['angle'].idxmin()]
+    return point_choisi['latitude_deg'], point_choisi['longitude_deg']
+
+
+def generer_requetes(nav, n_aleatoires=40, graine=0):
+    """
+    Construit les requêtes (départ, arrivée, points utilisés) : trajets fixes parcourus
+    de proche en proche, complétés par des couples aléatoires reproductibles.
+    """
+    requetes = []
+    for depart, arrivee in TRAJETS:
+        point, utilises = depart, []
+        for _ in range(10):
+            requetes.append((point, arrivee, list(utilises)))
+            suivant = nav.trouver_point_suivant(point, arrivee, utilises)
+            if suivant is None:
+                break
+            utilises.append(suivant)
+            point = suivant
+
+    rng = random.Random(graine)
+    for _ in range(n_aleatoires):
+        depart = (rng.uniform(25, 55), rng.uniform(-125, -65))
+        arrivee = (rng.uniform(25, 55), rng.uniform(-125, -65))
+        requetes.append((depart, arrivee, []))
+    return requetes
+
+
+def chronometrer(fonction, requetes, repetitions):
+    """
+    Retourne le temps moyen (en secondes) par appel de `fonction` sur les requêtes.
+    """
+    debut = time.perf_counter()
+    for _ in range(repetitions):
+        for depart, arrivee, utilises in requetes:
+            fonction(depart, arrivee, utilises)
+    return (time.perf_counter() - debut) / (repetitions * len(requetes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repetitions", type=int, default=3)
+    args = parser.parse_args()
+
+    nav = NavigationManager(str(WAYPOINT_CSV))
+    requetes = generer_requetes(nav)
+
+    # Vérification : les deux implémentations doivent choisir le même waypoint
+    for depart, arrivee, utilises in requetes:
+        attendu = trouver_point_suivant_reference(nav, depart, arrivee, utilises)
+        obtenu = nav.trouver_point_suivant(depart, arrivee, utilises)
+        if attendu != obtenu:
+            raise SystemExit(f"Divergence pour {depart} → {arrivee} : {attendu} != {obtenu}")
+
+    t_reference = chronometrer(
+        lambda d, a, u: trouver_point_suivant_reference(nav, d, a, u), requetes, 1)
+    t_vectorise = chronometrer(nav.trouver_point_suivant, requetes, args.repetitions)
+
+    print(f"Requêtes vérifiées    : {len(requetes)} (choix identiques)")
+    print(f"Référence (apply)     : {t_reference * 1000:8.2f} ms/appel")
+    print(f"Vectorisé (NumPy)     : {t_vectorise * 1000:8.2f} ms/appel")
+    print(f"Accélération          : x{t_reference / t_vectorise:.1f}")
+
+
+if __name__ == "__main__":
+    main()
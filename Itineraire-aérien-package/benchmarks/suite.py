@@ -0,0 +1,364 @@
+"""
+Suite de benchmarks des chemins critiques : navigation, météo, lissage et cartographie.
+
+Tout s'exécute hors ligne : la météo provient de `FournisseurSynthetique` (champ de vent
+déterministe), et les jeux de waypoints agrandis (x10, x100) sont générés à partir du fichier
+d'origine avec une graine fixe. Les résultats sont écrits au format JSON (un enregistrement par
+mesure, avec la médiane et le minimum des répétitions) afin de pouvoir comparer deux versions :
+
+    python benchmarks/suite.py --sortie avant.json
+    ... modifications ...
+    python benchmarks/suite.py --sortie apres.json --comparer avant.json
+
+Usage (depuis le dossier ``Itineraire-aérien-package``) :
+
+    python benchmarks/suite.py [--rapide] [--sortie resultats.json] [--comparer reference.json]
+"""
+import argparse
+import contextlib
+import datetime
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from ItineraireAerien.Avion import AvionManager  # noqa: E402
+from ItineraireAerien.Meteo import FournisseurSynthetique, MeteoManager  # noqa: E402
+from ItineraireAerien.Visualisation import (NavigationManager, TrajectoireManager,  # noqa: E402
+                                            VisualisationManager, WaypointStore)
+
+WAYPOINT_CSV = BASE_DIR / "Data" / "Waypoints.csv"
+AVIONS_CSV = BASE_DIR / "Data" / "avions.csv"
+
+# Couples de villes fixes (départ, arrivée)
+TRAJETS = {
+    "new_york-charlotte": ((40.6943, -73.9249), (35.2083, -80.8303)),
+    "chicago-houston": ((41.8375, -87.6866), (29.7860, -95.3885)),
+    "new_york-los_angeles": ((40.6943, -73.9249), (34.1141, -118.4068)),
+}
+SEUIL_KPH = 40
+
+
+def mesurer(fonction, repetitions):
+    """
+    Exécute `fonction` une fois (échauffement) puis `repetitions` fois, et retourne les durées.
+
+    :return: Dictionnaire avec median_s, min_s et repetitions.
+    :rtype: dict
+    """
+    fonction()
+    durees = []
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fonction()
+        durees.append(time.perf_counter() - debut)
+    return {"median_s": statistics.median(durees), "min_s": min(durees), "repetitions": repetitions}
+
+
+def meteo_synthetique(**parametres):
+    """
+    Retourne un `MeteoManager` alimenté par le champ de vent synthétique (aucune requête réseau).
+    """
+    latence_s = parametres.pop("latence_s", 0)
+    return MeteoManager(fournisseur=FournisseurSynthetique(graine=0, latence_s=latence_s), **parametres)
+
+
+def requetes_navigation(nav, n_aleatoires=40, graine=0):
+    """
+    Requêtes (départ, arrivée, points utilisés) : trajets fixes parcourus de proche en proche,
+    complétés par des couples aléatoires reproductibles.
+    """
+    requetes = []
+    for depart, arrivee in TRAJETS.values():
+        point, utilises = depart, []
+        for _ in range(10):
+            requetes.append((point, arrivee, list(utilises)))
+            suivant = nav.trouver_point_suivant(point, arrivee, utilises)
+            if suivant is None:
+                break
+            utilises.append(suivant)
+            point = suivant
+    rng = random.Random(graine)
+    for _ in range(n_aleatoires):
+        requetes.append(((rng.uniform(25, 55), rng.uniform(-125, -65)),
+                         (rng.uniform(25, 55), rng.uniform(-125, -65)), []))
+    return requetes
+
+
+def compter_evaluations(rappel):
+    """
+    Enveloppe un callback météo pour compter ses appels (un appel par segment évalué).
+
+    :return: Callback enveloppé et liste à un élément contenant le nombre d'appels.
+    :rtype: tuple[Callable, list[int]]
+    """
+    compteur = [0]
+
+    def rappel_compte(coords, seuil):
+        compteur[0] += 1
+        return rappel(coords, seuil)
+    return rappel_compte, compteur
+
+
+def bench_navigation(repetitions):
+    nav = NavigationManager(str(WAYPOINT_CSV))
+    meteo = meteo_synthetique()
+    rappel = lambda coords, seuil: meteo.verifier_conditions_meteo(coords, seuil, pause=0)  # noqa: E731
+    resultats = []
+
+    requetes = requetes_navigation(nav)
+    mesure = mesurer(lambda: [nav.trouver_point_suivant(d, a, u) for d, a, u in requetes], repetitions)
+    resultats.append({"nom": "navigation.trouver_point_suivant", "par_appel_s": mesure["median_s"] / len(requetes),
+                      "appels": len(requetes), **mesure})
+
+    for mode in ("glouton", "astar", "astar_meteo"):
+        for nom_trajet, (depart, arrivee) in TRAJETS.items():
+            rappel_compte, evaluations = compter_evaluations(rappel)
+            nav.tracer_chemin(depart, arrivee, SEUIL_KPH, rappel_compte, mode=mode)
+            segments = []
+            mesure = mesurer(lambda: segments.append(
+                nav.tracer_chemin(depart, arrivee, SEUIL_KPH, rappel, mode=mode)[0]), repetitions)
+            resultats.append({"nom": f"navigation.tracer_chemin[{mode}]", "trajet": nom_trajet,
+                              "nb_waypoints": (len(segments[-1]) - 1) // 2,
+                              "evaluations_meteo": evaluations[0], **mesure})
+
+    # Itinéraire de chaque avion de la flotte, en une seule passe
+    seuils = [float(avion.vitesse_vent_admissible) for avion in AvionManager(str(AVIONS_CSV)).avions()]
+    for nom_trajet, (depart, arrivee) in TRAJETS.items():
+        balayages = []
+        mesure = mesurer(lambda: balayages.append(nav.balayer_seuils(depart, arrivee, seuils, rappel)),
+                         repetitions)
+        resultats.append({"nom": "navigation.balayer_seuils", "trajet": nom_trajet,
+                          "seuils": len(balayages[-1]),
+                          "itineraires_distincts": len({str(r[0]) for r in balayages[-1].values()}), **mesure})
+    return resultats
+
+
+def bench_meteo(repetitions):
+    rng = np.random.default_rng(0)
+    points = list(zip(rng.uniform(25, 50, 600).tolist(), rng.uniform(-120, -70, 600).tolist()))
+    segments = [points[i:i + 6] for i in range(0, len(points), 6)]
+    resultats = []
+    configurations = [
+        ("sequentiel", {"concurrence": 1}, 0),
+        ("concurrent_latence_2ms", {"concurrence": 8}, 0.002),
+    ]
+    for nom, parametres, latence_s in configurations:
+        meteo = meteo_synthetique(latence_s=latence_s, **parametres)
+        # Seuil élevé : aucun segment n'est interrompu, tous les points sont évalués
+        mesure = mesurer(lambda: [meteo.verifier_conditions_meteo(s, 1000, pause=0) for s in segments],
+                         repetitions)
+        resultats.append({"nom": f"meteo.verifier_conditions_meteo[{nom}]", "points": len(points),
+                          "points_par_s": len(points) / mesure["median_s"], **mesure})
+    return resultats
+
+
+def route_lissage(nb_jonctions=500, graine=0):
+    rng = random.Random(graine)
+    return [[(rng.uniform(25, 50), rng.uniform(-120, -70)) for _ in range(rng.randint(1, 7))]
+            for _ in range(nb_jonctions + 1)]
+
+
+def bench_trajectoire(repetitions):
+    trajectoire = TrajectoireManager()
+    route = route_lissage()
+    resultats = []
+    for nom, fonction in (("lisser", trajectoire.lisser),
+                          ("trajectoire_lisse_avec_controles", trajectoire.trajectoire_lisse_avec_controles)):
+        mesure = mesurer(lambda: fonction(route), repetitions)
+        resultats.append({"nom": f"trajectoire.{nom}", "jonctions": len(route) - 1, **mesure})
+    return resultats
+
+
+def bench_visualisation(repetitions):
+    rng = random.Random(0)
+    itineraire = TrajectoireManager().trajectoire_lisse_avec_controles(route_lissage(100))
+    points_meteo = [(rng.uniform(25, 50), rng.uniform(-120, -70), rng.choice([None, rng.uniform(0, 80)]))
+                    for _ in range(2000)]
+    resultats = []
+    for tolerance in (None, 200):
+        visualisation = VisualisationManager(tolerance_simplification_m=tolerance)
+        taille = []
+        mesure = mesurer(lambda: taille.append(len(visualisation.generer_html(
+            visualisation.afficher_double_itineraire(itineraire, itineraire, points_meteo, SEUIL_KPH)))),
+            repetitions)
+        resultats.append({"nom": "visualisation.afficher_double_itineraire+html",
+                          "tolerance_m": tolerance, "points_meteo": len(points_meteo),
+                          "points_trace": len(itineraire), "taille_html": taille[-1], **mesure})
+    return resultats
+
+
+def generer_waypoints(facteur, dossier, graine=0):
+    """
+    Écrit un fichier de waypoints `facteur` fois plus grand que l'original : chaque waypoint est
+    recopié avec un décalage aléatoire (écart-type 0,5°) autour de sa position.
+    """
+    import pandas as pd
+
+    origine = pd.read_csv(WAYPOINT_CSV).dropna(subset=['latitude_deg', 'longitude_deg'])
+    if facteur == 1:
+        return WAYPOINT_CSV
+    rng = np.random.default_rng(graine)
+    copies = pd.concat([origine] * facteur, ignore_index=True)
+    decalage = rng.normal(0, 0.5, (len(copies), 2))
+    decalage[:len(origine)] = 0  # Les waypoints d'origine sont conservés tels quels
+    copies['latitude_deg'] = np.clip(copies['latitude_deg'] + decalage[:, 0], -90, 90)
+    copies['longitude_deg'] = (copies['longitude_deg'] + decalage[:, 1] + 180) % 360 - 180
+    copies['ident'] = [f"{i}_{k}" for k, i in enumerate(copies['ident'])]
+    chemin = Path(dossier) / f"waypoints_x{facteur}.csv"
+    copies.to_csv(chemin, index=False)
+    return chemin
+
+
+def bench_echelle(repetitions, facteurs):
+    resultats = []
+    with tempfile.TemporaryDirectory() as dossier:
+        for facteur in facteurs:
+            chemin = generer_waypoints(facteur, dossier)
+            debut = time.perf_counter()
+            donnees = WaypointStore(chemin).donnees()  # Lecture complète du fichier, hors stockage partagé
+            chargement_s = time.perf_counter() - debut
+            WaypointStore.partage(chemin).installer(donnees)
+            debut = time.perf_counter()
+            donnees.grille()
+            index_s = time.perf_counter() - debut
+
+            nav = NavigationManager(str(chemin))
+            meteo = meteo_synthetique()
+            rappel = lambda coords, seuil: meteo.verifier_conditions_meteo(coords, seuil, pause=0)  # noqa: E731
+            requetes = requetes_navigation(nav, n_aleatoires=20)
+            mesure = mesurer(lambda: [nav.trouver_point_suivant(d, a, u) for d, a, u in requetes], repetitions)
+            resultats.append({"nom": "echelle.trouver_point_suivant", "facteur": facteur,
+                              "nb_waypoints": len(donnees), "chargement_s": chargement_s, "index_s": index_s,
+                              "par_appel_s": mesure["median_s"] / len(requetes), **mesure})
+
+            depart, arrivee = TRAJETS["new_york-charlotte"]
+            segments = []
+            mesure = mesurer(lambda: segments.append(nav.tracer_chemin(depart, arrivee, SEUIL_KPH, rappel)[0]),
+                             repetitions)
+            resultats.append({"nom": "echelle.tracer_chemin[glouton]", "facteur": facteur,
+                              "nb_waypoints": len(donnees), "trajet": "new_york-charlotte",
+                              "etapes": (len(segments[-1]) - 1) // 2, **mesure})
+    return resultats
+
+
+def metadonnees():
+    """
+    Informations permettant de situer une série de mesures (version du code, environnement).
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=BASE_DIR, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plateforme": platform.platform(),
+    }
+
+
+def cle(resultat):
+    """
+    Identifie une mesure indépendamment de sa valeur (nom et paramètres).
+    """
+    parametres = {k: v for k, v in resultat.items()
+                  if k in ("nom", "trajet", "facteur", "tolerance_m")}
+    return json.dumps(parametres, sort_keys=True)
+
+
+def comparer(resultats, reference, tolerance):
+    """
+    Affiche le rapport des médianes entre deux séries et retourne le nombre de régressions
+    (mesures plus lentes que la référence de plus de `tolerance`).
+    """
+    anciens = {cle(r): r for r in reference["resultats"]}
+    regressions = 0
+    print(f"\n{'mesure':<90}{'avant (ms)':>12}{'après (ms)':>12}{'rapport':>9}")
+    for resultat in resultats:
+        ancien = anciens.get(cle(resultat))
+        if ancien is None:
+            continue
+        rapport = resultat["median_s"] / ancien["median_s"]
+        marque = ""
+        if rapport > 1 + tolerance:
+            regressions += 1
+            marque = "  <-- régression"
+        print(f"{cle(resultat):<90}{ancien['median_s'] * 1000:>12.2f}"
+              f"{resultat['median_s'] * 1000:>12.2f}{rapport:>9.2f}{marque}")
+    return regressions
+
+
+def verifier_evaluations_meteo(resultats):
+    """
+    Compare, pour chaque trajet, le nombre de segments évalués par les modes astar_meteo et
+    glouton, et retourne le nombre de trajets où astar_meteo en évalue davantage.
+    """
+    par_mode = {(r["nom"], r["trajet"]): r["evaluations_meteo"] for r in resultats if "evaluations_meteo" in r}
+    depassements = 0
+    print(f"\n{'trajet':<24}{'glouton':>9}{'astar_meteo':>13}  (segments évalués)", file=sys.stderr)
+    for nom_trajet in TRAJETS:
+        glouton = par_mode[("navigation.tracer_chemin[glouton]", nom_trajet)]
+        astar_meteo = par_mode[("navigation.tracer_chemin[astar_meteo]", nom_trajet)]
+        marque = ""
+        if astar_meteo > glouton:
+            depassements += 1
+            marque = "  <-- plus d'évaluations que le glouton"
+        print(f"{nom_trajet:<24}{glouton:>9}{astar_meteo:>13}{marque}", file=sys.stderr)
+    return depassements
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--rapide", action="store_true", help="Moins de répétitions, sans l'échelle x100.")
+    parser.add_argument("--sortie", help="Fichier JSON des résultats (par défaut : sortie standard).")
+    parser.add_argument("--comparer", help="Fichier JSON de référence à comparer.")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Ralentissement relatif toléré avant de signaler une régression.")
+    args = parser.parse_args()
+
+    repetitions = 2 if args.rapide else args.repetitions
+    facteurs = (1, 10) if args.rapide else (1, 10, 100)
+
+    resultats = []
+    # Les messages affichés par le code mesuré ne doivent pas se mêler au JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        for bench in (bench_navigation, bench_meteo, bench_trajectoire, bench_visualisation):
+            resultats.extend(bench(repetitions))
+            print(f"{bench.__name__} terminé")
+        resultats.extend(bench_echelle(repetitions, facteurs))
+        print("bench_echelle terminé")
+
+    document = {"meta": metadonnees(), "resultats": resultats}
+    texte = json.dumps(document, indent=2, ensure_ascii=False)
+    if args.sortie:
+        Path(args.sortie).write_text(texte, encoding="utf-8")
+    else:
+        print(texte)
+
+    # Le mode astar_meteo ne doit pas demander plus de météo que le routage glouton
+    depassements = verifier_evaluations_meteo(resultats)
+
+    regressions = 0
+    if args.comparer:
+        reference = json.loads(Path(args.comparer).read_text(encoding="utf-8"))
+        regressions = comparer(resultats, reference, args.tolerance)
+        print(f"\n{regressions} régression(s) au-delà de {args.tolerance:.0%}")
+    sys.exit(1 if regressions or depassements else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,9 +10,12 @@ Fonctionnalités principales :
 - Sélection interactive des villes de départ et d’arrivée.
 - Calcul d’un itinéraire direct (sans contrainte météo).
 - Choix de l’avion (libre ou filtré par vent admissible).
-- Calcul d’un itinéraire dévié basé sur les contraintes météo réelles.
+- Calcul d’un itinéraire dévié basé sur les contraintes météo réelles (les vents relevés pour
+  l’itinéraire de référence sont réutilisés, sans nouvelle requête).
+- Suivi du calcul en direct (progression et tracé partiel), avec possibilité de l’interrompre.
 - Affichage d’une carte interactive avec les trajets (via Folium).
 - Résumé synthétique de la simulation.
+- Mesures de performance du calcul (durée par phase, requêtes météo), affichables dans la barre latérale.
 
 Modules utilisés :
 ------------------
@@ -46,16 +49,23 @@ import pandas as pd  # Pour manipuler les fichiers CSV
 import streamlit as st  # Pour l'application web interactive
 from streamlit.components.v1 import html  # Pour afficher du HTML brut
 from pathlib import Path
+import time  # Pour dater les instantanés météo des itinéraires mémorisés
+import threading  # Pour protéger les itinéraires mémorisés, partagés entre sessions
+from collections import OrderedDict  # Itinéraires mémorisés, du moins au plus récemment utilisé
+from concurrent.futures import Future  # Résultat attendu d'un itinéraire en cours de calcul
 # === Importation des Itineraire-aérien-package personnalisés ===
 import ItineraireAerien
 from ItineraireAerien.Avion import AvionManager
 from ItineraireAerien.coordonees import transformer_nom_en_coordonnees
+from ItineraireAerien.coordonees import catalogue_villes
 from ItineraireAerien.Meteo import DonneesMeteo
 from ItineraireAerien.Meteo import MeteoManager
+from ItineraireAerien.Meteo import CacheMeteo
+from ItineraireAerien.Meteo import ObservationsSimulation
 from ItineraireAerien.Visualisation import NavigationManager
 from ItineraireAerien.Visualisation import TrajectoireManager
 from ItineraireAerien.Visualisation import VisualisationManager
-import os
+from ItineraireAerien.statistiques_route import StatistiquesRoute
 
 # Constantes globales du projet
 CLE_API = "d9ac5ac56f3d4768abd232315250506"
@@ -64,19 +74,194 @@ BASE_DIR = Path(__file__).resolve().parent
 WAYPOINT_CSV = BASE_DIR / "Data" / "Waypoints.csv"
 VILLES_CSV = BASE_DIR / "Data" / "Villes.csv"
 AVIONS_CSV = BASE_DIR / "Data" / "avions.csv"
-cartes_dir = BASE_DIR / "Itineraire-aérien-package" / "Cartes"
+DUREE_VIE_METEO_S = 900  # Durée de validité d'une donnée météo (intervalle de mise à jour de WeatherAPI)
+MAX_ITINERAIRES_MEMORISES = 64  # Nombre maximal d'itinéraires conservés en mémoire
+INTERVALLE_RENDU_S = 2  # Intervalle minimal entre deux rendus de la carte pendant le calcul
 
 
-# Chargement des villes disponibles depuis le CSV
-# (doit contenir les colonnes : city, lat, lng)
-df_villes = pd.read_csv(VILLES_CSV)
+# Catalogue des villes disponibles (chargé une seule fois par processus, partagé entre sessions)
+catalogue = catalogue_villes()
+
+
+@st.cache_resource(show_spinner=False)
+def initialiser_managers():
+    """
+    Crée les gestionnaires une seule fois par processus ; ils sont partagés par toutes les
+    sessions et toutes les réexécutions du script.
+    """
+    return (
+        AvionManager(AVIONS_CSV),  # Gestionnaire des avions
+        NavigationManager(WAYPOINT_CSV),  # Gestionnaire de navigation
+        MeteoManager(CLE_API, concurrence=6, requetes_par_seconde=10,
+                     cache=CacheMeteo(duree_vie_s=DUREE_VIE_METEO_S)),  # Gestionnaire météo (requêtes concurrentes, cache)
+        TrajectoireManager(),  # Lissage des trajectoires
+        VisualisationManager(tolerance_simplification_m=200),  # Génération de cartes (tracés simplifiés à 200 m)
+    )
+
 
 # Initialisation des gestionnaires (managers)
-avion_manager = AvionManager(AVIONS_CSV)  #: Gestionnaire des avions
-navigation_manager = NavigationManager(WAYPOINT_CSV)  #: Gestionnaire de navigation
-meteo_manager = MeteoManager(CLE_API)  #: Gestionnaire météo
-trajectoire_manager = TrajectoireManager()  #: Lissage des trajectoires
-visualisation_manager = VisualisationManager()  #: Génération de cartes
+avion_manager, navigation_manager, meteo_manager, trajectoire_manager, visualisation_manager = initialiser_managers()
+
+
+@st.cache_resource(show_spinner=False)
+def itineraires_memorises():
+    """
+    Itinéraires déjà calculés, partagés par toutes les sessions (au plus
+    `MAX_ITINERAIRES_MEMORISES`, les moins récemment utilisés sont oubliés), et itinéraires en
+    cours de calcul (clé -> `Future`), que les autres sessions attendent au lieu de les recalculer.
+    """
+    return OrderedDict(), {}, threading.Lock()
+
+
+def calculer_itineraire(depart, arrivee, seuil, rayon_max_km, instant_meteo, etiquette=None, par_risque=False,
+                        observations=None, suivi=None):
+    """
+    Calcule et lisse un itinéraire ; le résultat est mémorisé pour toutes les sessions.
+
+    `instant_meteo` (numéro de la tranche de `DUREE_VIE_METEO_S` secondes en cours) fait partie
+    de la clé : un même trajet est recalculé dès que les données météo ont pu changer.
+    `rayon_max_km` doit correspondre au rayon du gestionnaire de navigation.
+
+    Les mesures du calcul (:class:`StatistiquesRoute`) sont retournées avec le résultat et
+    transmises aux exportateurs enregistrés ; un résultat mémorisé conserve les mesures du
+    calcul qui l'a produit.
+
+    `observations` (registre des vents relevés pendant la simulation, hors clé de mémorisation)
+    est consulté avant toute requête météo et complété par les points obtenus.
+    Avec `par_risque`, les segments sont vérifiés dans l'ordre de risque : mêmes décisions, moins de
+    requêtes, mais données météo limitées aux points examinés (le vent max n'est qu'un minorant).
+
+    `suivi` est appelé avec chaque segment (:class:`SegmentChemin`) dès qu'il est jugé. Si le
+    calcul est interrompu (nouvelle exécution du script), les vérifications restantes ne sont pas
+    lancées et rien n'est mémorisé.
+
+    Un même itinéraire n'est calculé qu'une fois à la fois : une session qui demande un
+    itinéraire déjà en cours de calcul attend son résultat (sans `suivi`). Si ce calcul échoue
+    ou est interrompu, la première session en attente le relance.
+    """
+    memoire, en_cours, verrou = itineraires_memorises()
+    cle = (depart, arrivee, seuil, rayon_max_km, instant_meteo, etiquette, par_risque)
+    while True:
+        with verrou:
+            if cle in memoire:
+                memoire.move_to_end(cle)
+                return memoire[cle]
+            attente = en_cours.get(cle)
+            if attente is None:
+                attente = en_cours[cle] = Future()  # Calcul pris en charge par cette session
+                break
+        resultat = attente.result()
+        if resultat is not None:
+            return resultat
+
+    resultat = None
+    try:
+        resultat = _calculer_itineraire(depart, arrivee, seuil, etiquette, par_risque, observations, suivi)
+        with verrou:
+            memoire[cle] = resultat
+            while len(memoire) > MAX_ITINERAIRES_MEMORISES:
+                memoire.popitem(last=False)
+    finally:
+        with verrou:
+            del en_cours[cle]
+        attente.set_result(resultat)  # None en cas d'échec : les sessions en attente relancent le calcul
+    return resultat
+
+
+def _calculer_itineraire(depart, arrivee, seuil, etiquette, par_risque, observations, suivi):
+    """
+    Calcule et lisse un itinéraire, sans mémorisation (voir :func:`calculer_itineraire`).
+    """
+    statistiques = StatistiquesRoute(etiquette)
+    segments = []
+    with statistiques.phase("navigation.total"):  # Affichage du suivi compris (phase « suivi »)
+        for segment in navigation_manager.iterer_chemin(
+                depart, arrivee, seuil=seuil,
+                verifier_meteo_callback=lambda coords, seuil: meteo_manager.verifier_conditions_meteo(
+                    coords, seuil, statistiques=statistiques, observations=observations, par_risque=par_risque),
+                statistiques=statistiques):
+            segments.append(segment)
+            if suivi is not None:
+                with statistiques.phase("suivi"):
+                    suivi(segment)
+    itin, points_meteo, vent_max = navigation_manager.assembler_chemin(segments, arrivee)
+    # Lissage de la trajectoire pour un affichage plus esthétique
+    lisse = trajectoire_manager.trajectoire_lisse_avec_controles(itin, statistiques)
+    statistiques.exporter()
+    return lisse, points_meteo, vent_max, statistiques
+
+
+def suivre_calcul(depart, arrivee, seuil):
+    """
+    Prépare l'affichage en direct d'un calcul : barre de progression (distance restante jusqu'à
+    l'arrivée) et carte du tracé partiel, redessinée au plus toutes les `INTERVALLE_RENDU_S` secondes.
+
+    :return: Fonction de suivi à passer à :func:`calculer_itineraire`, et fonction qui efface
+             l'affichage une fois le calcul terminé.
+    :rtype: tuple[Callable, Callable]
+    """
+    progression = st.progress(0.0, text="Recherche du premier segment...")
+    carte_partielle = st.empty()
+    distance_totale = max(navigation_manager.distance(depart, arrivee), 1e-9)
+    trace = [depart]   # Tracé brut des segments acceptés
+    points = []        # Points météo des segments acceptés
+    dernier_rendu = [time.monotonic()]
+
+    def suivi(segment):
+        if segment.accepte:
+            trace.extend(segment.coordonnees)
+            trace.append(segment.destination)
+            points.extend(segment.donnees_meteo)
+        avance = 1 - navigation_manager.distance(trace[-1], arrivee) / distance_totale
+        progression.progress(
+            min(max(avance, 0.0), 1.0),
+            text=f"{segment.segments_acceptes} segments acceptés, {segment.segments_refuses} refusés | "
+                 f"Vent max : {segment.vent_max_total:.1f} km/h")
+        if points and time.monotonic() - dernier_rendu[0] >= INTERVALLE_RENDU_S:
+            carte = visualisation_manager.afficher_meteo_sur_carte(points, seuil, trace)
+            with carte_partielle:
+                html(visualisation_manager.generer_html(carte), height=400)
+            dernier_rendu[0] = time.monotonic()
+
+    def effacer():
+        progression.empty()
+        carte_partielle.empty()
+
+    return suivi, effacer
+
+
+def instant_meteo():
+    """
+    Retourne l'instantané météo courant (tranche de `DUREE_VIE_METEO_S` secondes).
+    """
+    return int(time.time() // DUREE_VIE_METEO_S)
+
+
+def afficher_statistiques():
+    """
+    Affiche dans la barre latérale les mesures des derniers calculs de la session, ainsi que
+    les compteurs du cache météo.
+    """
+    if not st.session_state.get("afficher_mesures"):
+        panneau_statistiques.empty()
+        return
+    with panneau_statistiques.container():
+        with st.expander("Mesures de performance", expanded=True):
+            if not st.session_state.statistiques:
+                st.caption("Aucun calcul effectué pour le moment.")
+            for etiquette, statistiques in st.session_state.statistiques.items():
+                st.markdown(f"**{etiquette}**")
+                st.table(pd.DataFrame(
+                    sorted(statistiques.phases.items()), columns=["Phase", "Durée (s)"]).set_index("Phase"))
+                st.table(pd.DataFrame(
+                    sorted(statistiques.compteurs.items()), columns=["Compteur", "Valeur"]).set_index("Compteur"))
+            if st.session_state.get("observations") is not None:
+                st.markdown("**Observations de la simulation**")
+                st.json(st.session_state.observations.statistiques())
+            if meteo_manager.cache is not None:
+                st.markdown("**Cache météo**")
+                st.json(meteo_manager.cache.statistiques())
+
 
 # --- Interface utilisateur Streamlit ---
 
@@ -85,10 +270,22 @@ st.set_page_config(page_title="Simulation de Trajectoire Aérienne", layout="wid
 st.title("Simulation de Trajectoire Aérienne avec Météo")
 st.sidebar.markdown("[📄 Consulter la documentation Sphinx](http://localhost:63342/Projet_Special_Rendu_D/docs/build/html/index.html)")
 st.sidebar.header("Paramètres de vol")
+verification_rapide = st.sidebar.checkbox(
+    "Vérification rapide de l’itinéraire dévié",
+    help="Interroge d’abord les points les plus venteux de chaque segment et s’arrête dès que la décision "
+         "est acquise : même itinéraire, moins de requêtes, mais vent max minoré (points non interrogés).")
 
 # === Sélection des villes de départ et d'arrivée ===
-ville_depart = st.sidebar.selectbox("Ville de départ", df_villes['city'].sort_values().unique())
-ville_arrivee = st.sidebar.selectbox("Ville d’arrivée", df_villes['city'].sort_values().unique())
+noms_villes = catalogue.noms_tries()
+ville_depart = st.sidebar.selectbox("Ville de départ", noms_villes)
+ville_arrivee = st.sidebar.selectbox("Ville d’arrivée", noms_villes)
+
+# Noms ambigus : la première ville du fichier (la plus peuplée) est retenue
+for ville in (ville_depart, ville_arrivee):
+    homonymes = catalogue.rechercher(ville)
+    if len(homonymes) > 1:
+        st.sidebar.caption(f"{len(homonymes)} villes nommées « {ville} » : "
+                           f"la première du catalogue ({homonymes[0].lat:.2f}, {homonymes[0].lng:.2f}) est retenue.")
 
 # Validation : les deux villes doivent être différentes
 if ville_depart == ville_arrivee:
@@ -108,23 +305,45 @@ if "itin_droit_lisse" not in st.session_state:
     st.session_state.itin_droit_lisse = None
     st.session_state.meteo_droit = None
     st.session_state.vent_max_ref = None
+    st.session_state.observations = None  # Vents relevés pendant la simulation en cours
+    st.session_state.instant_observations = None
+if "statistiques" not in st.session_state:
+    st.session_state.statistiques = {}  # Étiquette du calcul -> StatistiquesRoute
+
+# Panneau des mesures de performance, mis à jour après chaque calcul
+st.sidebar.checkbox("Afficher les mesures de performance", key="afficher_mesures")
+panneau_statistiques = st.sidebar.empty()
+afficher_statistiques()
+
+# Un clic sur « Arrêter » relance le script, ce qui interrompt le calcul en cours
+if st.session_state.get("arreter_reference") or st.session_state.get("arreter_devie"):
+    st.info("Calcul interrompu : aucune autre requête météo n’a été envoyée.")
 
 # --- Bouton : Calcul de l'itinéraire direct sans contrainte météo ---
 if st.sidebar.button("Lancer le calcul de l'itinéraire de référence"):
     st.subheader("Calcul de l’itinéraire de référence (sans contraintes)")
-    with st.spinner("Calcul en cours (le calcul peut prendre quelques minutes)..."):
-        # Trace un itinéraire direct sans filtre météo (seuil très élevé)
-        itin_droit, meteo_droit, vent_max_ref = navigation_manager.tracer_chemin(
-            depart, arrivee, seuil=10000,  # Seuil très haut pour ignorer les contraintes
-            verifier_meteo_callback=lambda coords, seuil: meteo_manager.verifier_conditions_meteo(coords, seuil)
-        )
-        # Lissage de la trajectoire pour un affichage plus esthétique
-        itin_droit_lisse = trajectoire_manager.trajectoire_lisse_avec_controles(itin_droit)
-
-        # Sauvegarde dans la session
-        st.session_state.itin_droit_lisse = itin_droit_lisse
-        st.session_state.meteo_droit = meteo_droit
-        st.session_state.vent_max_ref = vent_max_ref
+    st.button("⏹ Arrêter le calcul", key="arreter_reference")
+    suivi, effacer_suivi = suivre_calcul(depart, arrivee, 10000)
+    # Trace un itinéraire direct sans filtre météo (seuil très élevé pour ignorer les contraintes) ;
+    # les vents relevés sont conservés pour le calcul de l'itinéraire dévié
+    observations = ObservationsSimulation()
+    instant = instant_meteo()
+    itin_droit_lisse, meteo_droit, vent_max_ref, statistiques_ref = calculer_itineraire(
+        depart, arrivee, 10000, navigation_manager.rayon_max_km, instant, "Itinéraire de référence",
+        observations=observations, suivi=suivi)
+    effacer_suivi()
+    if not observations:
+        # Itinéraire mémorisé : le calcul n'a pas eu lieu, on reprend ses points météo
+        observations.enregistrer_points(meteo_droit)
+
+    # Sauvegarde dans la session
+    st.session_state.itin_droit_lisse = itin_droit_lisse
+    st.session_state.meteo_droit = meteo_droit
+    st.session_state.vent_max_ref = vent_max_ref
+    st.session_state.observations = observations
+    st.session_state.instant_observations = instant
+    st.session_state.statistiques = {"Itinéraire de référence": statistiques_ref}
+    afficher_statistiques()
 
     st.success(f"Itinéraire de référence calculé | Vent max détecté : {vent_max_ref:.1f} km/h")
 
@@ -136,7 +355,7 @@ if st.session_state.itin_droit_lisse:
     st.subheader("Choix de l'avion")
     mode = st.radio("Mode de sélection de l'avion :", ["Choix libre (mode 1)", "Filtré par conditions météo (mode 2)"])
 
-    type_avions = ["-- Sélectionner un type --"] + list(avion_manager.df['type'].unique())
+    type_avions = ["-- Sélectionner un type --"] + list(avion_manager.types())
     type_choisi = st.selectbox("Type d’avion :", type_avions)
 
     if type_choisi == "-- Sélectionner un type --":
@@ -144,66 +363,73 @@ if st.session_state.itin_droit_lisse:
         st.stop()
 
     if mode == "Choix libre (mode 1)":
-        avions_type = avion_manager.df[avion_manager.df['type'] == type_choisi]
-        if avions_type.empty:
+        avions_type = avion_manager.rechercher(type_choisi)
+        if not avions_type:
             st.warning("Aucun avion de ce type n’est disponible.")
             st.stop()
-        nom_avion = st.selectbox("Modèle d’avion :", avions_type['nom'].values)
-        avion = avions_type[avions_type['nom'] == nom_avion].iloc[0]
+        avion = st.selectbox("Modèle d’avion :", avions_type, format_func=lambda fiche: fiche.nom)
     else:
         # Mode 2 : filtrer selon le vent détecté sur l’itinéraire de référence
         borne_min = int(max(0, vent_max_ref - 4))
         borne_max = int(vent_max_ref - 2)
         st.info(f"Recherche des avions supportant entre {borne_min} et {borne_max} km/h de vent.")
 
-        avions_filtres = avion_manager.df[
-            (avion_manager.df['type'] == type_choisi) &
-            (avion_manager.df['vitesse_vent_admissible'] >= borne_min) &
-            (avion_manager.df['vitesse_vent_admissible'] <= borne_max)
-        ]
-        if avions_filtres.empty:
+        avions_filtres = avion_manager.rechercher(type_choisi, borne_min, borne_max)
+        if not avions_filtres:
             st.warning("Aucun avion de ce type ne supporte le vent détecté.")
             st.stop()
 
-        avions_filtres['affichage'] = avions_filtres.apply(
-            lambda row: f"{row['nom']} (vent max: {row['vitesse_vent_admissible']} km/h)", axis=1
-        )
-        nom_affichage = st.selectbox("Modèle d’avion :", avions_filtres['affichage'].values)
-        nom_avion = nom_affichage.split(" (")[0]
-        avion = avions_filtres[avions_filtres['nom'] == nom_avion].iloc[0]
+        avion = st.selectbox(
+            "Modèle d’avion :", avions_filtres,
+            format_func=lambda fiche: f"{fiche.nom} (vent max: {fiche.vitesse_vent_admissible} km/h)")
 
     # Récupération des caractéristiques de l'avion
-    vitesse_admi = avion['vitesse_vent_admissible']
-    vitesse_avion = avion['vitesse_de_avion']
+    nom_avion = avion.nom
+    vitesse_admi = avion.vitesse_vent_admissible
+    vitesse_avion = avion.vitesse_de_avion
     st.success(f"Avion sélectionné : {nom_avion} (Vent max admissible : {vitesse_admi} km/h)")
 
     # --- Bouton : Calcul d’itinéraire dévié avec météo réelle ---
     if st.button("Lancer le calcul de l’itinéraire avec déviation"):
         st.subheader("Calcul de l’itinéraire déviée")
-        with st.spinner("Déviation en cours (le calcul peut prendre quelques minutes)..."):
-            itin_devie, meteo_devie, vent_max_devie = navigation_manager.tracer_chemin(
-                depart, arrivee, seuil=vitesse_admi,
-                verifier_meteo_callback=lambda coords, seuil: meteo_manager.verifier_conditions_meteo(coords, seuil)
-            )
-            itin_devie_lisse = trajectoire_manager.trajectoire_lisse_avec_controles(itin_devie)
-
-        st.success(f"Itinéraire dévié terminé | Vent max détecté : {vent_max_devie:.1f} km/h")
+        st.button("⏹ Arrêter le calcul", key="arreter_devie")
+        suivi, effacer_suivi = suivre_calcul(depart, arrivee, float(vitesse_admi))
+        # Les observations de la référence ne sont réutilisées que si la météo n'a pas pu changer
+        instant = instant_meteo()
+        observations = (st.session_state.observations
+                        if st.session_state.instant_observations == instant else None)
+        itin_devie_lisse, meteo_devie, vent_max_devie, statistiques_devie = calculer_itineraire(
+            depart, arrivee, float(vitesse_admi), navigation_manager.rayon_max_km, instant,
+            "Itinéraire dévié", par_risque=verification_rapide, observations=observations, suivi=suivi)
+        effacer_suivi()
+        st.session_state.statistiques["Itinéraire dévié"] = statistiques_devie
+
+        # Vent max sur les points interrogés uniquement. En vérification rapide, les points non
+        # interrogés n'y figurent pas (ni sur la carte) : sur l'itinéraire retenu, la valeur est un
+        # minorant de celle du mode séquentiel
+        precision = " (points interrogés uniquement)" if verification_rapide else ""
+        st.success(f"Itinéraire dévié terminé | Vent max détecté : {vent_max_devie:.1f} km/h{precision}")
+        compteurs = statistiques_devie.compteurs
+        st.caption(f"Observations de l’itinéraire de référence réutilisées : "
+                   f"{compteurs.get('meteo.observations_reutilisees', 0)} points ; "
+                   f"{compteurs.get('meteo.segments_rejuges', 0)} segments rejugés sans requête.")
 
         # Visualisation de la carte contenant les deux itinéraires
         st.info("Le trajet **bleu** correspond à l’itinéraire **de référence**, \n"
                  "et le trajet **violet** correspond à l’itinéraire **dévié**.")
 
         st.subheader("Visualisation")
-        carte_html = visualisation_manager.afficher_double_itineraire(
-            itin_droit_lisse, itin_devie_lisse, meteo_devie, seuil=vitesse_admi
+        statistiques_carte = StatistiquesRoute("Carte")
+        carte = visualisation_manager.afficher_double_itineraire(
+            itin_droit_lisse, itin_devie_lisse, meteo_devie, seuil=vitesse_admi, statistiques=statistiques_carte
         )
-        carte_path = cartes_dir / "carte_resultat.html"
-        os.makedirs(os.path.dirname(carte_path), exist_ok=True)
-        carte_html.save(str(carte_path))
-
-        with open(carte_path, "r", encoding="utf-8") as f:
-            html_map = f.read()
-        html(html_map, height=600)
+        supprimes = statistiques_carte.compteurs.get("visualisation.points_supprimes", 0)
+        traces = statistiques_carte.compteurs.get("visualisation.points_traces", 0)
+        st.caption(f"Tracés simplifiés : {supprimes} points retirés sur {supprimes + traces}.")
+        html(visualisation_manager.generer_html(carte, statistiques_carte), height=600)
+        statistiques_carte.exporter()
+        st.session_state.statistiques["Carte"] = statistiques_carte
+        afficher_statistiques()
 
         # Résumé synthétique de la simulation
         st.subheader("Résumé de la simulation")
@@ -0,0 +1,44 @@
+"""
+Tests du routage de NavigationManager (météo synthétique, hors ligne).
+
+Usage (depuis le dossier ``Itineraire-aérien-package``) :
+
+    python -m pytest tests
+"""
+from pathlib import Path
+
+import pytest
+
+from ItineraireAerien.Meteo import FournisseurSynthetique, MeteoManager
+from ItineraireAerien.Visualisation import NavigationManager
+
+WAYPOINT_CSV = Path(__file__).resolve().parent.parent / "Data" / "Waypoints.csv"
+NEW_YORK, CHARLOTTE = (40.6943, -73.9249), (35.2083, -80.8303)
+
+
+@pytest.fixture(scope="module")
+def navigation():
+    return NavigationManager(str(WAYPOINT_CSV))
+
+
+def meteo_calme(coordonnees, seuil):
+    # Vent nul partout : tous les segments sont acceptés, même avec un seuil nul
+    return True, coordonnees, [(lat, lon, 0.0) for lat, lon in coordonnees], 0.0
+
+
+@pytest.mark.parametrize("mode", ["glouton", "astar", "astar_meteo"])
+def test_seuil_nul_vent_synthetique(navigation, mode):
+    meteo = MeteoManager(fournisseur=FournisseurSynthetique(graine=0))
+    segments, points_meteo, vent_max = navigation.tracer_chemin(
+        NEW_YORK, CHARLOTTE, 0,
+        lambda coordonnees, seuil: meteo.verifier_conditions_meteo(coordonnees, seuil, pause=0), mode=mode)
+    assert segments[-1][-1] == CHARLOTTE
+    assert vent_max > 0
+
+
+@pytest.mark.parametrize("mode", ["glouton", "astar", "astar_meteo"])
+def test_seuil_nul_sans_vent(navigation, mode):
+    segments, points_meteo, vent_max = navigation.tracer_chemin(NEW_YORK, CHARLOTTE, 0, meteo_calme, mode=mode)
+    dernier_waypoint = segments[-2][-1]
+    assert navigation.distance(dernier_waypoint, CHARLOTTE) <= 75
+    assert vent_max == 0